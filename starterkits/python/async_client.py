@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import zmq
+import zmq.asyncio
+
+log = logging.getLogger("stacking")
+
+class Latest:
+    # Keeps only the newest world of each message type. A world that is
+    # replaced before the planner took it is dropped and counted as skipped.
+    def __init__(self):
+        self.worlds = {}
+        self.ready = asyncio.Event()
+        self.skipped = 0
+
+    def put(self, kind, data):
+        if kind in self.worlds:
+            self.skipped += 1
+        self.worlds[kind] = data
+        self.ready.set()
+
+    async def get(self):
+        while not self.worlds:
+            self.ready.clear()
+            await self.ready.wait()
+        kind = next(iter(self.worlds))
+        return self.worlds.pop(kind)
+
+async def receive(socket, client, latest):
+    while True:
+        msg = await socket.recv_multipart()
+        client.interval.tick()
+        log.debug("recv")
+        latest.put(msg[1], msg[2])
+        client.timer.skipped = latest.skipped
+
+async def plan(client, latest, outbox, executor):
+    # Planning runs in a single worker thread, so the receiver keeps reading
+    # the socket meanwhile and the planner state (e.g. the hotstorage yard
+    # model) stays in this process. Sending is left to the sender task, so
+    # the "send" stage is not timed in this mode.
+    loop = asyncio.get_running_loop()
+    while True:
+        world_data = await latest.get()
+        client.timer.lap("recv")
+        (plan, msg) = await loop.run_in_executor(executor, plan_and_serialize, client, world_data)
+        await outbox.put(msg)
+        client.end_tick(plan)
+
+def plan_and_serialize(client, world_data):
+    plan = client.plan(world_data)
+    return (plan, client.serialize(plan))
+
+async def send(socket, outbox):
+    while True:
+        msg = await outbox.get()
+        if msg:
+            log.debug("send")
+        await socket.send_multipart([b"", b"crane", msg])
+
+async def run(client, args):
+    context = zmq.asyncio.Context()
+    socket = context.socket(zmq.DEALER)
+    socket.setsockopt_string(zmq.IDENTITY, args.id)
+    socket.connect(args.addr)
+    log.info("Connected socket")
+
+    latest = Latest()
+    outbox = asyncio.Queue()
+    with ThreadPoolExecutor(1) as executor:
+        await asyncio.gather(
+            receive(socket, client, latest),
+            plan(client, latest, outbox, executor),
+            send(socket, outbox))
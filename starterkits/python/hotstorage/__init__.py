@@ -1,14 +1,42 @@
+import logging
 from hotstorage.hotstorage_model_pb2 import World
 from hotstorage import heuristic, search
+from hotstorage.columns import YardColumns
+from hotstorage.model import YardModel
+from hotstorage.rollout import RolloutPlanner
+from pbview import message_view
 
-def plan_moves(world_data, use_heuristic):
-    world = World()
+# The planners never read these fields, they are left unparsed.
+WorldView = message_view(World, ("KPIs", "ObservationData", "InvalidMoves"))
+
+# The yard model is kept between calls so that each world update only
+# patches the stacks that changed.
+model = YardModel()
+
+log = logging.getLogger(__name__)
+
+def plan_moves(world_data, use_heuristic, deadline_ms=None, engine="dfs", timer=None):
+    # `timer` is an optional telemetry.TickTimer that gets a lap for each stage.
+    # `engine` is a search engine for search.crane_schedule or a
+    # rollout.RolloutPlanner.
+    world = WorldView()
     world.ParseFromString(world_data)
+    columns = YardColumns.from_world(world)
+    if timer is not None:
+        timer.lap("parse")
     if use_heuristic:
-        crane_schedule = heuristic.crane_schedule(world)
+        crane_schedule = heuristic.crane_schedule(world, columns)
+    elif isinstance(engine, RolloutPlanner):
+        crane_schedule = engine.crane_schedule(world_data, columns, deadline_ms)
+        log.debug("rollout expected %s %s", engine.objective, engine.expected)
     else:
-        crane_schedule = search.crane_schedule(world)
-    print(world, use_heuristic, crane_schedule)
+        stats = search.SearchStats()
+        crane_schedule = search.crane_schedule(world, deadline_ms=deadline_ms, stats=stats, engine=engine, model=model, timer=timer, columns=columns)
+        log.debug("search %s patched_stacks=%d rebuilds=%d warm_starts=%d", stats, model.patched, model.rebuilds, model.warm_starts)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("world %s heuristic=%s schedule %s", world, use_heuristic, crane_schedule)
     if crane_schedule:
         crane_schedule.SequenceNr = world.Crane.Schedule.SequenceNr + 1
+    if timer is not None:
+        timer.lap("plan")
     return crane_schedule
\ No newline at end of file
@@ -0,0 +1,391 @@
+import numpy as np
+from hotstorage import heuristic
+from hotstorage.hotstorage_model_pb2 import World, Performance
+from hotstorage.simulation import seconds, UPDATE_INTERVAL, POLICY_TIME
+
+# Source of the moves of episodes that wait and target of deliveries in the
+# batched moves, like in rollout.
+WAIT = -1
+HANDOVER = -1
+
+# Per episode KPIs of BatchSimulation.run, the fields of Performance.
+KPIS = tuple(field.name for field in Performance.DESCRIPTOR.fields)
+
+def lognormal(rng, mean, std, size):
+    if std == 0:
+        return np.full(size, mean)
+    sigma2 = np.log1p((std / mean) ** 2)
+    return rng.lognormal(np.log(mean) - sigma2 / 2, np.sqrt(sigma2), size)
+
+def triangular(rng, low, high, size):
+    if low >= high:
+        return np.full(size, low)
+    return rng.triangular(low, (low + high) / 2, high, size)
+
+class BatchSimulation:
+    # `episodes` runs of the hotstorage simulation of one settings file,
+    # stepped together in the world update interval of the simulation. The
+    # yards are stacked numpy arrays of shape (episodes, stacks, stride):
+    # stack 0 is the production stack and stack i buffer i, slot 0 is the
+    # bottom. `due` and `ready` hold the due date and the time a block is
+    # ready in seconds since the start, inf for free slots, and `release`
+    # the release. Every update the policy gets the whole batch and returns
+    # a source and a target stack per episode (WAIT and HANDOVER as above),
+    # only episodes with an `idle` crane carry out their move.
+    #
+    # Within an update the events of each episode are exact: arrivals,
+    # production halts and restarts, pickups and dropoffs. Everything that
+    # only depends on time (ready blocks, overdue blocks, the clearing of
+    # the handover) is evaluated when it is needed. Unlike
+    # simulation.HotstorageSimulation a schedule is one move and there are
+    # no World messages, the KPIs agree in distribution.
+    def __init__(self, settings, episodes, seed=None):
+        self.episodes = episodes
+        self.buffer_count = settings.BufferCount
+        self.max_height = settings.BufferMaxHeight
+        self.max_heights = np.array([settings.ProductionMaxHeight] + [settings.BufferMaxHeight] * settings.BufferCount)
+        self.duration = seconds(settings.SimulationDuration)
+        self.check_interval = seconds(settings.CheckInterval)
+        self.clear_time = (seconds(settings.MinClearTime), seconds(settings.MaxClearTime))
+        crane = (seconds(settings.CraneMoveTimeMean), seconds(settings.CraneMoveTimeStd))
+        self.crane_time = (crane[0] - crane[1], crane[0] + crane[1])
+        hoist = (seconds(settings.HoistMoveTimeMean), seconds(settings.HoistMoveTimeStd))
+        self.hoist_time = (hoist[0] - hoist[1], hoist[0] + hoist[1])
+        self.due_time = (seconds(settings.DueTimeMean), seconds(settings.DueTimeStd))
+        self.due_time_min = seconds(settings.DueTimeMin)
+        self.ready_factor = (settings.ReadyFactorMin, settings.ReadyFactorMax)
+        self.arrival_time = (seconds(settings.ArrivalTimeMean), seconds(settings.ArrivalTimeStd))
+        self.handover_time = (seconds(settings.HandoverTimeMean), seconds(settings.HandoverTimeStd))
+        self.rng = np.random.default_rng(settings.Seed if seed is None else seed)
+
+        n = episodes
+        shape = (n, settings.BufferCount + 1, int(self.max_heights.max()))
+        self.now = 0.0
+        self.end = self.duration
+        self.due = np.full(shape, np.inf)
+        self.ready = np.full(shape, np.inf)
+        self.release = np.zeros(shape)
+        self.heights = np.zeros(shape[:2], np.int64)
+        self.idle = np.ones(n, np.bool_)
+        # upstream
+        self.running = np.ones(n, np.bool_)
+        self.next_arrival = np.full(n, np.inf)
+        self.halted_at = np.full(n, np.inf)
+        # crane, its move under way and the block it carries
+        self.location = np.zeros(n, np.int64)
+        self.girder = np.zeros(n)
+        self.hoist = np.ones(n)
+        self.free_at = np.zeros(n)
+        self.pickup_at = np.full(n, np.inf)
+        self.drop_at = np.full(n, np.inf)
+        self.move_src = np.zeros(n, np.int64)
+        self.move_tgt = np.zeros(n, np.int64)
+        self.load_due = np.full(n, np.inf)
+        self.load_ready = np.full(n, np.inf)
+        self.load_release = np.zeros(n)
+        # time the handover is empty and ready again, a block dropped there
+        # that is not delivered before the end
+        self.handover_at = np.zeros(n)
+        self.pending_due = np.full(n, np.inf)
+        # KPI accumulators
+        self.created = np.zeros(n, np.int64)
+        self.manipulations = np.zeros(n, np.int64)
+        self.delivered = np.zeros(n, np.int64)
+        self.invalid = np.zeros(n, np.int64)
+        self.on_time = np.zeros(n, np.int64)
+        self.overdue = np.zeros(n, np.int64)
+        self.tardiness = np.zeros(n)
+        self.tardy_count = np.zeros(n, np.int64)
+        self.lead_time = np.zeros(n)
+        self.blocked = np.zeros(n)
+        self.crane_busy = np.zeros(n)
+        self.handover_busy = np.zeros(n)
+        self.fill = np.zeros(n, np.int64)
+        self.fill_area = np.zeros(n)
+        self.fill_since = np.zeros(n)
+        self.initialize(settings.InitialNumberOfBlocks)
+
+    def initialize(self, count):
+        # InitializeWorldState for all episodes at once
+        rng = self.rng
+        n = self.episodes
+        rows = np.arange(n)
+        past = np.zeros(n)
+        for _ in range(min(count, self.buffer_count * self.max_height)):
+            past -= lognormal(rng, *self.arrival_time, n)
+            due = past + lognormal(rng, *self.due_time, n)
+            while True:
+                early = np.flatnonzero(due < self.due_time_min)
+                if len(early) == 0:
+                    break
+                due[early] += lognormal(rng, *self.due_time, len(early))
+            factor = rng.uniform(*self.ready_factor, n)
+            ready = np.where(past + factor * (due - past) < 0, 0.0, np.maximum(past + rng.uniform(*self.ready_factor, n) * (due - past), 0.0))
+            room = self.heights[:, 1:] < self.max_height
+            stack = np.where(room, rng.random(room.shape), -1.0).argmax(axis=1) + 1
+            self.insert(rows, stack, due, ready, past.copy())
+        self.fill[:] = self.heights[:, 1:].sum(axis=1)
+        due = lognormal(rng, *self.due_time, n)
+        self.insert(rows, np.zeros(n, np.int64), due, rng.uniform(*self.ready_factor, n) * due, np.zeros(n))
+        self.created[:] = self.heights.sum(axis=1)
+        self.next_arrival = lognormal(rng, *self.arrival_time, n)
+
+    def insert(self, rows, stack, due, ready, release):
+        # puts blocks at the bottom of a stack of the given episodes
+        for values in ((self.due, due), (self.ready, ready), (self.release, release)):
+            (array, value) = values
+            array[rows, stack, 1:] = array[rows, stack, :-1]
+            array[rows, stack, 0] = value
+        self.heights[rows, stack] += 1
+
+    def run(self, policy=None, duration=None):
+        # Runs all episodes for `duration` seconds, by default the
+        # SimulationDuration of the settings, and returns the KPIs as a dict
+        # of arrays with one value per episode. `policy` defaults to
+        # heuristic_moves.
+        policy = heuristic_moves if policy is None else policy
+        self.end = self.duration if duration is None else duration
+        t = 0.0
+        while t < self.end:
+            self.advance(t)
+            self.now = t
+            self.idle = self.free_at <= t
+            (src, tgt) = policy(self)
+            self.start_moves(np.asarray(src), np.asarray(tgt), t + POLICY_TIME)
+            t += UPDATE_INTERVAL
+        self.advance(np.nextafter(self.end, -np.inf))
+        self.now = self.end
+        return self.finish()
+
+    def advance(self, limit):
+        # Processes the events of every episode up to `limit` in order, one
+        # event per episode and pass.
+        while True:
+            arrival = np.where(self.running, self.next_arrival, np.inf)
+            times = np.stack((arrival, self.pickup_at, self.drop_at))
+            kind = times.argmin(axis=0)
+            at = times.min(axis=0)
+            due = at <= limit
+            if not due.any():
+                return
+            for (k, handle) in enumerate((self.arrive, self.pickup, self.drop)):
+                rows = np.flatnonzero(due & (kind == k))
+                if len(rows) > 0:
+                    handle(rows, at[rows])
+
+    def arrive(self, rows, at):
+        # a new block at the bottom of the production stack, or a halt of
+        # the upstream process if it is full
+        full = self.heights[rows, 0] >= self.max_heights[0]
+        self.running[rows[full]] = False
+        self.halted_at[rows[full]] = at[full]
+        (rows, at) = (rows[~full], at[~full])
+        due = at + lognormal(self.rng, *self.due_time, len(rows))
+        ready = at + self.rng.uniform(*self.ready_factor, len(rows)) * (due - at)
+        self.insert(rows, np.zeros(len(rows), np.int64), due, ready, at)
+        self.created[rows] += 1
+        self.next_arrival[rows] = at + lognormal(self.rng, *self.arrival_time, len(rows))
+
+    def pickup(self, rows, at):
+        src = self.move_src[rows]
+        level = self.heights[rows, src] - 1
+        self.load_due[rows] = self.due[rows, src, level]
+        self.load_ready[rows] = self.ready[rows, src, level]
+        self.load_release[rows] = self.release[rows, src, level]
+        self.due[rows, src, level] = np.inf
+        self.ready[rows, src, level] = np.inf
+        self.heights[rows, src] -= 1
+        self.manipulations[rows] += 1
+        self.pickup_at[rows] = np.inf
+        buffer = src > 0
+        self.update_fill(rows[buffer], at[buffer], -1)
+        # taking a block from the production stack restarts upstream
+        restart = ~buffer & ~self.running[rows]
+        (restarted, at) = (rows[restart], at[restart])
+        self.blocked[restarted] += at - self.halted_at[restarted]
+        self.halted_at[restarted] = np.inf
+        self.running[restarted] = True
+        self.next_arrival[restarted] = at + lognormal(self.rng, *self.arrival_time, len(restarted))
+
+    def drop(self, rows, at):
+        tgt = self.move_tgt[rows]
+        self.drop_at[rows] = np.inf
+        buffer = tgt != HANDOVER
+        (placed, to) = (rows[buffer], tgt[buffer])
+        level = self.heights[placed, to]
+        self.due[placed, to, level] = self.load_due[placed]
+        self.ready[placed, to, level] = self.load_ready[placed]
+        self.release[placed, to, level] = self.load_release[placed]
+        self.heights[placed, to] += 1
+        self.update_fill(placed, at[buffer], 1)
+        self.deliver(rows[~buffer], at[~buffer])
+        self.load_due[rows] = np.inf
+
+    def deliver(self, rows, at):
+        # OrderCompletion: the block leaves once it is ready, looked at every
+        # CheckInterval, then the handover clears and gets ready again
+        due = self.load_due[rows]
+        wait = np.maximum(self.load_ready[rows] - at, 0.0)
+        if self.check_interval > 0:
+            wait = np.ceil(wait / self.check_interval) * self.check_interval
+        delivered_at = at + wait
+        done = delivered_at < self.end
+        self.pending_due[rows[~done]] = due[~done]
+        self.handover_at[rows[~done]] = np.inf
+        (rows, due, delivered_at, at) = (rows[done], due[done], delivered_at[done], at[done])
+        on_time = due >= delivered_at
+        self.on_time[rows] += on_time
+        self.overdue[rows] += delivered_at > due + self.check_interval
+        self.tardiness[rows] += np.where(on_time, 0.0, delivered_at - due)
+        self.tardy_count[rows] += 1
+        self.lead_time[rows] += delivered_at - self.load_release[rows]
+        self.delivered[rows] += 1
+        ready_at = delivered_at + triangular(self.rng, *self.clear_time, len(rows)) + lognormal(self.rng, *self.handover_time, len(rows))
+        self.handover_at[rows] = ready_at
+        self.handover_busy[rows] += np.minimum(ready_at, self.end) - at
+
+    def update_fill(self, rows, at, change):
+        self.fill_area[rows] += self.fill[rows] * (at - self.fill_since[rows])
+        self.fill_since[rows] = at
+        self.fill[rows] += change
+
+    def start_moves(self, src, tgt, start):
+        # CheckMoveCondition for the moves of the idle episodes, then the
+        # times of the pickup, the dropoff and the end of each valid move
+        rows = np.flatnonzero(self.idle & (src != WAIT))
+        (src, tgt) = (src[rows], tgt[rows])
+        n = len(self.max_heights)
+        valid = (src >= 0) & (src < n) & (tgt != 0) & (tgt < n) & (tgt >= HANDOVER)
+        (src, tgt) = (np.where(valid, src, 0), np.where(valid, tgt, 1))
+        heights = self.heights[rows, src]
+        valid &= heights > 0
+        to_buffer = tgt != HANDOVER
+        valid &= ~to_buffer | (self.heights[rows, tgt] < self.max_height)
+        top_ready = self.ready[rows, src, np.maximum(heights - 1, 0)] <= start
+        valid &= to_buffer | ((self.handover_at[rows] <= start) & top_ready)
+        self.invalid[rows[~valid]] += 1
+        (rows, src, tgt, heights, to_buffer) = (rows[valid], src[valid], tgt[valid], heights[valid], to_buffer[valid])
+        if len(rows) == 0:
+            return
+
+        k = len(rows)
+        span = self.buffer_count + 1
+        top = self.max_height + 1
+        src_girder = src / span
+        tgt_id = np.where(to_buffer, tgt, self.buffer_count + 1)
+        tgt_height = np.where(to_buffer, self.heights[rows, np.where(to_buffer, tgt, 0)] - (src == tgt), 0)
+        pickup_level = (heights - 1) / top
+        drop_level = tgt_height / top
+        crane = lambda: triangular(self.rng, *self.crane_time, k)
+        hoist = lambda: triangular(self.rng, *self.hoist_time, k)
+        pickup = start + crane() * np.abs(src_girder - self.girder[rows]) + hoist() * np.abs(pickup_level - self.hoist[rows])
+        drop = pickup + hoist() * (1.0 - pickup_level) + crane() * np.abs(tgt_id / span - src_girder) + hoist() * (1.0 - drop_level)
+        end = drop + hoist() * (1.0 - drop_level)
+        self.pickup_at[rows] = pickup
+        self.drop_at[rows] = drop
+        self.free_at[rows] = end
+        self.crane_busy[rows] += np.minimum(end, self.end) - start
+        self.move_src[rows] = src
+        self.move_tgt[rows] = tgt
+        self.location[rows] = tgt_id
+        self.girder[rows] = tgt_id / span
+        self.hoist[rows] = 1.0
+
+    def finish(self):
+        # KPIs at the end: the blocks left in the yard, on the crane and on
+        # the handover count towards the tardiness if they are overdue
+        end = self.end
+        left = np.concatenate((self.due.reshape(self.episodes, -1), self.load_due[:, None], self.pending_due[:, None]), axis=1)
+        late = left < end
+        self.tardiness += np.where(late, end - left, 0.0).sum(axis=1)
+        self.tardy_count += late.sum(axis=1)
+        self.overdue += (left + self.check_interval < end).sum(axis=1)
+        halted = ~self.running
+        self.blocked[halted] += end - self.halted_at[halted]
+        self.update_fill(np.arange(self.episodes), np.full(self.episodes, end), 0)
+        served = self.on_time + self.overdue
+        kpis = {
+            "CraneManipulations": self.manipulations,
+            "ServiceLevelMean": np.divide(self.on_time, served, out=np.zeros(self.episodes), where=served > 0),
+            "LeadTimeMean": np.divide(self.lead_time, self.delivered, out=np.zeros(self.episodes), where=self.delivered > 0),
+            "DeliveredBlocks": self.delivered,
+            "TotalBlocksOnTime": self.created - self.overdue,
+            "BlockedArrivalTime": self.blocked,
+            "TardinessMean": np.divide(self.tardiness, self.tardy_count, out=np.zeros(self.episodes), where=self.tardy_count > 0),
+            "BufferUtilizationMean": self.fill_area / (end * self.buffer_count * self.max_height),
+            "CraneUtilizationMean": self.crane_busy / end,
+            "HandoverUtilizationMean": self.handover_busy / end,
+            "UpstreamUtilizationMean": 1.0 - self.blocked / end,
+        }
+        return kpis
+
+    def world(self, i):
+        # World of episode i at the current update, without KPIs and
+        # observations, to look at it or to compare with the message planners
+        world = World()
+        world.Now.MilliSeconds = round(self.now * 1000)
+        for s in range(len(self.max_heights)):
+            stack = world.Production if s == 0 else world.Buffers.add()
+            stack.Id = s
+            stack.MaxHeight = int(self.max_heights[s])
+            for level in range(self.heights[i, s]):
+                block = stack.BottomToTop.add()
+                block.Id = s * self.due.shape[2] + level + 1
+                block.Release.MilliSeconds = round(self.release[i, s, level] * 1000)
+                block.Due.MilliSeconds = round(self.due[i, s, level] * 1000)
+                block.Ready = bool(self.ready[i, s, level] <= self.now)
+        world.Handover.Id = self.buffer_count + 1
+        world.Handover.Ready = bool(self.handover_at[i] <= self.now)
+        world.Crane.LocationId = int(self.location[i])
+        return world
+
+def heuristic_moves(batch):
+    # heuristic.score_moves for every episode of a BatchSimulation at once,
+    # with the same weights, returns the best move of each.
+    (count, n, stride) = batch.due.shape
+    r = np.arange(count)[:, None]
+    s = np.arange(n)[None, :]
+    due = batch.due
+    occupied = np.isfinite(due)
+    ready = occupied & (batch.ready <= batch.now)
+    slack = np.maximum(due - batch.now, 0.0)
+    press = np.where(occupied, np.where(ready, 1.0, 0.5) / (1.0 + slack / heuristic.SLACK_SCALE), 0.0)
+    earliest = np.minimum.accumulate(due, axis=2)
+    blocked = occupied & (earliest < due)
+    heights = batch.heights
+    has = heights > 0
+    levels = np.maximum(heights - 1, 0)
+    top_due = np.where(has, due[r, s, levels], np.inf)
+    top_blocking = has & blocked[r, s, levels]
+    below = np.where(np.arange(stride)[None, None, :] < levels[:, :, None], press, 0.0).max(axis=2)
+    pressing = press.max(axis=2)
+    stack_due = np.where(has, earliest[r, s, levels], np.inf)
+
+    gain = np.where(top_blocking, heuristic.UNBLOCK * below + heuristic.BLOCKED * blocked.sum(axis=2), -heuristic.IDLE)
+    gain[:, 0] = heuristic.PRODUCTION * heights[:, 0] / max(batch.max_heights[0], 1)
+    fill = heights / np.maximum(batch.max_heights, 1)
+    cost = (heuristic.BURY * pressing[:, None, :] * (stack_due[:, None, :] < top_due[:, :, None])
+        + heuristic.HEIGHT * fill[:, None, :])
+    scores = np.full((count, n, n + 1), -np.inf)
+    moves = gain[:, :, None] - cost
+    invalid = ~has[:, :, None] | (heights >= batch.max_heights)[:, None, :]
+    invalid[:, :, 0] = True
+    invalid[:, s[0], s[0]] = True
+    moves[invalid] = -np.inf
+    scores[:, :, :n] = moves
+    deliverable = (batch.handover_at <= batch.now)[:, None] & has & ready[r, s, levels]
+    scores[:, :, n] = np.where(deliverable, heuristic.DELIVER * (1.0 + press[r, s, levels]), -np.inf)
+
+    flat = scores.reshape(count, -1)
+    best = flat.argmax(axis=1)
+    (src, tgt) = np.divmod(best, n + 1)
+    # like heuristic.crane_schedule, episodes without a move worth making wait
+    src = np.where(flat[np.arange(count), best] > 0, src, WAIT)
+    return (src, np.where(tgt == n, HANDOVER, tgt))
+
+def performance(kpis, i):
+    # the KPIs of episode i as Performance message
+    message = Performance()
+    for name in KPIS:
+        setattr(message, name, kpis[name][i].item())
+    return message
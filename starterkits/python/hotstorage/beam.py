@@ -0,0 +1,147 @@
+import time
+import numpy as np
+from hotstorage.search import Move, EMPTY
+
+# Priority of free slots in the batched arrays, above every block so that
+# minimums ignore them.
+FREE = np.iinfo(np.int32).max
+HANDOVER = -1
+
+def block_masks(prios):
+    # Occupied slots and blocked blocks (above a more urgent one) of a batch
+    # of yards of shape (states, stacks, stride).
+    occupied = prios != FREE
+    blocked = occupied & (np.minimum.accumulate(prios, axis=2) < prios)
+    return (occupied, blocked)
+
+def lower_bound_score(prios, heights, layout):
+    # Minus the lower bound of BrpState: remaining plus blocked blocks.
+    (occupied, blocked) = block_masks(prios)
+    return -(occupied.sum(axis=(1, 2)) + blocked.sum(axis=(1, 2))).astype(np.float64)
+
+def urgency_score(prios, heights, layout):
+    # Like lower_bound_score, but a blocked block costs up to twice as much
+    # the closer its priority is to the most urgent block of its yard.
+    (occupied, blocked) = block_masks(prios)
+    first = prios.min(axis=(1, 2))[:, None, None].astype(np.float64)
+    weights = 1.0 + 1.0 / (1.0 + prios - first)
+    return -(occupied.sum(axis=(1, 2)) + (weights * blocked).sum(axis=(1, 2)))
+
+SCORES = {
+    "bound": lower_bound_score,
+    "urgency": urgency_score,
+}
+
+def expand(prios, heights, max_heights):
+    # The forced moves of BrpState for a whole batch at once: the top of the
+    # stack with the most urgent block goes to the handover if it is that
+    # block, otherwise to every other buffer with room. The production stack
+    # is no target, the simulation rejects such moves.
+    # Returns the parent index, source, target and moved priority of every
+    # child and the children themselves.
+    rows = np.arange(len(prios))
+    stack_min = prios.min(axis=2)
+    src = stack_min.argmin(axis=1)
+    urgent = stack_min[rows, src]
+    live = urgent != FREE
+    top = prios[rows, src, np.maximum(heights[rows, src] - 1, 0)]
+    deliver = live & (top == urgent)
+    room = heights < max_heights
+    room[rows, src] = False
+    # nothing can be put on the production stack
+    room[:, 0] = False
+    (relocated, targets) = np.nonzero((live & ~deliver)[:, None] & room)
+    delivered = np.flatnonzero(deliver)
+    parent = np.concatenate((delivered, relocated))
+    tgt = np.concatenate((np.full(len(delivered), HANDOVER), targets))
+    src = src[parent]
+    moved = top[parent]
+
+    children = prios[parent]
+    child_heights = heights[parent]
+    k = np.arange(len(parent))
+    child_heights[k, src] -= 1
+    children[k, src, child_heights[k, src]] = FREE
+    k = k[tgt != HANDOVER]
+    to = tgt[k]
+    children[k, to, child_heights[k, to]] = moved[k]
+    child_heights[k, to] += 1
+    return (parent, src, tgt, moved, children, child_heights)
+
+class BeamSearch:
+    # Beam search over the forced moves of BrpState. Every layer expands all
+    # states of the beam at once on batched numpy arrays, scores the children
+    # with `score` (a name in SCORES or a function of the batched priorities,
+    # heights and the layout, higher is better) and keeps the `width` best
+    # distinct ones. It stops at the first layer that empties the yard, or
+    # after `depth` layers with the moves to the best state of the beam.
+    #
+    # An instance can be used as `engine` of search.crane_schedule.
+    def __init__(self, width=16, depth=100, score="bound"):
+        self.width = width
+        self.depth = depth
+        self.score = SCORES[score] if isinstance(score, str) else score
+
+    def __call__(self, initial, budget=None, table=None, deadline=None, stats=None, incumbent=None):
+        # `table` is ignored, the beam drops duplicates of each layer itself.
+        # `budget` limits the number of generated states.
+        start = time.perf_counter()
+        layout = initial.layout
+        (count, stride) = (len(layout.stack_ids), layout.stride)
+        max_heights = np.array(layout.max_heights, np.int32)
+        prios = np.frombuffer(initial.prios, np.int32).reshape(1, count, stride).copy()
+        prios[prios == EMPTY] = FREE
+        heights = np.frombuffer(initial.heights, np.int32).reshape(1, count).copy()
+        # random weights that hash a yard to one number to find duplicates
+        keys = np.random.default_rng(0).integers(1, 2 ** 63, count * stride, dtype=np.uint64)
+
+        nodes = 0
+        timed_out = False
+        solved = None
+        layers = []
+        while len(layers) < self.depth and (budget is None or nodes < budget):
+            if deadline is not None and time.perf_counter() >= deadline:
+                timed_out = True
+                break
+            (parent, src, tgt, moved, children, child_heights) = expand(prios, heights, max_heights)
+            if len(parent) == 0:
+                break
+            nodes += len(parent)
+            done = np.flatnonzero(~(children != FREE).any(axis=(1, 2)))
+            if len(done) > 0:
+                layers.append((parent, src, tgt, moved))
+                solved = done[0]
+                break
+            # distinct children, best first, ties in expansion order
+            hashes = (children.reshape(len(children), -1).astype(np.uint64) * keys).sum(axis=1)
+            (_, first) = np.unique(hashes, return_index=True)
+            scores = self.score(children[first], child_heights[first], layout)
+            keep = first[np.lexsort((first, -scores))[:self.width]]
+            layers.append((parent[keep], src[keep], tgt[keep], moved[keep]))
+            prios = children[keep]
+            heights = child_heights[keep]
+
+        moves = self.backtrack(layout, layers, 0 if solved is None else solved)
+        if stats is not None:
+            stats.nodes += nodes
+            stats.elapsed += time.perf_counter() - start
+            stats.timed_out = stats.timed_out or timed_out
+        if incumbent is not None and (solved is None or len(incumbent) < len(moves)) and solves(initial, incumbent):
+            return incumbent
+        return moves or None
+
+    def backtrack(self, layout, layers, index):
+        # moves to state `index` of the last layer
+        moves = []
+        for (parent, src, tgt, moved) in reversed(layers):
+            tgt_id = layout.handover_id if tgt[index] == HANDOVER else layout.stack_ids[tgt[index]]
+            moves.append(Move(layout.stack_ids[src[index]], tgt_id, layout.block_ids[int(moved[index])]))
+            index = parent[index]
+        moves.reverse()
+        return moves
+
+def solves(initial, moves):
+    state = initial
+    for move in moves:
+        state = state.apply_move(move)
+    return state.remaining == 0
@@ -0,0 +1,52 @@
+import numpy as np
+
+class YardColumns:
+    # The stacks of a world as flat numpy arrays. Stack 0 is the production
+    # stack, the others are the buffers in message order. The blocks of stack
+    # i are at offsets[i]:offsets[i + 1] of the block arrays, bottom to top
+    # in message order, so all blocks of the yard can be scored or compared
+    # at once without touching the protobuf objects again.
+    __slots__ = ("now", "stack_ids", "max_heights", "heights", "offsets",
+        "block_ids", "due", "release", "ready", "stack", "level",
+        "handover_id", "handover_ready", "handover_busy", "crane_load", "crane_due", "scheduled")
+
+    @staticmethod
+    def from_world(world):
+        stacks = [world.Production]
+        stacks.extend(world.Buffers)
+        blocks = [block for stack in stacks for block in stack.BottomToTop]
+        n = len(blocks)
+        columns = YardColumns()
+        columns.now = world.Now.MilliSeconds
+        columns.stack_ids = np.fromiter([stack.Id for stack in stacks], np.int32, len(stacks))
+        columns.max_heights = np.fromiter([stack.MaxHeight for stack in stacks], np.int32, len(stacks))
+        columns.heights = np.fromiter([len(stack.BottomToTop) for stack in stacks], np.int32, len(stacks))
+        columns.offsets = np.zeros(len(stacks) + 1, np.int32)
+        np.cumsum(columns.heights, out=columns.offsets[1:])
+        columns.block_ids = np.fromiter([block.Id for block in blocks], np.int32, n)
+        columns.due = np.fromiter([block.Due.MilliSeconds for block in blocks], np.int64, n)
+        columns.release = np.fromiter([block.Release.MilliSeconds for block in blocks], np.int64, n)
+        columns.ready = np.fromiter([block.Ready for block in blocks], np.bool_, n)
+        # stack index and height above the ground of every block
+        columns.stack = np.repeat(np.arange(len(stacks), dtype=np.int32), columns.heights)
+        columns.level = np.arange(n, dtype=np.int32) - columns.offsets[columns.stack]
+        columns.handover_id = world.Handover.Id
+        columns.handover_ready = world.Handover.Ready
+        columns.handover_busy = world.Handover.HasField("Block")
+        # id and due date of the block on the crane, -1 if it is empty
+        load = world.Crane.Load if world.Crane.HasField("Load") else None
+        columns.crane_load = load.Id if load is not None else -1
+        columns.crane_due = load.Due.MilliSeconds if load is not None else -1
+        columns.scheduled = len(world.Crane.Schedule.Moves)
+        return columns
+
+    def blocks(self, i):
+        return self.block_ids[self.offsets[i]:self.offsets[i + 1]]
+
+    def tops(self):
+        # index into the block arrays of the top block of every stack, -1
+        # for empty stacks
+        return np.where(self.heights > 0, self.offsets[1:] - 1, -1)
+
+    def free(self):
+        return self.max_heights - self.heights
@@ -0,0 +1,47 @@
+from bisect import bisect_left, insort
+import numpy as np
+
+class DueIndex:
+    # The blocks of the yard ordered by due date, ties by id. It is kept
+    # between world updates: arriving blocks are inserted and delivered ones
+    # removed instead of sorting all blocks again, and the rank of a block,
+    # i.e. the number of blocks due before it, is a binary search.
+    def __init__(self):
+        # sorted (due, id) pairs
+        self.keys = []
+        self.due = {}
+
+    @staticmethod
+    def from_columns(columns):
+        index = DueIndex()
+        ids = columns.block_ids.tolist()
+        dues = columns.due.tolist()
+        index.due = dict(zip(ids, dues))
+        index.keys = sorted(zip(dues, ids))
+        return index
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, id):
+        return id in self.due
+
+    def add(self, id, due):
+        if id in self.due:
+            return
+        self.due[id] = due
+        insort(self.keys, (due, id))
+
+    def remove(self, id):
+        due = self.due.pop(id)
+        del self.keys[bisect_left(self.keys, (due, id))]
+
+    def rank(self, id):
+        return bisect_left(self.keys, (self.due[id], id))
+
+    def ranks(self, ids):
+        return np.fromiter([self.rank(id) for id in ids], np.int32, len(ids))
+
+    def last_due(self):
+        # due date of the block that is due last, None if there is none
+        return self.keys[-1][0] if self.keys else None
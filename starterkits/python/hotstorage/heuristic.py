@@ -1,17 +1,113 @@
+import numpy as np
 from hotstorage.hotstorage_model_pb2 import World, CraneSchedule, CraneMove
+from hotstorage.columns import YardColumns
 
-def crane_schedule(world):
-    if len(world.Crane.Schedule.Moves) > 0:
+# Target index of moves to the handover in score_moves.
+HANDOVER = -1
+
+# Weights of the move scores, see score_moves.
+DELIVER = 100.0
+PRODUCTION = 10.0
+UNBLOCK = 5.0
+BLOCKED = 1.0
+IDLE = 20.0
+BURY = 10.0
+HEIGHT = 1.0
+# Slack in seconds at which a block is half as urgent as an overdue one.
+SLACK_SCALE = 60.0
+
+def crane_schedule(world, columns=None):
+    if columns is None:
+        columns = YardColumns.from_world(world)
+    if columns.scheduled > 0:
+        return None
+    (src, tgt, score) = score_moves(columns, 1)
+    # Every top that blocks nothing scores -IDLE, a yard without a move
+    # worth making is left alone. That includes the production stack: a put
+    # that scores below zero buries urgent blocks or fills the last free
+    # slots, and a yard filled that way can neither relocate nor take the
+    # next arrivals, which blocks the production longer than waiting.
+    if len(src) == 0 or score[0] <= 0:
         return None
     schedule = CraneSchedule()
-    if len(world.Production.BottomToTop) > 0:
-        block = world.Production.BottomToTop[-1]
-        for buf in world.Buffers:
-            if buf.MaxHeight > len(buf.BottomToTop):
-                mov = schedule.Moves.add()
-                mov.BlockId = block.Id
-                mov.SourceId = world.Production.Id
-                mov.TargetId = buf.Id
-                return schedule
-
-    return None
\ No newline at end of file
+    mov = schedule.Moves.add()
+    mov.BlockId = columns.block_ids[columns.tops()[src[0]]]
+    mov.SourceId = columns.stack_ids[src[0]]
+    mov.TargetId = columns.handover_id if tgt[0] == HANDOVER else columns.stack_ids[tgt[0]]
+    return schedule
+
+def urgency(columns):
+    # 1 for blocks that are overdue, falling towards 0 with growing slack.
+    # Blocks that are not ready yet count half.
+    slack = np.maximum(columns.due - columns.now, 0) / 1000.0
+    return np.where(columns.ready, 1.0, 0.5) / (1.0 + slack / SLACK_SCALE)
+
+def running_min(columns):
+    # Earliest due date at or below every block of its stack. Shifting each
+    # stack below all stacks before it lets one accumulate run over all
+    # stacks without carrying a minimum across their borders.
+    if len(columns.due) == 0:
+        return columns.due
+    shift = columns.stack * (int(columns.due.max() - columns.due.min()) + 1)
+    return np.minimum.accumulate(columns.due - shift) + shift
+
+def score_moves(columns, k=None):
+    # Scores every move of a top block to another stack or the handover at
+    # once and returns the k best as arrays of source stack index, target
+    # stack index (HANDOVER for the handover) and score, best first.
+    #
+    # Deliveries of ready top blocks score highest, the more urgent the
+    # better. Puts from the production stack get more pressing as it fills
+    # up. Relocations are worth the urgency of the blocks they free and the
+    # number of blocked blocks in their stack; moving a top block that does
+    # not block anything is penalized. Every target costs its height and,
+    # if the moved block is due after a block in the target, the urgency of
+    # the blocks it buries.
+    n = len(columns.stack_ids)
+    if len(columns.due) == 0:
+        return (np.zeros(0, np.int64), np.zeros(0, np.int64), np.zeros(0))
+    tops = columns.tops()
+    occupied = tops >= 0
+    press = urgency(columns)
+    earliest = running_min(columns)
+    blocked = earliest < columns.due
+    top_due = columns.due[tops]
+    top_blocking = occupied & blocked[tops]
+    blocked_count = np.bincount(columns.stack, weights=blocked, minlength=n)
+    # most urgent block below the top and most urgent block of each stack
+    is_top = np.zeros(len(columns.due), np.bool_)
+    is_top[tops[occupied]] = True
+    below = np.zeros(n)
+    np.maximum.at(below, columns.stack[~is_top], press[~is_top])
+    pressing = np.zeros(n)
+    np.maximum.at(pressing, columns.stack, press)
+    stack_due = np.where(occupied, earliest[tops], np.iinfo(np.int64).max)
+
+    gain = np.where(top_blocking, UNBLOCK * below + BLOCKED * blocked_count, -IDLE)
+    gain[0] = PRODUCTION * columns.heights[0] / max(columns.max_heights[0], 1)
+    cost = (BURY * pressing[None, :] * (stack_due[None, :] < top_due[:, None])
+        + HEIGHT * (columns.heights / np.maximum(columns.max_heights, 1))[None, :])
+    scores = np.full((n, n + 1), -np.inf)
+    scores[:, :n] = gain[:, None] - cost
+    invalid = ~occupied[:, None] | (columns.heights >= columns.max_heights)[None, :]
+    invalid[:, 0] = True
+    np.fill_diagonal(invalid, True)
+    scores[:, :n][invalid] = -np.inf
+    if columns.handover_ready and not columns.handover_busy:
+        deliverable = occupied & columns.ready[tops]
+        scores[deliverable, n] = DELIVER * (1.0 + press[tops[deliverable]])
+
+    flat = scores.ravel()
+    valid = np.flatnonzero(flat > -np.inf)
+    if k is not None and k < len(valid):
+        valid = valid[np.argpartition(-flat[valid], k - 1)[:k]]
+    best = valid[np.argsort(-flat[valid], kind="stable")]
+    (src, tgt) = np.divmod(best, n + 1)
+    return (src, np.where(tgt == n, HANDOVER, tgt), flat[best])
+
+def move_ranks(columns):
+    # Rank of every scored move by (source id, target id), 0 is the best.
+    # The search uses it to expand the best relocations first.
+    (src, tgt, _) = score_moves(columns)
+    ids = np.append(columns.stack_ids, columns.handover_id)
+    return dict(zip(zip(ids[src].tolist(), ids[tgt].tolist()), range(len(src))))
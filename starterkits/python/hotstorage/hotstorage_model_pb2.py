@@ -2,9 +2,9 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: hotstorage_model.proto
 """Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
@@ -13,688 +13,37 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='hotstorage_model.proto',
-  package='DynStacking.DataModel',
-  syntax='proto3',
-  serialized_options=None,
-  create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\x16hotstorage_model.proto\x12\x15\x44ynStacking.DataModel\"\x84\x01\n\x05\x42lock\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x31\n\x07Release\x18\x02 \x01(\x0b\x32 .DynStacking.DataModel.TimeStamp\x12-\n\x03\x44ue\x18\x03 \x01(\x0b\x32 .DynStacking.DataModel.TimeStamp\x12\r\n\x05Ready\x18\x04 \x01(\x08\"\xba\x01\n\x05\x43rane\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x12\n\nLocationId\x18\x02 \x01(\x05\x12*\n\x04Load\x18\x03 \x01(\x0b\x32\x1c.DynStacking.DataModel.Block\x12\x36\n\x08Schedule\x18\x04 \x01(\x0b\x32$.DynStacking.DataModel.CraneSchedule\x12\x16\n\x0eGirderPosition\x18\x05 \x01(\x01\x12\x15\n\rHoistPosition\x18\x06 \x01(\x01\"e\n\tCraneMove\x12\x0f\n\x07\x42lockId\x18\x01 \x01(\x05\x12\x10\n\x08SourceId\x18\x02 \x01(\x05\x12\x10\n\x08TargetId\x18\x03 \x01(\x05\x12\x10\n\x08Sequence\x18\x04 \x01(\x05\x12\x11\n\tEmptyMove\x18\x05 \x01(\x08\"T\n\rCraneSchedule\x12/\n\x05Moves\x18\x01 \x03(\x0b\x32 .DynStacking.DataModel.CraneMove\x12\x12\n\nSequenceNr\x18\x02 \x01(\x05\"R\n\x08Handover\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\r\n\x05Ready\x18\x02 \x01(\x08\x12+\n\x05\x42lock\x18\x03 \x01(\x0b\x32\x1c.DynStacking.DataModel.Block\"\xbf\x02\n\x0bPerformance\x12\x1a\n\x12\x43raneManipulations\x18\x01 \x01(\x05\x12\x18\n\x10ServiceLevelMean\x18\x02 \x01(\x01\x12\x14\n\x0cLeadTimeMean\x18\x03 \x01(\x01\x12\x17\n\x0f\x44\x65liveredBlocks\x18\x04 \x01(\x05\x12\x19\n\x11TotalBlocksOnTime\x18\x05 \x01(\x05\x12\x1a\n\x12\x42lockedArrivalTime\x18\x06 \x01(\x01\x12\x15\n\rTardinessMean\x18\x07 \x01(\x01\x12\x1d\n\x15\x42ufferUtilizationMean\x18\x08 \x01(\x01\x12\x1c\n\x14\x43raneUtilizationMean\x18\t \x01(\x01\x12\x1f\n\x17HandoverUtilizationMean\x18\n \x01(\x01\x12\x1f\n\x17UpstreamUtilizationMean\x18\x0b \x01(\x01\"Y\n\x05Stack\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x11\n\tMaxHeight\x18\x02 \x01(\x05\x12\x31\n\x0b\x42ottomToTop\x18\x03 \x03(\x0b\x32\x1c.DynStacking.DataModel.Block\"!\n\tTimeStamp\x12\x14\n\x0cMilliSeconds\x18\x01 \x01(\x03\"m\n\rUncertainties\x12\x1c\n\x10\x41rrivalIntervals\x18\x01 \x03(\x01\x42\x02\x10\x00\x12\x1a\n\x0e\x43raneMoveTimes\x18\x02 \x03(\x01\x42\x02\x10\x00\x12\"\n\x16HandoverReadyIntervals\x18\x03 \x03(\x01\x42\x02\x10\x00\"\xa0\x03\n\x05World\x12-\n\x03Now\x18\x01 \x01(\x0b\x32 .DynStacking.DataModel.TimeStamp\x12\x30\n\nProduction\x18\x02 \x01(\x0b\x32\x1c.DynStacking.DataModel.Stack\x12-\n\x07\x42uffers\x18\x03 \x03(\x0b\x32\x1c.DynStacking.DataModel.Stack\x12\x31\n\x08Handover\x18\x04 \x01(\x0b\x32\x1f.DynStacking.DataModel.Handover\x12+\n\x05\x43rane\x18\x05 \x01(\x0b\x32\x1c.DynStacking.DataModel.Crane\x12\x30\n\x04KPIs\x18\x06 \x01(\x0b\x32\".DynStacking.DataModel.Performance\x12=\n\x0fObservationData\x18\x07 \x01(\x0b\x32$.DynStacking.DataModel.Uncertainties\x12\x36\n\x0cInvalidMoves\x18\x08 \x03(\x0b\x32 .DynStacking.DataModel.CraneMoveb\x06proto3'
-)
-
-
-
-
-_BLOCK = _descriptor.Descriptor(
-  name='Block',
-  full_name='DynStacking.DataModel.Block',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Id', full_name='DynStacking.DataModel.Block.Id', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Release', full_name='DynStacking.DataModel.Block.Release', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Due', full_name='DynStacking.DataModel.Block.Due', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Ready', full_name='DynStacking.DataModel.Block.Ready', index=3,
-      number=4, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=50,
-  serialized_end=182,
-)
-
-
-_CRANE = _descriptor.Descriptor(
-  name='Crane',
-  full_name='DynStacking.DataModel.Crane',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Id', full_name='DynStacking.DataModel.Crane.Id', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='LocationId', full_name='DynStacking.DataModel.Crane.LocationId', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Load', full_name='DynStacking.DataModel.Crane.Load', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Schedule', full_name='DynStacking.DataModel.Crane.Schedule', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='GirderPosition', full_name='DynStacking.DataModel.Crane.GirderPosition', index=4,
-      number=5, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='HoistPosition', full_name='DynStacking.DataModel.Crane.HoistPosition', index=5,
-      number=6, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=185,
-  serialized_end=371,
-)
-
-
-_CRANEMOVE = _descriptor.Descriptor(
-  name='CraneMove',
-  full_name='DynStacking.DataModel.CraneMove',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='BlockId', full_name='DynStacking.DataModel.CraneMove.BlockId', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='SourceId', full_name='DynStacking.DataModel.CraneMove.SourceId', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='TargetId', full_name='DynStacking.DataModel.CraneMove.TargetId', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Sequence', full_name='DynStacking.DataModel.CraneMove.Sequence', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='EmptyMove', full_name='DynStacking.DataModel.CraneMove.EmptyMove', index=4,
-      number=5, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=373,
-  serialized_end=474,
-)
-
-
-_CRANESCHEDULE = _descriptor.Descriptor(
-  name='CraneSchedule',
-  full_name='DynStacking.DataModel.CraneSchedule',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Moves', full_name='DynStacking.DataModel.CraneSchedule.Moves', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='SequenceNr', full_name='DynStacking.DataModel.CraneSchedule.SequenceNr', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=476,
-  serialized_end=560,
-)
-
-
-_HANDOVER = _descriptor.Descriptor(
-  name='Handover',
-  full_name='DynStacking.DataModel.Handover',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Id', full_name='DynStacking.DataModel.Handover.Id', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Ready', full_name='DynStacking.DataModel.Handover.Ready', index=1,
-      number=2, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Block', full_name='DynStacking.DataModel.Handover.Block', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=562,
-  serialized_end=644,
-)
-
-
-_PERFORMANCE = _descriptor.Descriptor(
-  name='Performance',
-  full_name='DynStacking.DataModel.Performance',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='CraneManipulations', full_name='DynStacking.DataModel.Performance.CraneManipulations', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ServiceLevelMean', full_name='DynStacking.DataModel.Performance.ServiceLevelMean', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='LeadTimeMean', full_name='DynStacking.DataModel.Performance.LeadTimeMean', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='DeliveredBlocks', full_name='DynStacking.DataModel.Performance.DeliveredBlocks', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='TotalBlocksOnTime', full_name='DynStacking.DataModel.Performance.TotalBlocksOnTime', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='BlockedArrivalTime', full_name='DynStacking.DataModel.Performance.BlockedArrivalTime', index=5,
-      number=6, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='TardinessMean', full_name='DynStacking.DataModel.Performance.TardinessMean', index=6,
-      number=7, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='BufferUtilizationMean', full_name='DynStacking.DataModel.Performance.BufferUtilizationMean', index=7,
-      number=8, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='CraneUtilizationMean', full_name='DynStacking.DataModel.Performance.CraneUtilizationMean', index=8,
-      number=9, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='HandoverUtilizationMean', full_name='DynStacking.DataModel.Performance.HandoverUtilizationMean', index=9,
-      number=10, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='UpstreamUtilizationMean', full_name='DynStacking.DataModel.Performance.UpstreamUtilizationMean', index=10,
-      number=11, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=647,
-  serialized_end=966,
-)
-
-
-_STACK = _descriptor.Descriptor(
-  name='Stack',
-  full_name='DynStacking.DataModel.Stack',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Id', full_name='DynStacking.DataModel.Stack.Id', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='MaxHeight', full_name='DynStacking.DataModel.Stack.MaxHeight', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='BottomToTop', full_name='DynStacking.DataModel.Stack.BottomToTop', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=968,
-  serialized_end=1057,
-)
-
-
-_TIMESTAMP = _descriptor.Descriptor(
-  name='TimeStamp',
-  full_name='DynStacking.DataModel.TimeStamp',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='MilliSeconds', full_name='DynStacking.DataModel.TimeStamp.MilliSeconds', index=0,
-      number=1, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1059,
-  serialized_end=1092,
-)
-
-
-_UNCERTAINTIES = _descriptor.Descriptor(
-  name='Uncertainties',
-  full_name='DynStacking.DataModel.Uncertainties',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='ArrivalIntervals', full_name='DynStacking.DataModel.Uncertainties.ArrivalIntervals', index=0,
-      number=1, type=1, cpp_type=5, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=b'\020\000', file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='CraneMoveTimes', full_name='DynStacking.DataModel.Uncertainties.CraneMoveTimes', index=1,
-      number=2, type=1, cpp_type=5, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=b'\020\000', file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='HandoverReadyIntervals', full_name='DynStacking.DataModel.Uncertainties.HandoverReadyIntervals', index=2,
-      number=3, type=1, cpp_type=5, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=b'\020\000', file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1094,
-  serialized_end=1203,
-)
-
-
-_WORLD = _descriptor.Descriptor(
-  name='World',
-  full_name='DynStacking.DataModel.World',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Now', full_name='DynStacking.DataModel.World.Now', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Production', full_name='DynStacking.DataModel.World.Production', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Buffers', full_name='DynStacking.DataModel.World.Buffers', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Handover', full_name='DynStacking.DataModel.World.Handover', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Crane', full_name='DynStacking.DataModel.World.Crane', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='KPIs', full_name='DynStacking.DataModel.World.KPIs', index=5,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ObservationData', full_name='DynStacking.DataModel.World.ObservationData', index=6,
-      number=7, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='InvalidMoves', full_name='DynStacking.DataModel.World.InvalidMoves', index=7,
-      number=8, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1206,
-  serialized_end=1622,
-)
-
-_BLOCK.fields_by_name['Release'].message_type = _TIMESTAMP
-_BLOCK.fields_by_name['Due'].message_type = _TIMESTAMP
-_CRANE.fields_by_name['Load'].message_type = _BLOCK
-_CRANE.fields_by_name['Schedule'].message_type = _CRANESCHEDULE
-_CRANESCHEDULE.fields_by_name['Moves'].message_type = _CRANEMOVE
-_HANDOVER.fields_by_name['Block'].message_type = _BLOCK
-_STACK.fields_by_name['BottomToTop'].message_type = _BLOCK
-_WORLD.fields_by_name['Now'].message_type = _TIMESTAMP
-_WORLD.fields_by_name['Production'].message_type = _STACK
-_WORLD.fields_by_name['Buffers'].message_type = _STACK
-_WORLD.fields_by_name['Handover'].message_type = _HANDOVER
-_WORLD.fields_by_name['Crane'].message_type = _CRANE
-_WORLD.fields_by_name['KPIs'].message_type = _PERFORMANCE
-_WORLD.fields_by_name['ObservationData'].message_type = _UNCERTAINTIES
-_WORLD.fields_by_name['InvalidMoves'].message_type = _CRANEMOVE
-DESCRIPTOR.message_types_by_name['Block'] = _BLOCK
-DESCRIPTOR.message_types_by_name['Crane'] = _CRANE
-DESCRIPTOR.message_types_by_name['CraneMove'] = _CRANEMOVE
-DESCRIPTOR.message_types_by_name['CraneSchedule'] = _CRANESCHEDULE
-DESCRIPTOR.message_types_by_name['Handover'] = _HANDOVER
-DESCRIPTOR.message_types_by_name['Performance'] = _PERFORMANCE
-DESCRIPTOR.message_types_by_name['Stack'] = _STACK
-DESCRIPTOR.message_types_by_name['TimeStamp'] = _TIMESTAMP
-DESCRIPTOR.message_types_by_name['Uncertainties'] = _UNCERTAINTIES
-DESCRIPTOR.message_types_by_name['World'] = _WORLD
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-Block = _reflection.GeneratedProtocolMessageType('Block', (_message.Message,), {
-  'DESCRIPTOR' : _BLOCK,
-  '__module__' : 'hotstorage_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.DataModel.Block)
-  })
-_sym_db.RegisterMessage(Block)
-
-Crane = _reflection.GeneratedProtocolMessageType('Crane', (_message.Message,), {
-  'DESCRIPTOR' : _CRANE,
-  '__module__' : 'hotstorage_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.DataModel.Crane)
-  })
-_sym_db.RegisterMessage(Crane)
-
-CraneMove = _reflection.GeneratedProtocolMessageType('CraneMove', (_message.Message,), {
-  'DESCRIPTOR' : _CRANEMOVE,
-  '__module__' : 'hotstorage_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.DataModel.CraneMove)
-  })
-_sym_db.RegisterMessage(CraneMove)
-
-CraneSchedule = _reflection.GeneratedProtocolMessageType('CraneSchedule', (_message.Message,), {
-  'DESCRIPTOR' : _CRANESCHEDULE,
-  '__module__' : 'hotstorage_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.DataModel.CraneSchedule)
-  })
-_sym_db.RegisterMessage(CraneSchedule)
-
-Handover = _reflection.GeneratedProtocolMessageType('Handover', (_message.Message,), {
-  'DESCRIPTOR' : _HANDOVER,
-  '__module__' : 'hotstorage_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.DataModel.Handover)
-  })
-_sym_db.RegisterMessage(Handover)
-
-Performance = _reflection.GeneratedProtocolMessageType('Performance', (_message.Message,), {
-  'DESCRIPTOR' : _PERFORMANCE,
-  '__module__' : 'hotstorage_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.DataModel.Performance)
-  })
-_sym_db.RegisterMessage(Performance)
-
-Stack = _reflection.GeneratedProtocolMessageType('Stack', (_message.Message,), {
-  'DESCRIPTOR' : _STACK,
-  '__module__' : 'hotstorage_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.DataModel.Stack)
-  })
-_sym_db.RegisterMessage(Stack)
-
-TimeStamp = _reflection.GeneratedProtocolMessageType('TimeStamp', (_message.Message,), {
-  'DESCRIPTOR' : _TIMESTAMP,
-  '__module__' : 'hotstorage_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.DataModel.TimeStamp)
-  })
-_sym_db.RegisterMessage(TimeStamp)
-
-Uncertainties = _reflection.GeneratedProtocolMessageType('Uncertainties', (_message.Message,), {
-  'DESCRIPTOR' : _UNCERTAINTIES,
-  '__module__' : 'hotstorage_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.DataModel.Uncertainties)
-  })
-_sym_db.RegisterMessage(Uncertainties)
-
-World = _reflection.GeneratedProtocolMessageType('World', (_message.Message,), {
-  'DESCRIPTOR' : _WORLD,
-  '__module__' : 'hotstorage_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.DataModel.World)
-  })
-_sym_db.RegisterMessage(World)
-
-
-_UNCERTAINTIES.fields_by_name['ArrivalIntervals']._options = None
-_UNCERTAINTIES.fields_by_name['CraneMoveTimes']._options = None
-_UNCERTAINTIES.fields_by_name['HandoverReadyIntervals']._options = None
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16hotstorage_model.proto\x12 DynStacking.HotStorage.DataModel\"\x9a\x01\n\x05\x42lock\x12\n\n\x02Id\x18\x01 \x01(\x05\x12<\n\x07Release\x18\x02 \x01(\x0b\x32+.DynStacking.HotStorage.DataModel.TimeStamp\x12\x38\n\x03\x44ue\x18\x03 \x01(\x0b\x32+.DynStacking.HotStorage.DataModel.TimeStamp\x12\r\n\x05Ready\x18\x04 \x01(\x08\"\xd0\x01\n\x05\x43rane\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x12\n\nLocationId\x18\x02 \x01(\x05\x12\x35\n\x04Load\x18\x03 \x01(\x0b\x32\'.DynStacking.HotStorage.DataModel.Block\x12\x41\n\x08Schedule\x18\x04 \x01(\x0b\x32/.DynStacking.HotStorage.DataModel.CraneSchedule\x12\x16\n\x0eGirderPosition\x18\x05 \x01(\x01\x12\x15\n\rHoistPosition\x18\x06 \x01(\x01\"e\n\tCraneMove\x12\x0f\n\x07\x42lockId\x18\x01 \x01(\x05\x12\x10\n\x08SourceId\x18\x02 \x01(\x05\x12\x10\n\x08TargetId\x18\x03 \x01(\x05\x12\x10\n\x08Sequence\x18\x04 \x01(\x05\x12\x11\n\tEmptyMove\x18\x05 \x01(\x08\"_\n\rCraneSchedule\x12:\n\x05Moves\x18\x01 \x03(\x0b\x32+.DynStacking.HotStorage.DataModel.CraneMove\x12\x12\n\nSequenceNr\x18\x02 \x01(\x05\"]\n\x08Handover\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\r\n\x05Ready\x18\x02 \x01(\x08\x12\x36\n\x05\x42lock\x18\x03 \x01(\x0b\x32\'.DynStacking.HotStorage.DataModel.Block\"\xbf\x02\n\x0bPerformance\x12\x1a\n\x12\x43raneManipulations\x18\x01 \x01(\x05\x12\x18\n\x10ServiceLevelMean\x18\x02 \x01(\x01\x12\x14\n\x0cLeadTimeMean\x18\x03 \x01(\x01\x12\x17\n\x0f\x44\x65liveredBlocks\x18\x04 \x01(\x05\x12\x19\n\x11TotalBlocksOnTime\x18\x05 \x01(\x05\x12\x1a\n\x12\x42lockedArrivalTime\x18\x06 \x01(\x01\x12\x15\n\rTardinessMean\x18\x07 \x01(\x01\x12\x1d\n\x15\x42ufferUtilizationMean\x18\x08 \x01(\x01\x12\x1c\n\x14\x43raneUtilizationMean\x18\t \x01(\x01\x12\x1f\n\x17HandoverUtilizationMean\x18\n \x01(\x01\x12\x1f\n\x17UpstreamUtilizationMean\x18\x0b \x01(\x01\"d\n\x05Stack\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x11\n\tMaxHeight\x18\x02 \x01(\x05\x12<\n\x0b\x42ottomToTop\x18\x03 \x03(\x0b\x32\'.DynStacking.HotStorage.DataModel.Block\"!\n\tTimeStamp\x12\x14\n\x0cMilliSeconds\x18\x01 \x01(\x03\"m\n\rUncertainties\x12\x1c\n\x10\x41rrivalIntervals\x18\x01 \x03(\x01\x42\x02\x10\x00\x12\x1a\n\x0e\x43raneMoveTimes\x18\x02 \x03(\x01\x42\x02\x10\x00\x12\"\n\x16HandoverReadyIntervals\x18\x03 \x03(\x01\x42\x02\x10\x00\"\xf8\x03\n\x05World\x12\x38\n\x03Now\x18\x01 \x01(\x0b\x32+.DynStacking.HotStorage.DataModel.TimeStamp\x12;\n\nProduction\x18\x02 \x01(\x0b\x32\'.DynStacking.HotStorage.DataModel.Stack\x12\x38\n\x07\x42uffers\x18\x03 \x03(\x0b\x32\'.DynStacking.HotStorage.DataModel.Stack\x12<\n\x08Handover\x18\x04 \x01(\x0b\x32*.DynStacking.HotStorage.DataModel.Handover\x12\x36\n\x05\x43rane\x18\x05 \x01(\x0b\x32\'.DynStacking.HotStorage.DataModel.Crane\x12;\n\x04KPIs\x18\x06 \x01(\x0b\x32-.DynStacking.HotStorage.DataModel.Performance\x12H\n\x0fObservationData\x18\x07 \x01(\x0b\x32/.DynStacking.HotStorage.DataModel.Uncertainties\x12\x41\n\x0cInvalidMoves\x18\x08 \x03(\x0b\x32+.DynStacking.HotStorage.DataModel.CraneMoveb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'hotstorage_model_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _UNCERTAINTIES.fields_by_name['ArrivalIntervals']._options = None
+  _UNCERTAINTIES.fields_by_name['ArrivalIntervals']._serialized_options = b'\020\000'
+  _UNCERTAINTIES.fields_by_name['CraneMoveTimes']._options = None
+  _UNCERTAINTIES.fields_by_name['CraneMoveTimes']._serialized_options = b'\020\000'
+  _UNCERTAINTIES.fields_by_name['HandoverReadyIntervals']._options = None
+  _UNCERTAINTIES.fields_by_name['HandoverReadyIntervals']._serialized_options = b'\020\000'
+  _BLOCK._serialized_start=61
+  _BLOCK._serialized_end=215
+  _CRANE._serialized_start=218
+  _CRANE._serialized_end=426
+  _CRANEMOVE._serialized_start=428
+  _CRANEMOVE._serialized_end=529
+  _CRANESCHEDULE._serialized_start=531
+  _CRANESCHEDULE._serialized_end=626
+  _HANDOVER._serialized_start=628
+  _HANDOVER._serialized_end=721
+  _PERFORMANCE._serialized_start=724
+  _PERFORMANCE._serialized_end=1043
+  _STACK._serialized_start=1045
+  _STACK._serialized_end=1145
+  _TIMESTAMP._serialized_start=1147
+  _TIMESTAMP._serialized_end=1180
+  _UNCERTAINTIES._serialized_start=1182
+  _UNCERTAINTIES._serialized_end=1291
+  _WORLD._serialized_start=1294
+  _WORLD._serialized_end=1798
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: hotstorage_settings.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19hotstorage_settings.proto\x12\x1f\x44ynStacking.HotStorage.Settings\"X\n\x08TimeSpan\x12\r\n\x05value\x18\x01 \x01(\x12\x12=\n\x05scale\x18\x02 \x01(\x0e\x32..DynStacking.HotStorage.Settings.TimeSpanScale\"\xa1\t\n\x08Settings\x12\x1b\n\x13ProductionMaxHeight\x18\x01 \x01(\x05\x12\x17\n\x0f\x42ufferMaxHeight\x18\x02 \x01(\x05\x12\x13\n\x0b\x42ufferCount\x18\x03 \x01(\x05\x12\x45\n\x12SimulationDuration\x18\x06 \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12@\n\rCheckInterval\x18\x07 \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12?\n\x0cMinClearTime\x18\x08 \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12?\n\x0cMaxClearTime\x18\t \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12\x44\n\x11\x43raneMoveTimeMean\x18\n \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12\x43\n\x10\x43raneMoveTimeStd\x18\x0b \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12\x44\n\x11HoistMoveTimeMean\x18\x0c \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12\x43\n\x10HoistMoveTimeStd\x18\r \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12>\n\x0b\x44ueTimeMean\x18\x0e \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12=\n\nDueTimeStd\x18\x0f \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12=\n\nDueTimeMin\x18\x10 \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12\x0c\n\x04Seed\x18\x11 \x01(\x05\x12\x16\n\x0eReadyFactorMin\x18\x12 \x01(\x01\x12\x16\n\x0eReadyFactorMax\x18\x13 \x01(\x01\x12\x42\n\x0f\x41rrivalTimeMean\x18\x14 \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12\x41\n\x0e\x41rrivalTimeStd\x18\x15 \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12\x43\n\x10HandoverTimeMean\x18\x16 \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12\x42\n\x0fHandoverTimeStd\x18\x17 \x01(\x0b\x32).DynStacking.HotStorage.Settings.TimeSpan\x12\x1d\n\x15InitialNumberOfBlocks\x18\x18 \x01(\x05*g\n\rTimeSpanScale\x12\x08\n\x04\x44\x41YS\x10\x00\x12\t\n\x05HOURS\x10\x01\x12\x0b\n\x07MINUTES\x10\x02\x12\x0b\n\x07SECONDS\x10\x03\x12\x10\n\x0cMILLISECONDS\x10\x04\x12\t\n\x05TICKS\x10\x05\x12\n\n\x06MINMAX\x10\x0f\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'hotstorage_settings_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _TIMESPANSCALE._serialized_start=1340
+  _TIMESPANSCALE._serialized_end=1443
+  _TIMESPAN._serialized_start=62
+  _TIMESPAN._serialized_end=150
+  _SETTINGS._serialized_start=153
+  _SETTINGS._serialized_end=1338
+# @@protoc_insertion_point(module_scope)
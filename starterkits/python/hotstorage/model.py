@@ -0,0 +1,127 @@
+import numpy as np
+from hotstorage.dueindex import DueIndex
+from hotstorage.search import BrpState
+
+class YardModel:
+    # Planner side copy of the yard that is kept between world updates.
+    # Consecutive worlds usually differ in a few stacks only, so the columns
+    # of every new world are compared stack by stack with the previous ones
+    # and only the
+    # changed stacks are patched into the search state. Block priorities,
+    # the layout and the Zobrist keys are kept; a full rebuild only happens
+    # when the layout changes or a new block is due before a known one. The
+    # due date order of the known blocks is kept in a DueIndex.
+    #
+    # The model also remembers the best plan of the last search and the yard
+    # after each of its moves. If a new world is one of those yards, i.e. the
+    # crane carried out the first moves as planned, the rest of the plan is a
+    # known solution the next search starts from.
+    def __init__(self):
+        self.state = None
+        # YardColumns of the last world, compared to find changes
+        self.columns = None
+        # search priority of every known block, in due date order
+        self.priorities = {}
+        self.index = DueIndex()
+        self.next_prio = 0
+        # id of the block on the crane in the last world
+        self.crane = None
+        self.patched = 0
+        self.rebuilds = 0
+        # moves of the last plan and the yards it passes through, by Zobrist
+        # key -> (priorities, number of moves done)
+        self.moves = []
+        self.plan = {}
+        self.warm_starts = 0
+
+    def update(self, columns):
+        if self.state is None or not self.same_layout(columns):
+            return self.rebuild(columns)
+        last = self.columns
+        changed = [i for i in range(len(columns.heights))
+            if columns.heights[i] != last.heights[i] or not np.array_equal(columns.blocks(i), last.blocks(i))]
+        if changed:
+            state = self.patch(columns, changed)
+            if state is None:
+                return self.rebuild(columns)
+            self.state = state
+        self.columns = columns
+        self.patched = len(changed)
+        return self.state
+
+    def remember(self, initial, moves):
+        self.moves = moves or []
+        self.plan = {initial.key: (initial.prios, 0)}
+        state = initial
+        for (i, move) in enumerate(self.moves):
+            state = state.apply_move(move)
+            self.plan[state.key] = (state.prios, i + 1)
+
+    def incumbent(self, state):
+        # The rest of the last plan if it was planned to pass through `state`.
+        entry = self.plan.get(state.key)
+        if entry is None or entry[0] != state.prios:
+            return None
+        self.warm_starts += 1
+        return self.moves[entry[1]:]
+
+    def same_layout(self, columns):
+        layout = self.state.layout
+        return (layout.handover_id == columns.handover_id
+            and np.array_equal(columns.stack_ids, layout.stack_ids)
+            and np.array_equal(columns.max_heights, layout.max_heights))
+
+    def patch(self, columns, changed):
+        # Returns the patched state or None if a rebuild is needed.
+        layout = self.state.layout
+        if columns.heights[changed].max() > layout.stride:
+            return None
+        changed_blocks = {i: columns.blocks(i).tolist() for i in changed}
+        present = set(id for blocks in changed_blocks.values() for id in blocks)
+
+        # Blocks that left the changed stacks or the crane and are not on the
+        # crane now are gone for good.
+        crane = columns.crane_load if columns.crane_load >= 0 else None
+        removed = [layout.block_ids[prio] for i in changed for prio in self.state.blocks(i)]
+        if self.crane is not None:
+            removed.append(self.crane)
+        removed = set(id for id in removed if id not in present and id != crane and id in self.priorities)
+        for id in removed:
+            self.index.remove(id)
+
+        # New blocks get the next free priorities as long as they are not due
+        # before any remaining block, otherwise all priorities are reassigned.
+        in_changed = np.isin(columns.stack, changed)
+        new_blocks = [(due, id) for (id, due) in zip(columns.block_ids[in_changed].tolist(), columns.due[in_changed].tolist())
+            if id not in self.priorities]
+        new_blocks.sort()
+        last_due = self.index.last_due()
+        if new_blocks and last_due is not None and new_blocks[0][0] < last_due:
+            return None
+        for (due, id) in new_blocks:
+            self.priorities[id] = self.next_prio
+            self.index.add(id, due)
+            layout.add_block(self.next_prio, id)
+            self.next_prio += 1
+        self.crane = crane
+
+        state = self.state.with_stacks({i: [self.priorities[id] for id in blocks]
+            for (i, blocks) in changed_blocks.items()})
+        for id in removed:
+            layout.remove_block(self.priorities.pop(id))
+        return state
+
+    def rebuild(self, columns):
+        self.index = DueIndex.from_columns(columns)
+        ids = columns.block_ids.tolist()
+        prios = self.index.ranks(ids)
+        self.priorities = dict(zip(ids, prios.tolist()))
+        self.next_prio = len(ids)
+        self.crane = columns.crane_load if columns.crane_load >= 0 else None
+        self.state = BrpState(columns, prios)
+        # priorities changed, yards of the old plan can not be compared
+        self.plan = {}
+        self.columns = columns
+        self.patched = len(columns.heights)
+        self.rebuilds += 1
+        return self.state
@@ -0,0 +1,86 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from hotstorage.search import BrpState, Layout, Move, SearchStats, NO_SOLUTION, branch_and_bound
+from hotstorage.transposition import TranspositionTable
+
+class ParallelSearch:
+    # Branch and bound that splits the children of the root state over a pool
+    # of worker processes. The pool is started once and every search sends
+    # the layout and the compact state encodings to the workers. The length
+    # of the best solution found by any worker is shared through a
+    # multiprocessing.Value so each worker prunes with the global incumbent.
+    # Every subtree gets the whole node budget, the workers search deeper in
+    # about the time the serial search takes.
+    #
+    # An instance can be used as `engine` of search.crane_schedule.
+    def __init__(self, workers=None):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.shared = multiprocessing.Value("i", NO_SOLUTION)
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.shared,))
+        self.searches = 0
+        # start all workers now instead of on the first world update
+        list(self.pool.map(_ping, range(self.workers)))
+
+    def close(self):
+        self.pool.shutdown()
+
+    def __call__(self, initial, budget=1000, table=None, deadline=None, stats=None, incumbent=None):
+        # `table` is ignored, every worker uses its own transposition table.
+        roots = initial.forced_moves()
+        if len(roots) <= 1:
+            return branch_and_bound(initial, budget, table, deadline, stats, incumbent)
+
+        start = time.perf_counter()
+        self.searches += 1
+        with self.shared.get_lock():
+            self.shared.value = NO_SOLUTION if incumbent is None else len(incumbent)
+        # perf_counter values can not be compared between processes
+        wall_deadline = None if deadline is None else time.time() + deadline - start
+        layout = initial.layout.encode()
+        futures = [self.pool.submit(_search_subtree, self.searches, layout, initial.apply_move(move).encode(), budget, wall_deadline)
+            for move in roots]
+
+        best = incumbent
+        optimal = True
+        for (root, future) in zip(roots, futures):
+            (moves, nodes, pruned, timed_out, exhausted, hits, misses) = future.result()
+            optimal = optimal and exhausted
+            if stats is not None:
+                stats.nodes += nodes
+                stats.pruned += pruned
+                stats.hits += hits
+                stats.misses += misses
+                stats.timed_out = stats.timed_out or timed_out
+            if moves is not None and (best is None or len(moves) + 1 < len(best)):
+                best = [root] + [Move(*move) for move in moves]
+        if stats is not None:
+            stats.elapsed += time.perf_counter() - start
+            stats.optimal = optimal and best is not None
+        return best
+
+_shared = None
+_layout = (None, None)
+
+def _init_worker(shared):
+    global _shared
+    _shared = shared
+
+def _ping(_):
+    return None
+
+def _search_subtree(search, layout, state, budget, wall_deadline):
+    global _layout
+    # all subtrees of one search share the layout, it is only decoded once
+    if _layout[0] != search:
+        _layout = (search, Layout.decode(layout))
+    initial = BrpState.decode(_layout[1], state)
+    deadline = None if wall_deadline is None else time.perf_counter() + wall_deadline - time.time()
+    stats = SearchStats()
+    table = TranspositionTable()
+    moves = branch_and_bound(initial, budget, table, deadline, stats, shared=_shared)
+    exhausted = not stats.timed_out and (budget is None or stats.nodes < budget)
+    if moves is not None:
+        moves = [(move.src, move.tgt, move.block) for move in moves]
+    return (moves, stats.nodes, stats.pruned, stats.timed_out, exhausted, table.hits, table.misses)
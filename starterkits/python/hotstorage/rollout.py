@@ -0,0 +1,248 @@
+import time
+import numpy as np
+from hotstorage.hotstorage_model_pb2 import World, CraneSchedule
+from hotstorage import heuristic
+from pbview import message_view
+
+# Only the observation data of a world. plan_moves parses a view without it,
+# so the rollout planner parses it on its own.
+ObservationView = message_view(World, [field.name for field in World.DESCRIPTOR.fields if field.name != "ObservationData"])
+
+# Intervals in seconds used while a world has no observations of a kind.
+DEFAULT_ARRIVAL = 12.0
+DEFAULT_CRANE_MOVE = 4.0
+DEFAULT_HANDOVER = 4.0
+# Share of the time from release to due date after which a block is ready.
+READY_FACTOR = (0.65, 0.85)
+# Due date of new blocks in seconds after their release, used while there
+# is no block in the yard to take it from.
+DEFAULT_DUE_TIME = 240.0
+
+# Target of deliveries and source of waiting in the rollout actions.
+HANDOVER = -1
+WAIT = -1
+
+OBJECTIVES = ("tardiness", "blocked")
+
+class Observations:
+    # Empirical distributions of the intervals the simulation reports in
+    # World.ObservationData, sampled with replacement.
+    def __init__(self, world_data):
+        view = ObservationView()
+        view.ParseFromString(world_data)
+        data = view.ObservationData
+        self.arrivals = observed(data.ArrivalIntervals, DEFAULT_ARRIVAL)
+        self.crane_moves = observed(data.CraneMoveTimes, DEFAULT_CRANE_MOVE)
+        self.handovers = observed(data.HandoverReadyIntervals, DEFAULT_HANDOVER)
+
+def observed(values, default):
+    values = np.array(values, np.float64)
+    return values if len(values) > 0 else np.array([default])
+
+def sample(rng, values, shape):
+    return values[rng.integers(len(values), size=shape)]
+
+class Futures:
+    # A batch of simulated futures of the yard, one per row, that are
+    # advanced in lockstep one crane move at a time. Times are in seconds
+    # from the current world. Like in the world the production stack is
+    # stack 0 and new blocks come in at its bottom.
+    def __init__(self, columns, observations, rows, rng):
+        self.rng = rng
+        self.observations = observations
+        count = len(columns.stack_ids)
+        self.max_heights = columns.max_heights
+        stride = int(max(columns.max_heights.max(), columns.heights.max()))
+        now = columns.now
+        due = (columns.due - now) / 1000.0
+        release = (columns.release - now) / 1000.0
+        slots = columns.stack * stride + columns.level
+
+        self.due = np.full((rows, count * stride), np.inf)
+        self.due[:, slots] = due
+        self.due = self.due.reshape(rows, count, stride)
+        # unknown ready times are drawn within READY_FACTOR, but after now
+        factor = rng.uniform(*READY_FACTOR, size=(rows, len(due)))
+        ready = np.maximum(release + factor * (due - release), 1e-3)
+        self.ready = np.full((rows, count * stride), np.inf)
+        self.ready[:, slots] = np.where(columns.ready, 0.0, ready)
+        self.ready = self.ready.reshape(rows, count, stride)
+        self.heights = np.tile(columns.heights, (rows, 1))
+
+        # due dates of new blocks relative to their release
+        due_times = (columns.due - columns.release) / 1000.0
+        self.due_times = due_times[due_times > 0] if np.any(due_times > 0) else np.array([DEFAULT_DUE_TIME])
+        self.t = np.zeros(rows)
+        # time since the last arrival and the last delivery is unknown, the
+        # next ones are a random part of a sampled interval away
+        self.next_arrival = sample(rng, observations.arrivals, rows) * rng.random(rows)
+        self.halted_at = np.full(rows, 0.0 if columns.heights[0] >= columns.max_heights[0] else np.inf)
+        free = columns.handover_ready and not columns.handover_busy
+        self.handover_at = np.zeros(rows) if free else sample(rng, observations.handovers, rows) * rng.random(rows)
+        self.tardiness = np.zeros(rows)
+        self.blocked = np.zeros(rows)
+        self.delivered = np.zeros(rows, np.int64)
+
+    def tops(self):
+        rows = np.arange(len(self.t))[:, None]
+        stacks = np.arange(self.heights.shape[1])[None, :]
+        levels = np.maximum(self.heights - 1, 0)
+        occupied = self.heights > 0
+        due = np.where(occupied, self.due[rows, stacks, levels], np.inf)
+        ready = occupied & (self.ready[rows, stacks, levels] <= self.t[:, None])
+        return (due, ready)
+
+    def policy(self):
+        # Greedy rule for every row: deliver the ready top block that is due
+        # first, else put the production block on the best buffer, else
+        # relocate the top above the most urgent ready block, else wait.
+        rows = np.arange(len(self.t))
+        (top_due, top_ready) = self.tops()
+        stack_due = self.due.min(axis=2)
+        room = self.heights < self.max_heights
+        room[:, 0] = False
+
+        src = np.full(len(rows), WAIT)
+        tgt = np.full(len(rows), HANDOVER)
+        deliverable = np.where(top_ready, top_due, np.inf)
+        best = deliverable.argmin(axis=1)
+        deliver = (self.handover_at <= self.t) & np.isfinite(deliverable[rows, best])
+        src[deliver] = best[deliver]
+
+        put = ~deliver & (self.heights[:, 0] > 0) & room.any(axis=1)
+        buried = (self.ready <= self.t[:, None, None]) & np.isfinite(self.due)
+        buried_due = np.where(buried, self.due, np.inf).min(axis=2)
+        buried_due[:, 0] = np.inf
+        buried_due = np.where(buried_due < top_due, buried_due, np.inf)
+        stuck = buried_due.argmin(axis=1)
+        relocate = ~deliver & ~put & np.isfinite(buried_due[rows, stuck])
+        src[put] = 0
+        src[relocate] = stuck[relocate]
+
+        moving = put | relocate
+        cost = (stack_due < top_due[rows, src][:, None]) * 10.0 + self.heights / self.max_heights
+        cost[~room] = np.inf
+        cost[rows, src] = np.inf
+        best = cost.argmin(axis=1)
+        moving &= np.isfinite(cost[rows, best])
+        tgt[moving] = best[moving]
+        src[~deliver & ~moving] = WAIT
+        return (src, tgt)
+
+    def step(self, src, tgt):
+        # Carries out one action per row, `src` WAIT waits for the next
+        # arrival, delivery slot or ready block instead.
+        rows = np.arange(len(self.t))
+        moving = src != WAIT
+        end = self.t + sample(self.rng, self.observations.crane_moves, len(rows))
+        waiting = np.flatnonzero(~moving)
+        if len(waiting) > 0:
+            pending = np.where(self.ready[waiting] > self.t[waiting, None, None], self.ready[waiting], np.inf).min(axis=(1, 2))
+            handover = np.where(self.handover_at[waiting] > self.t[waiting], self.handover_at[waiting], np.inf)
+            arrival = np.where(np.isinf(self.halted_at[waiting]), self.next_arrival[waiting], np.inf)
+            event = np.minimum(np.minimum(pending, handover), arrival)
+            end[waiting] = np.where(np.isfinite(event), np.maximum(event, self.t[waiting]), end[waiting])
+        self.arrive(end)
+
+        moved = np.flatnonzero(moving)
+        from_stack = src[moved]
+        level = self.heights[moved, from_stack] - 1
+        due = self.due[moved, from_stack, level]
+        ready = self.ready[moved, from_stack, level]
+        self.due[moved, from_stack, level] = np.inf
+        self.ready[moved, from_stack, level] = np.inf
+        self.heights[moved, from_stack] -= 1
+        # taking a block from a full production stack restarts the arrivals
+        restart = moved[(from_stack == 0) & np.isfinite(self.halted_at[moved])]
+        self.blocked[restart] += end[restart] - self.halted_at[restart]
+        self.halted_at[restart] = np.inf
+        self.next_arrival[restart] = end[restart] + sample(self.rng, self.observations.arrivals, len(restart))
+
+        to = tgt[moved]
+        delivered = to == HANDOVER
+        done = moved[delivered]
+        self.tardiness[done] += np.maximum(end[done] - due[delivered], 0.0)
+        self.delivered[done] += 1
+        self.handover_at[done] = end[done] + sample(self.rng, self.observations.handovers, len(done))
+        placed = moved[~delivered]
+        to = to[~delivered]
+        level = self.heights[placed, to]
+        self.due[placed, to, level] = due[~delivered]
+        self.ready[placed, to, level] = ready[~delivered]
+        self.heights[placed, to] += 1
+        self.t = end
+
+    def arrive(self, end):
+        # New blocks until `end`. An arrival at a full production stack halts
+        # the arrivals until the crane takes a block from it.
+        while True:
+            rows = np.flatnonzero(np.isinf(self.halted_at) & (self.next_arrival <= end))
+            if len(rows) == 0:
+                return
+            at = self.next_arrival[rows]
+            full = self.heights[rows, 0] >= self.max_heights[0]
+            self.halted_at[rows[full]] = at[full]
+            (rows, at) = (rows[~full], at[~full])
+            due_time = sample(self.rng, self.due_times, len(rows))
+            factor = self.rng.uniform(*READY_FACTOR, size=len(rows))
+            self.due[rows, 0, 1:] = self.due[rows, 0, :-1]
+            self.ready[rows, 0, 1:] = self.ready[rows, 0, :-1]
+            self.due[rows, 0, 0] = at + due_time
+            self.ready[rows, 0, 0] = at + factor * due_time
+            self.heights[rows, 0] += 1
+            self.next_arrival[rows] = at + sample(self.rng, self.observations.arrivals, len(rows))
+
+    def outcome(self, objective):
+        # Per row: the tardiness of the delivered blocks plus how late the
+        # blocks still in the yard already are, or the time arrivals were
+        # blocked including a halt that still lasts.
+        if objective == "blocked":
+            return self.blocked + np.where(np.isfinite(self.halted_at), self.t - self.halted_at, 0.0)
+        overdue = np.where(np.isfinite(self.due), np.maximum(self.t[:, None, None] - self.due, 0.0), 0.0)
+        return self.tardiness + overdue.sum(axis=(1, 2))
+
+class RolloutPlanner:
+    # Plans the next crane move by simulating. The `candidates` best moves of
+    # heuristic.score_moves and waiting are each followed by `futures` random futures
+    # of `horizon` moves of a greedy policy, drawn from the intervals the
+    # simulation observed so far. All futures of all candidates run as one
+    # batch. The move with the lowest mean `objective` over its futures wins,
+    # "tardiness" for the tardiness of the blocks or "blocked" for the time
+    # the production stack blocked arrivals.
+    def __init__(self, candidates=6, futures=64, horizon=12, objective="tardiness", seed=None):
+        self.candidates = candidates
+        self.futures = futures
+        self.horizon = horizon
+        self.objective = objective
+        self.rng = np.random.default_rng(seed)
+        # mean outcome of every candidate of the last plan
+        self.expected = None
+
+    def crane_schedule(self, world_data, columns, deadline_ms=None):
+        if columns.scheduled > 0:
+            return None
+        deadline = None
+        if deadline_ms is not None:
+            deadline = time.perf_counter() + deadline_ms / 1000
+        (src, tgt, _) = heuristic.score_moves(columns, self.candidates)
+        if len(src) == 0:
+            return None
+        # waiting is the last candidate, if it wins nothing is planned
+        src = np.append(src, WAIT)
+        tgt = np.append(tgt, HANDOVER)
+        futures = Futures(columns, Observations(world_data), len(src) * self.futures, self.rng)
+        futures.step(np.repeat(src, self.futures), np.repeat(tgt, self.futures))
+        for _ in range(self.horizon - 1):
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            futures.step(*futures.policy())
+        self.expected = futures.outcome(self.objective).reshape(len(src), self.futures).mean(axis=1)
+        best = int(self.expected.argmin())
+        if src[best] == WAIT:
+            return None
+        schedule = CraneSchedule()
+        mov = schedule.Moves.add()
+        mov.BlockId = columns.block_ids[columns.tops()[src[best]]]
+        mov.SourceId = columns.stack_ids[src[best]]
+        mov.TargetId = columns.handover_id if tgt[best] == heuristic.HANDOVER else columns.stack_ids[tgt[best]]
+        return schedule
@@ -1,15 +1,63 @@
-import copy
+import time
+from array import array
+import numpy as np
 from hotstorage.hotstorage_model_pb2 import World, CraneSchedule, CraneMove
+from hotstorage.columns import YardColumns
+from hotstorage.dueindex import DueIndex
+from hotstorage import heuristic
+from hotstorage.transposition import TranspositionTable, zobrist_keys
 
-def crane_schedule(world):
-    if len(world.Crane.Schedule.Moves) > 0:
+def crane_schedule(world, table=None, deadline_ms=None, stats=None, engine="dfs", model=None, timer=None, columns=None):
+    # Without a deadline the search is limited by its node budget. With a
+    # deadline (in milliseconds from now) it runs until the time is up and
+    # returns the best solution found so far. With a model.YardModel the
+    # initial state is patched from the previous world instead of rebuilt,
+    # and if the yard is one the last plan predicted, the rest of that plan
+    # is the starting incumbent. `columns` is the YardColumns of the world if
+    # the caller already decoded it. Relocations are expanded in the order of
+    # the heuristic move scores, and if the search finds no solution the
+    # best scored move is planned instead.
+    if columns is None:
+        columns = YardColumns.from_world(world)
+    if columns.scheduled > 0:
         return None
-    priorities = prioritize_by_due_date(world)
-    initial = BrpState(world, priorities)
-    moves = depth_first_search(initial)
-    return create_schedule_from_solution(world, moves)
+    deadline = None
+    if deadline_ms is not None:
+        deadline = time.perf_counter() + deadline_ms / 1000
+    incumbent = None
+    if model is not None:
+        initial = model.update(columns)
+        incumbent = model.incumbent(initial)
+        if stats is not None and incumbent is not None:
+            stats.incumbent = len(incumbent)
+    else:
+        index = DueIndex.from_columns(columns)
+        initial = BrpState(columns, index.ranks(columns.block_ids.tolist()))
+    initial.layout.ranks = heuristic.move_ranks(columns)
+    if timer is not None:
+        timer.lap("build")
+    if table is None:
+        table = TranspositionTable()
+    # `engine` is either the name of a search in ENGINES or a callable with
+    # the same signature, e.g. a parallel.ParallelSearch.
+    search = ENGINES[engine] if isinstance(engine, str) else engine
+    if deadline is None:
+        moves = search(initial, table=table, stats=stats, incumbent=incumbent)
+    else:
+        moves = search(initial, budget=None, table=table, deadline=deadline, stats=stats, incumbent=incumbent)
+    if stats is not None:
+        stats.hits += table.hits
+        stats.misses += table.misses
+    if model is not None:
+        model.remember(initial, moves)
+    schedule = create_schedule_from_solution(world, moves)
+    if schedule is None:
+        return heuristic.crane_schedule(world, columns)
+    return schedule
 
 def create_schedule_from_solution(world, moves):
+    if not moves:
+        return None
     schedule = CraneSchedule()
     handover = world.Handover
     is_ready = handover.Ready
@@ -26,110 +74,408 @@ def create_schedule_from_solution(world, moves):
     else:
         return None
 
-def prioritize_by_due_date(world):
-    all_blocks = world.Production.BottomToTop
-    for stack in world.Buffers:
-        all_blocks.extend(stack.BottomToTop)
-    all_blocks.sort(key=lambda block: block.Due.MilliSeconds)
+class SearchStats:
+    def __init__(self):
+        self.nodes = 0
+        self.elapsed = 0.0
+        self.timed_out = False
+        self.pruned = 0
+        # the search ran out of states, the solution is the shortest of the
+        # forced moves (see BrpState.forced_moves), not of all moves
+        self.optimal = False
+        # length of the solution the search started with, 0 if none
+        self.incumbent = 0
+        # transposition table lookups
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def nodes_per_sec(self):
+        if self.elapsed <= 0:
+            return 0.0
+        return self.nodes / self.elapsed
+
+    def __str__(self):
+        return "nodes={} elapsed={:.1f}ms nodes/s={:.0f} timed_out={} pruned={} forced_optimal={} incumbent={} hits={} misses={}".format(
+            self.nodes, self.elapsed * 1000, self.nodes_per_sec, self.timed_out, self.pruned, self.optimal, self.incumbent, self.hits, self.misses)
 
-    return dict(zip(map(lambda block: block.Id, all_blocks), range(len(all_blocks))))
+# The clock is only read every CLOCK_INTERVAL nodes.
+CLOCK_INTERVAL = 64
+# Solution length used as bound while no solution is known.
+NO_SOLUTION = 2 ** 31 - 1
 
-def depth_first_search(initial):
-    budget = 1000
-    best = None
+def depth_first_search(initial, budget=1000, table=None, deadline=None, stats=None, incumbent=None):
+    # `budget` limits the number of expanded nodes (None for no limit) and
+    # `deadline` is a time.perf_counter() value after which the search stops.
+    # `incumbent` is an optional known solution to start with.
+    start = time.perf_counter()
+    nodes = 0
+    timed_out = False
+    best = incumbent
     stack = [initial]
-    while any(stack) and budget > 0:
-        budget -= 1
+    while any(stack) and (budget is None or nodes < budget):
+        if deadline is not None and nodes % CLOCK_INTERVAL == 0 and time.perf_counter() >= deadline:
+            timed_out = True
+            break
+        nodes += 1
         state = stack.pop()
         moves = state.forced_moves()
         if any(moves):
             for move in moves:
-                stack.append(state.apply_move(move))
-        else:
-            sol = state.moves
-            if best == None or len(sol) < len(best):
-                best = sol
+                child = state.apply_move(move)
+                if table is None or not table.prune(child):
+                    stack.append(child)
+        elif best == None or state.depth < len(best):
+            best = state.moves
+    if stats is not None:
+        stats.nodes += nodes
+        stats.elapsed += time.perf_counter() - start
+        stats.timed_out = stats.timed_out or timed_out
     return best
-        
+
+def branch_and_bound(initial, budget=1000, table=None, deadline=None, stats=None, incumbent=None, shared=None):
+    # Depth first search that cuts every state whose moves so far plus its
+    # lower bound can not beat the best solution. Children are expanded in
+    # order of their bound. If the search runs out of states before the
+    # budget or deadline, the returned solution is optimal within the forced
+    # move model: every move takes the top of the stack with the most urgent
+    # block, other sources are never tried. `incumbent` is an optional known
+    # solution to start with. `shared` is an optional multiprocessing.Value
+    # with the best solution length of all searches running in parallel, it
+    # is read and updated while searching.
+    start = time.perf_counter()
+    nodes = 0
+    pruned = 0
+    timed_out = False
+    best = incumbent
+    limit = len(best) if best is not None else NO_SOLUTION
+    stack = [initial]
+    while stack and (budget is None or nodes < budget):
+        if nodes % CLOCK_INTERVAL == 0:
+            if deadline is not None and time.perf_counter() >= deadline:
+                timed_out = True
+                break
+            if shared is not None:
+                limit = min(limit, shared.value)
+        state = stack.pop()
+        if state.depth + state.lower_bound() >= limit:
+            pruned += 1
+            continue
+        nodes += 1
+        if state.remaining == 0:
+            best = state.moves
+            limit = state.depth
+            if shared is not None:
+                with shared.get_lock():
+                    if limit < shared.value:
+                        shared.value = limit
+            continue
+        moves = state.forced_moves()
+        children = []
+        for move in moves:
+            child = state.apply_move(move)
+            if child.depth + child.lower_bound() >= limit:
+                pruned += 1
+            elif table is None or not table.prune(child):
+                children.append(child)
+        children.sort(key=lambda child: child.lower_bound(), reverse=True)
+        stack.extend(children)
+    if stats is not None:
+        stats.nodes += nodes
+        stats.elapsed += time.perf_counter() - start
+        stats.timed_out = stats.timed_out or timed_out
+        stats.pruned += pruned
+        stats.optimal = not stack and best is not None
+    return best
+
+ENGINES = {
+    "dfs": depth_first_search,
+    "bnb": branch_and_bound,
+}
 
 
 class Move:
+    __slots__ = ("src", "tgt", "block")
+
     def __init__(self, src, tgt, block):
         self.src = src
         self.tgt = tgt
         self.block = block
 
-class Block:
-    def __init__(self, id, prio):
-        self.id = id
-        self.prio = prio
+EMPTY = -1
+
+class Layout:
+    # Everything about the yard that does not change during a search. It is
+    # built once per world and shared by all states of that search.
+    def __init__(self, stack_ids, max_heights, stride, block_ids, arrival_id, handover_id, ranks=None):
+        self.stack_ids = stack_ids
+        self.max_heights = max_heights
+        self.index = {id: i for (i, id) in enumerate(stack_ids)}
+        self.stride = stride
+        self.block_ids = block_ids
+        slots = len(stack_ids) * stride
+        self.zobrist = {prio: zobrist_keys(prio, slots) for prio in block_ids}
+        self.arrival_id = arrival_id
+        self.handover_id = handover_id
+        # optional rank of each move by (source id, target id), lower first
+        self.ranks = ranks
 
-class Stack:
-    def __init__(self, id, max_height, blocks):
-        self.id = id
-        self.max_height = max_height
-        self.blocks = blocks
+    @staticmethod
+    def from_columns(columns, prios):
+        # `prios` holds the priority of every block of the columns.
+        stack_ids = columns.stack_ids.tolist()
+        return Layout(
+            stack_ids,
+            columns.max_heights.tolist(),
+            int(max(columns.max_heights.max(), columns.heights.max())),
+            dict(zip(prios.tolist(), columns.block_ids.tolist())),
+            stack_ids[0],
+            columns.handover_id)
 
-    def top(self):
-        return self.blocks[-1]
+    def add_block(self, prio, id):
+        self.block_ids[prio] = id
+        self.zobrist[prio] = zobrist_keys(prio, len(self.stack_ids) * self.stride)
 
-    def most_urgent(self):
-        return min(self.blocks, key=lambda block: block.prio)
+    def remove_block(self, prio):
+        del self.block_ids[prio]
+        del self.zobrist[prio]
+
+    def encode(self):
+        return (self.stack_ids, self.max_heights, self.stride, self.block_ids, self.arrival_id, self.handover_id, self.ranks)
+
+    @staticmethod
+    def decode(data):
+        return Layout(*data)
 
 class BrpState:
-    def __init__(self, world, priorities):
-        stacks = []
-        prod = world.Production
-        stacks.append(Stack(prod.Id, prod.MaxHeight, [Block(block.Id, priorities[block.Id]) for block in reversed(prod.BottomToTop)]))
+    # The yard is stored as a flat array of block priorities with one slot of
+    # `layout.stride` entries per stack plus an array of stack heights. Free
+    # slots hold EMPTY, so two states are equal iff their arrays are equal.
+    # `key` is the Zobrist hash of the yard and is updated with every move.
+    # `mins` holds for every slot the most urgent priority at or below it,
+    # which gives most_urgent in O(1) and keeps the count of blocked blocks
+    # (blocks above a more urgent one) up to date for the lower bound.
+    __slots__ = ("layout", "prios", "mins", "heights", "key", "blocked", "remaining", "history", "depth")
+
+    def __init__(self, columns, prios):
+        # `prios` holds the priority of every block of the YardColumns.
+        layout = Layout.from_columns(columns, prios)
+        slots = np.full(len(layout.stack_ids) * layout.stride, EMPTY, np.int32)
+        slots[columns.stack * layout.stride + columns.level] = prios
+        self.reset(layout, array("i", slots.tobytes()), array("i", columns.heights.astype(np.int32).tobytes()))
+
+    @staticmethod
+    def from_arrays(layout, prios, heights, depth=0):
+        state = BrpState.__new__(BrpState)
+        state.reset(layout, prios, heights, depth)
+        return state
 
-        for stack in world.Buffers:
-            stacks.append(Stack(stack.Id, stack.MaxHeight, [Block(block.Id, priorities[block.Id]) for block in stack.BottomToTop]))
+    def reset(self, layout, prios, heights, depth=0):
+        # Derives mins, key and the bound counters from the priority array.
+        stride = layout.stride
+        mins = array("i", prios)
+        key = 0
+        blocked = 0
+        for (i, height) in enumerate(heights):
+            for slot in range(i * stride, i * stride + height):
+                prio = prios[slot]
+                if slot > i * stride and mins[slot - 1] < prio:
+                    mins[slot] = mins[slot - 1]
+                    blocked += 1
+                key ^= layout.zobrist[prio][slot]
 
-        self.arrival_id = world.Production.Id
-        self.handover_id = world.Handover.Id
-        self.moves = []
-        self.stacks = stacks
+        self.layout = layout
+        self.prios = prios
+        self.mins = mins
+        self.heights = heights
+        self.key = key
+        self.blocked = blocked
+        self.remaining = sum(heights)
+        # The move history is a chain of (move, previous) pairs shared with
+        # the parent state, the list is only built for the final solution.
+        self.history = None
+        self.depth = depth
+
+    def encode(self):
+        # Compact form of the yard without layout and history, e.g. to send
+        # it to another process.
+        return (self.prios.tobytes(), self.heights.tobytes(), self.depth)
+
+    @staticmethod
+    def decode(layout, data):
+        (prios, heights, depth) = data
+        return BrpState.from_arrays(layout, array("i", prios), array("i", heights), depth)
+
+    @property
+    def arrival_id(self):
+        return self.layout.arrival_id
+
+    @property
+    def handover_id(self):
+        return self.layout.handover_id
+
+    @property
+    def moves(self):
+        moves = []
+        node = self.history
+        while node is not None:
+            moves.append(node[0])
+            node = node[1]
+        moves.reverse()
+        return moves
+
+    def __eq__(self, other):
+        return self.prios == other.prios
+
+    def __hash__(self):
+        return self.key
+
+    def blocks(self, i):
+        start = i * self.layout.stride
+        return self.prios[start:start + self.heights[i]]
 
     def print(self):
-        for stack in self.stacks:
-            for block in stack.blocks:
-                print("[",block.id, "/", block.prio ,end="] ")
-            print("stack", stack.id)
-    
+        layout = self.layout
+        for i in range(len(self.heights)):
+            for prio in self.blocks(i):
+                print("[", layout.block_ids[prio], "/", prio, end="] ")
+            print("stack", layout.stack_ids[i])
+
     def is_solved(self):
-        not any(self.not_empty_stacks())
+        return not any(self.heights)
 
     def not_empty_stacks(self):
-        for stack in self.stacks:
-            if any(stack.blocks):
-                yield stack
-    
+        for (i, height) in enumerate(self.heights):
+            if height > 0:
+                yield i
+
     def not_full_stacks(self):
-        for stack in self.stacks:
-            if len(stack.blocks) < stack.max_height:
-                yield stack
+        max_heights = self.layout.max_heights
+        for (i, height) in enumerate(self.heights):
+            if height < max_heights[i]:
+                yield i
+
+    def most_urgent(self, i):
+        return self.mins[i * self.layout.stride + self.heights[i] - 1]
+
+    def lower_bound(self):
+        # Every block needs one move to the handover and every blocked block
+        # at least one relocation before that.
+        return self.remaining + self.blocked
+
+    def top(self, i):
+        return self.prios[i * self.layout.stride + self.heights[i] - 1]
 
     def apply_move(self, move):
-        result = copy.deepcopy(self)
-        block = result.stacks[move.src].blocks.pop()
-        if move.tgt != self.handover_id:
-            result.stacks[move.tgt].blocks.append(block)
-        result.moves.append(move)
+        layout = self.layout
+        stride = layout.stride
+        prios = self.prios[:]
+        mins = self.mins[:]
+        heights = self.heights[:]
+        blocked = self.blocked
+        remaining = self.remaining
+        src = layout.index[move.src]
+        heights[src] -= 1
+        slot = src * stride + heights[src]
+        prio = prios[slot]
+        if mins[slot] != prio:
+            blocked -= 1
+        prios[slot] = EMPTY
+        mins[slot] = EMPTY
+        keys = layout.zobrist[prio]
+        key = self.key ^ keys[slot]
+        if move.tgt != layout.handover_id:
+            tgt = layout.index[move.tgt]
+            slot = tgt * stride + heights[tgt]
+            prios[slot] = prio
+            mins[slot] = prio
+            if heights[tgt] > 0 and mins[slot - 1] < prio:
+                mins[slot] = mins[slot - 1]
+                blocked += 1
+            key ^= keys[slot]
+            heights[tgt] += 1
+        else:
+            remaining -= 1
+
+        result = BrpState.__new__(BrpState)
+        result.layout = layout
+        result.prios = prios
+        result.mins = mins
+        result.heights = heights
+        result.key = key
+        result.blocked = blocked
+        result.remaining = remaining
+        result.history = (move, self.history)
+        result.depth = self.depth + 1
+        return result
+
+    def with_stacks(self, stacks):
+        # Copy of this state where the stacks in the dict of stack index ->
+        # priorities (bottom to top) are replaced. Only those stacks are
+        # rescanned, the result is a new root without history.
+        layout = self.layout
+        stride = layout.stride
+        zobrist = layout.zobrist
+        prios = self.prios[:]
+        mins = self.mins[:]
+        heights = self.heights[:]
+        key = self.key
+        blocked = self.blocked
+        for (i, blocks) in stacks.items():
+            start = i * stride
+            for slot in range(start, start + heights[i]):
+                key ^= zobrist[prios[slot]][slot]
+                if mins[slot] != prios[slot]:
+                    blocked -= 1
+                prios[slot] = EMPTY
+                mins[slot] = EMPTY
+            for (height, prio) in enumerate(blocks):
+                slot = start + height
+                prios[slot] = prio
+                mins[slot] = prio
+                if height > 0 and mins[slot - 1] < prio:
+                    mins[slot] = mins[slot - 1]
+                    blocked += 1
+                key ^= zobrist[prio][slot]
+            heights[i] = len(blocks)
+
+        result = BrpState.__new__(BrpState)
+        result.layout = layout
+        result.prios = prios
+        result.mins = mins
+        result.heights = heights
+        result.key = key
+        result.blocked = blocked
+        result.remaining = sum(heights)
+        result.history = None
+        result.depth = 0
         return result
 
     def forced_moves(self):
         moves = list()
-        if not any(self.not_empty_stacks()):
+        src = None
+        urgent = None
+        for i in self.not_empty_stacks():
+            prio = self.most_urgent(i)
+            if urgent is None or prio < urgent:
+                src = i
+                urgent = prio
+        if src is None:
             return moves
-        src = min(self.not_empty_stacks(), key= lambda stack: stack.most_urgent().prio)
 
-        urgent = src.most_urgent()
-        top = src.top()
-        if urgent.id == top.id:
-            moves.append( Move(src.id, self.handover_id, top.id))
+        layout = self.layout
+        top = self.top(src)
+        block = layout.block_ids[top]
+        if urgent == top:
+            moves.append(Move(layout.stack_ids[src], layout.handover_id, block))
         else:
             for tgt in self.not_full_stacks():
-                if src.id == tgt.id:
+                # nothing can be put on the production stack
+                if src == tgt or tgt == 0:
                     continue
-                moves.append(Move(src.id, tgt.id, top.id))
+                moves.append(Move(layout.stack_ids[src], layout.stack_ids[tgt], block))
+            if layout.ranks:
+                # the searches expand the last move first
+                ranks = layout.ranks
+                moves.sort(key=lambda move: ranks.get((move.src, move.tgt), len(ranks)), reverse=True)
         return moves
@@ -0,0 +1,460 @@
+import heapq
+import math
+from collections import deque
+import numpy as np
+from hotstorage.hotstorage_model_pb2 import World, Performance
+from hotstorage.hotstorage_settings_pb2 import Settings, TimeSpanScale
+
+# Length of the units of a settings TimeSpan in seconds.
+SCALES = {
+    TimeSpanScale.DAYS: 86400.0,
+    TimeSpanScale.HOURS: 3600.0,
+    TimeSpanScale.MINUTES: 60.0,
+    TimeSpanScale.SECONDS: 1.0,
+    TimeSpanScale.MILLISECONDS: 1e-3,
+    TimeSpanScale.TICKS: 1e-7,
+}
+# Seconds between two world updates, each of them calls the policy, and the
+# time the simulation charges for a policy call.
+UPDATE_INTERVAL = 1.0
+POLICY_TIME = 1e-3
+# Length of the interval lists in World.ObservationData.
+MAX_OBSERVATIONS = 100
+
+PICKUP = 1
+DROPOFF = 2
+
+def load_settings(path):
+    settings = Settings()
+    with open(path, "rb") as f:
+        settings.ParseFromString(f.read())
+    return settings
+
+def seconds(span):
+    if span.scale == TimeSpanScale.MINMAX:
+        return math.copysign(math.inf, span.value) if span.value else 0.0
+    return span.value * SCALES[span.scale]
+
+def stamp(t):
+    # TimeStamp milliseconds of a simulation time in seconds
+    return int(round(t * 1000))
+
+def lognormal(rng, mean, std):
+    # log-normal with the given mean and standard deviation (RandLogNormal2)
+    if std == 0:
+        return mean
+    sigma2 = math.log1p((std / mean) ** 2)
+    return rng.lognormal(math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+
+def triangular(rng, low, high):
+    if low >= high:
+        return low
+    return rng.triangular(low, (low + high) / 2, high)
+
+class Block:
+    __slots__ = ("id", "release", "due", "ready", "delivered")
+
+    def __init__(self, id, release, due):
+        # release and due in milliseconds like in the world
+        self.id = id
+        self.release = release
+        self.due = due
+        self.ready = False
+        self.delivered = False
+
+class Samples:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+class TimeSeries:
+    # Time weighted mean of a value since the start of the simulation.
+    def __init__(self, sim):
+        self.sim = sim
+        self.value = 0.0
+        self.area = 0.0
+        self.since = 0.0
+
+    def update(self, value):
+        self.area += self.value * (self.sim.now - self.since)
+        self.since = self.sim.now
+        self.value = value
+
+    @property
+    def mean(self):
+        if self.sim.now <= 0:
+            return self.value
+        return (self.area + self.value * (self.sim.now - self.since)) / self.sim.now
+
+class Resource:
+    # A resource of capacity one. Processes yield it to wait for it and
+    # release it when they are done, its utilization is a TimeSeries.
+    def __init__(self, sim):
+        self.sim = sim
+        self.busy = False
+        self.waiting = deque()
+        self.utilization = TimeSeries(sim)
+
+    def release(self):
+        if self.waiting:
+            self.sim.schedule(0.0, self.waiting.popleft())
+        else:
+            self.busy = False
+            self.utilization.update(0.0)
+
+class HotstorageSimulation:
+    # The hotstorage simulation of simulation/DynStack.Simulation/HS in
+    # virtual time, to evaluate policies in process without the simulation
+    # runner. Processes are generators that yield a delay in seconds or a
+    # Resource to wait for, like the SimSharp processes they are modeled on.
+    #
+    # `policy` gets the serialized World every UPDATE_INTERVAL and returns a
+    # CraneSchedule or None, e.g. lambda data: hotstorage.plan_moves(data, True).
+    # The random streams are seeded from `seed` (default Settings.Seed) but
+    # differ from the ones of the .NET simulation, runs are alike in
+    # distribution, not in every draw.
+    def __init__(self, settings, policy, seed=None):
+        self.policy = policy
+        self.production_max_height = settings.ProductionMaxHeight
+        self.max_height = settings.BufferMaxHeight
+        self.buffer_count = settings.BufferCount
+        self.handover_id = settings.BufferCount + 1
+        self.duration = seconds(settings.SimulationDuration)
+        self.check_interval = seconds(settings.CheckInterval)
+        self.clear_time = (seconds(settings.MinClearTime), seconds(settings.MaxClearTime))
+        crane = (seconds(settings.CraneMoveTimeMean), seconds(settings.CraneMoveTimeStd))
+        self.crane_time = (crane[0] - crane[1], crane[0] + crane[1])
+        hoist = (seconds(settings.HoistMoveTimeMean), seconds(settings.HoistMoveTimeStd))
+        self.hoist_time = (hoist[0] - hoist[1], hoist[0] + hoist[1])
+        self.due_time = (seconds(settings.DueTimeMean), seconds(settings.DueTimeStd))
+        self.due_time_min = seconds(settings.DueTimeMin)
+        self.ready_factor = (settings.ReadyFactorMin, settings.ReadyFactorMax)
+        self.arrival_time = (seconds(settings.ArrivalTimeMean), seconds(settings.ArrivalTimeStd))
+        self.handover_time = (seconds(settings.HandoverTimeMean), seconds(settings.HandoverTimeStd))
+        seed = settings.Seed if seed is None else seed
+        streams = np.random.SeedSequence(seed).spawn(5)
+        (init_rng, self.crane_rng, self.production_rng, self.handover_rng, self.ready_rng) = [np.random.default_rng(s) for s in streams]
+
+        self.now = 0.0
+        self.queue = []
+        self.events = 0
+        self.block_ids = 0
+        self.production = []
+        self.buffers = [[] for _ in range(self.buffer_count)]
+        self.handover_ready = False
+        self.handover_block = None
+        self.location = 0
+        self.load = None
+        self.girder = 0.0
+        self.hoist = 1.0
+        self.moves = []
+        self.sequence_nr = 0
+        self.last_sequence = -2 ** 31
+        self.invalid_moves = []
+        self.arrival_intervals = deque(maxlen=MAX_OBSERVATIONS)
+        self.crane_move_times = deque(maxlen=MAX_OBSERVATIONS)
+        self.handover_intervals = deque(maxlen=MAX_OBSERVATIONS)
+
+        self.crane_manipulations = 0
+        self.delivered_blocks = 0
+        self.blocks_on_time = 0
+        self.service_level = Samples()
+        self.lead_times = Samples()
+        self.tardiness = Samples()
+        self.buffer_utilization = TimeSeries(self)
+        self.crane = Resource(self)
+        self.handover = Resource(self)
+        self.upstream = Resource(self)
+        self.initialize(settings.InitialNumberOfBlocks, init_rng)
+
+    def initialize(self, count, rng):
+        # InitializeWorldState: `count` blocks released in the past, spread
+        # randomly over the buffers, and one new block on the production stack
+        past = 0.0
+        for _ in range(min(count, self.buffer_count * self.max_height)):
+            past -= lognormal(rng, *self.arrival_time)
+            block = Block(self.new_id(), stamp(past), stamp(past + lognormal(rng, *self.due_time)))
+            while block.due < stamp(self.due_time_min):
+                block.due += stamp(lognormal(rng, *self.due_time))
+            factor = self.ready_factor[0] + rng.random() * (self.ready_factor[1] - self.ready_factor[0])
+            block.ready = block.release + factor * (block.due - block.release) < 0
+            possible = [stack for stack in self.buffers if len(stack) < self.max_height]
+            possible[rng.integers(len(possible))].insert(0, block)
+            self.start(self.block_process(block))
+        self.buffer_utilization.update(self.buffer_fill())
+        self.production.append(Block(self.new_id(), 0, stamp(lognormal(rng, *self.due_time))))
+        self.handover_ready = True
+        self.start(self.block_process(self.production[0]))
+        self.start(self.world_updates())
+
+    def new_id(self):
+        self.block_ids += 1
+        return self.block_ids
+
+    def buffer_fill(self):
+        return sum(len(stack) for stack in self.buffers) / (self.buffer_count * self.max_height)
+
+    def schedule(self, delay, process):
+        self.events += 1
+        heapq.heappush(self.queue, (self.now + delay, self.events, process))
+
+    def start(self, process):
+        self.schedule(0.0, process)
+
+    def step(self, process):
+        try:
+            event = next(process)
+        except StopIteration:
+            return
+        if isinstance(event, Resource):
+            if event.busy:
+                event.waiting.append(process)
+            else:
+                event.busy = True
+                event.utilization.update(1.0)
+                self.schedule(0.0, process)
+        else:
+            self.schedule(event, process)
+
+    def run(self, duration=None):
+        # Runs for `duration` seconds, by default the SimulationDuration of
+        # the settings, and returns the final KPIs.
+        end = self.duration if duration is None else duration
+        self.start(self.order_generator())
+        queue = self.queue
+        while queue and queue[0][0] < end:
+            (self.now, _, process) = heapq.heappop(queue)
+            self.step(process)
+        self.now = end
+        # like the asynchronous simulation the blocks still in the yard only
+        # count towards the tardiness if they are overdue
+        now = stamp(self.now)
+        for block in self.blocks():
+            if block.due < now:
+                self.tardiness.add((now - block.due) / 1000)
+        return self.kpis()
+
+    def blocks(self):
+        stacks = [self.production] + self.buffers + [[self.handover_block, self.load]]
+        return [block for stack in stacks for block in stack if block is not None and not block.delivered]
+
+    def kpis(self):
+        kpis = Performance()
+        kpis.CraneManipulations = self.crane_manipulations
+        kpis.ServiceLevelMean = self.service_level.mean
+        kpis.LeadTimeMean = self.lead_times.mean
+        kpis.DeliveredBlocks = self.delivered_blocks
+        kpis.TotalBlocksOnTime = self.blocks_on_time
+        kpis.BlockedArrivalTime = (1 - self.upstream.utilization.mean) * self.now
+        kpis.TardinessMean = self.tardiness.mean
+        kpis.BufferUtilizationMean = self.buffer_utilization.mean
+        kpis.CraneUtilizationMean = self.crane.utilization.mean
+        kpis.HandoverUtilizationMean = self.handover.utilization.mean
+        kpis.UpstreamUtilizationMean = self.upstream.utilization.mean
+        return kpis
+
+    def world(self):
+        world = World()
+        world.Now.MilliSeconds = stamp(self.now)
+        fill_stack(world.Production, 0, self.production_max_height, self.production)
+        for (i, stack) in enumerate(self.buffers):
+            fill_stack(world.Buffers.add(), i + 1, self.max_height, stack)
+        world.Handover.Id = self.handover_id
+        world.Handover.Ready = self.handover_ready
+        if self.handover_block is not None:
+            fill_block(world.Handover.Block, self.handover_block)
+        crane = world.Crane
+        crane.LocationId = self.location
+        if self.load is not None:
+            fill_block(crane.Load, self.load)
+        crane.Schedule.SequenceNr = self.sequence_nr
+        crane.Schedule.Moves.extend(self.moves)
+        crane.GirderPosition = self.girder
+        crane.HoistPosition = self.hoist
+        world.KPIs.CopyFrom(self.kpis())
+        world.ObservationData.ArrivalIntervals.extend(self.arrival_intervals)
+        world.ObservationData.CraneMoveTimes.extend(self.crane_move_times)
+        world.ObservationData.HandoverReadyIntervals.extend(self.handover_intervals)
+        world.InvalidMoves.extend(self.invalid_moves)
+        return world
+
+    def world_updates(self):
+        while True:
+            schedule = self.policy(self.world().SerializeToString())
+            if schedule is not None:
+                self.start(self.crane_process(schedule))
+            self.invalid_moves.clear()
+            yield UPDATE_INTERVAL
+
+    def order_generator(self):
+        yield self.upstream
+        try:
+            while True:
+                before = self.now
+                yield lognormal(self.production_rng, *self.arrival_time)
+                if len(self.production) >= self.production_max_height:
+                    # the production stack is full, upstream halts until the
+                    # crane takes a block from it
+                    break
+                block = Block(self.new_id(), stamp(self.now), stamp(self.now + lognormal(self.production_rng, *self.due_time)))
+                self.production.insert(0, block)
+                self.start(self.block_process(block))
+                self.arrival_intervals.append(self.now - before)
+        finally:
+            self.upstream.release()
+
+    def block_process(self, block):
+        self.blocks_on_time += 1
+        if not block.ready:
+            factor = self.ready_rng.uniform(*self.ready_factor)
+            timeout = factor * (block.due - block.release) / 1000 - (self.now - block.release / 1000)
+            if timeout > 0:
+                yield timeout
+            block.ready = True
+        until_due = block.due / 1000 - self.now + self.check_interval
+        if until_due > 0:
+            yield until_due
+        if block.delivered:
+            return
+        self.service_level.add(0)
+        self.blocks_on_time -= 1
+
+    def order_completion(self):
+        before = self.now
+        yield self.handover
+        try:
+            block = self.handover_block
+            while not block.ready:
+                yield self.check_interval
+            block.delivered = True
+            now = stamp(self.now)
+            if block.due >= now:
+                self.service_level.add(1)
+                self.tardiness.add(0)
+            else:
+                self.tardiness.add((now - block.due) / 1000)
+            self.lead_times.add((now - block.release) / 1000)
+            self.delivered_blocks += 1
+            yield triangular(self.handover_rng, *self.clear_time)
+            self.handover_block = None
+            self.handover_ready = False
+            yield lognormal(self.handover_rng, *self.handover_time)
+            self.handover_ready = True
+            self.handover_intervals.append(self.now - before)
+        finally:
+            self.handover.release()
+
+    def valid(self, move):
+        # CheckMoveCondition
+        if move.EmptyMove:
+            return True
+        if move.SourceId == 0:
+            source = self.production
+        elif move.SourceId <= self.buffer_count:
+            source = self.buffers[move.SourceId - 1]
+        else:
+            return False
+        if not source or source[-1].id != move.BlockId:
+            return False
+        if move.TargetId == 0:
+            return False
+        if move.TargetId <= self.buffer_count:
+            return len(self.buffers[move.TargetId - 1]) < self.max_height
+        return self.handover_ready and self.handover_block is None and source[-1].ready
+
+    def crane_process(self, schedule):
+        # Carries out a schedule. A newer schedule replaces it after the move
+        # that is under way.
+        yield POLICY_TIME
+        sequence_nr = schedule.SequenceNr
+        if sequence_nr < 0 or sequence_nr < self.last_sequence:
+            return
+        self.last_sequence = sequence_nr
+        yield self.crane
+        try:
+            if sequence_nr < self.last_sequence:
+                return
+            moves = sorted(schedule.Moves, key=lambda move: move.Sequence)
+            if not moves:
+                if self.moves or self.sequence_nr < sequence_nr:
+                    self.moves = []
+                    self.sequence_nr = sequence_nr
+                return
+            self.moves = list(moves)
+            self.sequence_nr = sequence_nr
+            for move in moves:
+                if not self.valid(move):
+                    self.moves.remove(move)
+                    self.invalid_moves.append(move)
+                    continue
+                if move.EmptyMove:
+                    yield from self.move_horizontal(move.TargetId)
+                    self.moves.remove(move)
+                    if sequence_nr < self.last_sequence:
+                        return
+                    continue
+                if self.location != move.SourceId:
+                    yield from self.move_horizontal(move.SourceId)
+                before = self.now
+                source = self.production if move.SourceId == 0 else self.buffers[move.SourceId - 1]
+                yield from self.move_vertical(PICKUP, len(source) - 1, source)
+                if move.SourceId == 0 and not self.upstream.busy:
+                    self.start(self.order_generator())
+                yield from self.move_vertical(None, self.max_height + 1)
+                yield from self.move_horizontal(move.TargetId)
+                if move.TargetId <= self.buffer_count:
+                    target = self.buffers[move.TargetId - 1]
+                    yield from self.move_vertical(DROPOFF, len(target), target)
+                else:
+                    yield from self.move_vertical(DROPOFF, 0 if self.handover_block is None else 1)
+                    self.start(self.order_completion())
+                yield from self.move_vertical(None, self.max_height + 1)
+                self.moves.remove(move)
+                self.crane_move_times.append(self.now - before)
+                if sequence_nr < self.last_sequence:
+                    return
+        finally:
+            self.crane.release()
+
+    def move_horizontal(self, location):
+        to = location / (self.buffer_count + 1)
+        yield triangular(self.crane_rng, *self.crane_time) * abs(to - self.girder)
+        self.girder = to
+        self.location = location
+
+    def move_vertical(self, action, level, stack=None):
+        # `stack` None with DROPOFF drops on the handover
+        to = level / (self.max_height + 1)
+        yield triangular(self.crane_rng, *self.hoist_time) * abs(to - self.hoist)
+        if action == PICKUP:
+            self.load = stack.pop()
+            self.crane_manipulations += 1
+        elif action == DROPOFF:
+            if stack is None:
+                self.handover_block = self.load
+                self.handover_ready = False
+            else:
+                stack.append(self.load)
+            self.load = None
+        self.buffer_utilization.update(self.buffer_fill())
+        self.hoist = to
+
+def fill_block(message, block):
+    message.Id = block.id
+    message.Release.MilliSeconds = block.release
+    message.Due.MilliSeconds = block.due
+    message.Ready = block.ready
+
+def fill_stack(message, id, max_height, blocks):
+    message.Id = id
+    message.MaxHeight = max_height
+    for block in blocks:
+        fill_block(message.BottomToTop.add(), block)
@@ -0,0 +1,47 @@
+import random
+from collections import OrderedDict
+
+def zobrist_keys(prio, slots):
+    # One random 64 bit key per slot for the block with the given priority.
+    # The keys only depend on the priority, so hashes stay comparable between
+    # searches as long as the yard layout does not change.
+    rnd = random.Random(prio)
+    return [rnd.getrandbits(64) for _ in range(slots)]
+
+class TranspositionTable:
+    # Remembers the smallest depth at which each yard configuration was
+    # reached. A state that was already seen with an equal or shorter move
+    # sequence can not lead to a better solution and is pruned. The table is
+    # bounded and evicts the least recently used entry when it is full.
+    def __init__(self, capacity=100000):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def prune(self, state):
+        entries = self.entries
+        depth = entries.get(state.key)
+        if depth is not None:
+            entries.move_to_end(state.key)
+            if depth <= state.depth:
+                self.hits += 1
+                return True
+        self.misses += 1
+        entries[state.key] = state.depth
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return False
+
+    def stats(self):
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,46 @@
+import json
+import logging
+
+# One record per world update is written to this logger at INFO level when
+# tick logging is enabled, e.g. "tick=12 problem=HS seq=13 moves=2 latency_ms=3.1".
+ticks = logging.getLogger("stacking.ticks")
+
+class KeyValueFormatter(logging.Formatter):
+    # Writes a record as one line: level, logger, message and the key=value
+    # pairs given with extra={"fields": {...}}.
+    def format(self, record):
+        line = "{} {} {}".format(record.levelname, record.name, record.getMessage())
+        fields = getattr(record, "fields", None)
+        if fields:
+            line += " " + " ".join("{}={}".format(key, value) for (key, value) in fields.items())
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+class JsonFormatter(logging.Formatter):
+    # Writes a record as one JSON object per line for log collectors.
+    def format(self, record):
+        data = {
+            "time": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        data.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data)
+
+def configure(level="INFO", format="text", tick_log=False):
+    # Disabled levels cost one cached level check per call. World dumps are
+    # only formatted at DEBUG.
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter() if format == "json" else KeyValueFormatter())
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(level)
+    ticks.setLevel(logging.INFO if tick_log else logging.WARNING)
+
+def tick(**fields):
+    if ticks.isEnabledFor(logging.INFO):
+        ticks.info("tick", extra={"fields": fields})
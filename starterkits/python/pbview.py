@@ -0,0 +1,39 @@
+import logging
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+from google.protobuf.internal import api_implementation
+
+log = logging.getLogger(__name__)
+
+def backend():
+    # "upb" or "cpp" for the fast backends, "python" for the pure Python one
+    return api_implementation.Type()
+
+def check_backend(require_fast=False):
+    kind = backend()
+    log.info("protobuf backend %s", kind)
+    if kind == "python":
+        if require_fast:
+            raise SystemExit("the pure Python protobuf backend is active, install protobuf>=4.21 for the upb backend")
+        log.warning("the pure Python protobuf backend is active, parsing worlds will be slow")
+    return kind
+
+def message_view(message_class, skip):
+    # A message class with the same wire format as `message_class` but
+    # without the fields in `skip`. Parsing into it leaves the skipped fields
+    # as unparsed unknown bytes, which for large fields such as the growing
+    # observation data of a world saves most of the parse time. The class
+    # lives in its own descriptor pool, so it does not clash with the
+    # generated one.
+    file = descriptor_pb2.FileDescriptorProto()
+    message_class.DESCRIPTOR.file.CopyToProto(file)
+    for message in file.message_type:
+        if message.name == message_class.DESCRIPTOR.name:
+            fields = [field for field in message.field if field.name not in skip]
+            del message.field[:]
+            message.field.extend(fields)
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file)
+    descriptor = pool.FindMessageTypeByName(message_class.DESCRIPTOR.full_name)
+    if hasattr(message_factory, "GetMessageClass"):
+        return message_factory.GetMessageClass(descriptor)
+    return message_factory.MessageFactory(pool).GetPrototype(descriptor)
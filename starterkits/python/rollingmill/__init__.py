@@ -1,11 +1,47 @@
+import logging
 from rollingmill.rollingmill_model_pb2 import World
 from rollingmill import heuristic
+from rollingmill.scheduling import schedule_moves
+from rollingmill.columns import MillColumns
+from rollingmill.blockindex import BlockIndex
+from rollingmill.programindex import ProgramIndex
+from pbview import message_view
 
-def plan_moves(world_data):
-    print("plan")
-    world = World()
+# The planners never read these fields, they are left unparsed.
+WorldView = message_view(World, ("KPIs", "ObservationData"))
+
+# Where every block is, kept between calls so that each world update only
+# indexes the locations that changed.
+index = BlockIndex()
+
+log = logging.getLogger(__name__)
+
+def plan_moves(world_data, timer=None, engine=None, deadline_ms=None, schedule=False):
+    # `timer` is an optional telemetry.TickTimer that gets a lap for each stage.
+    # Without an `engine` (e.g. a lookahead.LookaheadPlanner) the rule based
+    # heuristic plans. With `schedule` the moves are ordered over both cranes
+    # by scheduling.schedule_moves.
+    log.debug("plan")
+    world = WorldView()
     world.ParseFromString(world_data)
-    plan = heuristic.next_moves(world)
+    columns = MillColumns.from_world(world)
+    if timer is not None:
+        timer.lap("parse")
+    index.update(columns)
+    programs = ProgramIndex(columns)
+    log.debug("index patched=%d rebuilds=%d programs=%d", index.patched, index.rebuilds, len(programs))
+    if timer is not None:
+        timer.lap("build")
+    if engine is None:
+        plan = heuristic.next_moves(world, columns, index, programs)
+    else:
+        plan = engine.next_moves(world, columns, deadline_ms)
+        log.debug("lookahead layers=%d children=%d timed_out=%s", engine.layers, engine.children, engine.timed_out)
+    if schedule and plan.Moves:
+        order = schedule_moves(world, plan, columns)
+        log.debug("schedule %s", order)
     if plan:
         plan.SequenceNr = world.CraneMoves.SequenceNr + 1
-    return plan
\ No newline at end of file
+    if timer is not None:
+        timer.lap("plan")
+    return plan
@@ -0,0 +1,66 @@
+import numpy as np
+
+class BlockIndex:
+    # Location index and level of every block of the yard by block id. It is
+    # kept between world updates: the locations of each new world are
+    # compared one by one with the last world and only the blocks of changed
+    # locations are indexed again. Resolving a block id is a dict lookup.
+    def __init__(self):
+        # block id -> (location index, level)
+        self.where = {}
+        # MillColumns of the last world, compared to find changes
+        self.columns = None
+        self.patched = 0
+        self.rebuilds = 0
+
+    def update(self, columns):
+        last = self.columns
+        self.columns = columns
+        if last is None or not np.array_equal(last.location_ids, columns.location_ids):
+            self.rebuild(columns)
+            return
+        changed = changed_locations(last, columns).tolist()
+        # blocks that left a changed location may have moved to another one,
+        # so all of them are dropped before any are added again
+        for i in changed:
+            for id in last.block_ids[last.offsets[i]:last.offsets[i + 1]].tolist():
+                if self.where.get(id, (None,))[0] == i:
+                    del self.where[id]
+        for i in changed:
+            for (level, id) in enumerate(columns.block_ids[columns.offsets[i]:columns.offsets[i + 1]].tolist()):
+                self.where[id] = (i, level)
+        self.patched = len(changed)
+
+    def rebuild(self, columns):
+        self.where = dict(zip(columns.block_ids.tolist(), zip(columns.location.tolist(), columns.level.tolist())))
+        self.rebuilds += 1
+        self.patched = len(columns.heights)
+
+    def __len__(self):
+        return len(self.where)
+
+    def __contains__(self, id):
+        return id in self.where
+
+    def locate(self, id):
+        # (location index, level) of a block, None if it is in no location
+        return self.where.get(id)
+
+    def find(self, ids):
+        # index into the block arrays of the columns of every block id in
+        # `ids`, -1 for blocks that are in no location
+        if len(ids) == 0:
+            return np.zeros(0, np.int64)
+        places = np.array([self.where.get(id, (-1, 0)) for id in np.asarray(ids).tolist()], np.int64)
+        (location, level) = places.T
+        return np.where(location >= 0, self.columns.offsets[location] + level, -1)
+
+def changed_locations(last, columns):
+    # Indices of the locations whose blocks differ between two worlds with
+    # the same locations: other heights, or another block at some level.
+    differs = columns.heights != last.heights
+    same = ~differs[columns.location]
+    (location, level) = (columns.location[same], columns.level[same])
+    moved = columns.block_ids[same] != last.block_ids[last.offsets[location] + level]
+    differs[location[moved]] = True
+    return np.flatnonzero(differs)
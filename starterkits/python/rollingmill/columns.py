@@ -0,0 +1,52 @@
+import numpy as np
+from rollingmill.rollingmill_model_pb2 import StackTypes
+
+class MillColumns:
+    # The locations of a world as flat numpy arrays. The blocks of location
+    # i are at offsets[i]:offsets[i + 1] of the block arrays, bottom to top,
+    # so all blocks can be searched or scored at once without touching the
+    # protobuf objects again. The move requests are kept the same way.
+    __slots__ = ("now", "location_ids", "types", "mill_types", "girder", "max_heights", "heights", "offsets",
+        "block_ids", "sequence", "mill", "program", "location", "level",
+        "request_blocks", "request_targets", "request_due")
+
+    @staticmethod
+    def from_world(world):
+        locations = world.Locations
+        stacks = [location.Stack.BottomToTop for location in locations]
+        blocks = [block for stack in stacks for block in stack]
+        (m, n) = (len(stacks), len(blocks))
+        columns = MillColumns()
+        columns.now = world.Now.MilliSeconds
+        columns.location_ids = np.fromiter([location.Id for location in locations], np.int32, m)
+        columns.types = np.fromiter([location.Type for location in locations], np.int32, m)
+        columns.mill_types = np.fromiter([location.MillType for location in locations], np.int32, m)
+        columns.girder = np.fromiter([location.GirderPosition for location in locations], np.float64, m)
+        columns.max_heights = np.fromiter([location.MaxHeight for location in locations], np.int32, m)
+        columns.heights = np.fromiter([len(stack) for stack in stacks], np.int32, m)
+        columns.offsets = np.zeros(m + 1, np.int32)
+        np.cumsum(columns.heights, out=columns.offsets[1:])
+        columns.block_ids = np.fromiter([block.Id for block in blocks], np.int32, n)
+        columns.sequence = np.fromiter([block.Sequence for block in blocks], np.int32, n)
+        columns.mill = np.fromiter([block.Type for block in blocks], np.int32, n)
+        columns.program = np.fromiter([block.ProgramId for block in blocks], np.int32, n)
+        # location index and height above the ground of every block
+        columns.location = np.repeat(np.arange(m, dtype=np.int32), columns.heights)
+        columns.level = np.arange(n, dtype=np.int32) - columns.offsets[columns.location]
+        requests = world.MoveRequests
+        columns.request_blocks = np.fromiter([request.BlockId for request in requests], np.int32, len(requests))
+        columns.request_targets = np.fromiter([request.TargetLocationId for request in requests], np.int32, len(requests))
+        columns.request_due = np.fromiter([request.DueDate.MilliSeconds for request in requests], np.int64, len(requests))
+        return columns
+
+    def of_type(self, *types):
+        return np.isin(self.types, types)
+
+    def arrivals(self):
+        return self.types == StackTypes.ArrivalStack
+
+    def buffers(self):
+        return self.of_type(StackTypes.ShuffleBuffer, StackTypes.SortedBuffer)
+
+    def free(self):
+        return self.max_heights - self.heights
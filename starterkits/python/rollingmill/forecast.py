@@ -0,0 +1,50 @@
+import numpy as np
+
+class ArrivalForecast:
+    # The next `horizon` loads of ArrivalsFromSlabYard in the order of their
+    # arrival estimates, and whether the yard can take them. The simulation
+    # unloads a load onto any arrival stack with room for all of it and
+    # otherwise waits, which stalls the slab yard. The shuffle crane then
+    # moves the blocks to the buffers, up to its capacity per move.
+    def __init__(self, world, columns, horizon=3):
+        loads = sorted(world.ArrivalsFromSlabYard, key=lambda arrival: arrival.ArrivalEstimate.MilliSeconds)[:horizon]
+        self.eta = [arrival.ArrivalEstimate.MilliSeconds for arrival in loads]
+        self.sizes = [len(arrival.Load.BottomToTop) for arrival in loads]
+        self.capacity = max(world.ShuffleCrane.CraneCapacity, 1)
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def unloaded(self, arrival_free):
+        # Number of forecast loads that find an arrival stack with room, in
+        # order, if nothing is moved off the arrival stacks in between. Each
+        # load goes on the fullest stack it fits, the best case of the random
+        # choice of the simulation.
+        free = list(arrival_free)
+        for (k, size) in enumerate(self.sizes):
+            fits = [i for (i, room) in enumerate(free) if room >= size]
+            if not fits:
+                return k
+            free[min(fits, key=free.__getitem__)] -= size
+        return len(self.sizes)
+
+    def lots(self, arrival_heights):
+        # sizes of the shuffle crane moves still needed for the blocks on the
+        # arrival stacks and the forecast loads
+        lots = []
+        for height in list(arrival_heights) + self.sizes:
+            (full, rest) = divmod(int(height), self.capacity)
+            lots += [self.capacity] * full + ([rest] if rest else [])
+        return lots
+
+    def fits(self, buffer_free, arrival_heights):
+        # whether the buffers can take all lots, first fit decreasing
+        free = sorted((int(room) for room in buffer_free), reverse=True)
+        for lot in sorted(self.lots(arrival_heights), reverse=True):
+            for (i, room) in enumerate(free):
+                if room >= lot:
+                    free[i] -= lot
+                    break
+            else:
+                return False
+        return True
@@ -1,104 +1,164 @@
+import numpy as np
 from rollingmill.rollingmill_model_pb2 import World, PlannedCraneMoves, StackTypes, MoveType, CraneMove
-
-def next_moves(world):
+from rollingmill.columns import MillColumns
+from rollingmill.blockindex import BlockIndex
+from rollingmill.programindex import ProgramIndex
+from rollingmill.forecast import ArrivalForecast
+
+def next_moves(world, columns=None, index=None, programs=None, forecast=None):
+    if columns is None:
+        columns = MillColumns.from_world(world)
+    if index is None:
+        index = BlockIndex()
+        index.update(columns)
+    if programs is None:
+        programs = ProgramIndex(columns)
+    if forecast is None:
+        forecast = ArrivalForecast(world, columns)
     plan = PlannedCraneMoves()
     if all(mov.RequiredCraneId != world.HandoverCrane.Id for mov in world.CraneMoves.Moves):
-        plan_handover_crane(world, plan)
+        plan_handover_crane(world, plan, columns, index)
     if all(mov.RequiredCraneId != world.ShuffleCrane.Id for mov in world.CraneMoves.Moves):
-        plan_shuffle_crane(world, plan)
+        plan_shuffle_crane(world, plan, columns, programs, forecast)
     return plan
 
-def arrival_stacks(world):
-    return filter(lambda loc: loc.Type==StackTypes.ArrivalStack, world.Locations)
-
-def buffer_stacks(world):
-    return filter(lambda loc: loc.Type==StackTypes.ShuffleBuffer or loc.Type==StackTypes.SortedBuffer, world.Locations)
-
-
-def size_of(location):
-    return len(location.Stack.BottomToTop)
-
-def remaining_capacity(location):
-    return location.MaxHeight - size_of(location)
+def leading_sequence(columns, top, ty, seq):
+    # Number of blocks from the top of a stack down to index `top` that
+    # continue the sequence `seq` of mill type `ty`.
+    below = np.arange(top, top - columns.level[top] - 1, -1)
+    follows = (columns.mill[below] == ty) & (columns.sequence[below] == seq + np.arange(len(below)))
+    return len(below) if follows.all() else int(np.argmin(follows))
 
-def position_of_block_in(loc, block_id):
-    for (pos, block) in enumerate(loc.Stack.BottomToTop):
-        if block.Id == block_id:
-            return pos
-    return None
-
-def plan_handover_crane(world, plan):
+def plan_handover_crane(world, plan, columns, index):
     move_id = len(plan.Moves)
-    source_request = []
-    for req in world.MoveRequests:
-        for src in buffer_stacks(world):
-            pos = position_of_block_in(src, req.BlockId)
-            if pos:
-                source_request.append((src, pos, req))
-            
-    source_request.sort(key = lambda x: size_of(x[0])-x[1])
-    
-    for (src, pos, req) in source_request:
-        block = src.Stack.BottomToTop[pos]
-        ty = block.Type
-        seq = block.Sequence
-        
-        could_take_top_n = 0
-        for block in reversed(src.Stack.BottomToTop):
-            if block.Type == ty and block.Sequence == seq:
-                could_take_top_n += 1
-                seq += 1
-            else:
-                break
+    buffers = columns.buffers()
+    free = columns.free()
+    found = index.find(columns.request_blocks)
+    requests = np.flatnonzero(found >= 0)
+    requests = requests[buffers[columns.location[found[requests]]]]
+    # requests whose block is closest to the top first
+    block = found[requests]
+    depth = columns.heights[columns.location[block]] - columns.level[block]
+    requests = requests[np.argsort(depth, kind="stable")]
+
+    for req in requests.tolist():
+        block = found[req]
+        src = columns.location[block]
+        top = columns.offsets[src + 1] - 1
+        could_take_top_n = leading_sequence(columns, top, columns.mill[block], columns.sequence[block])
 
         mov = CraneMove()
         move_id += 1
         mov.Id = move_id
         mov.Type = MoveType.PickupAndDropoff
         mov.ReleaseTime.MilliSeconds = world.Now.MilliSeconds
-        mov.PickupLocationId = src.Id
+        mov.PickupLocationId = columns.location_ids[src]
 
         if could_take_top_n > 0:
             amount = min(could_take_top_n, world.HandoverCrane.CraneCapacity)
-            mov.DropoffLocationId = req.TargetLocationId
+            mov.DropoffLocationId = columns.request_targets[req]
             mov.RequiredCraneId = world.HandoverCrane.Id
             mov.Amount = amount
         else:
             # Relocate blocks that are in the way
-            must_relocate = size_of(src) - pos - 1
+            must_relocate = top - block
             amount = min(must_relocate, world.HandoverCrane.CraneCapacity)
-            tgt = next((tgt for tgt in buffer_stacks(world) if tgt.Id!=src.Id and remaining_capacity(tgt) >= amount), None)
-            if tgt:
-                mov.DropoffLocationId = tgt.Id;
-                mov.RequiredCraneId = world.HandoverCrane.Id;
-                mov.Amount = amount;
+            targets = np.flatnonzero(buffers & (free >= amount))
+            targets = targets[targets != src]
+            if len(targets) > 0:
+                mov.DropoffLocationId = columns.location_ids[targets[0]]
+                mov.RequiredCraneId = world.HandoverCrane.Id
+                mov.Amount = amount
             else:
                 continue
-        
+
         plan.Moves.append(mov)
-        return  
+        return
 
-def plan_shuffle_crane(world, plan):
+def plan_shuffle_crane(world, plan, columns, programs, forecast):
     dont_use = [loc for mov in plan.Moves for loc in (mov.PickupLocationId, mov.DropoffLocationId) ]
     move_id = len(plan.Moves)
-    src = min(arrival_stacks(world), key = lambda loc: min((block.Sequence for block in loc.Stack.BottomToTop), default=1000000000))
-
-    amount = min(size_of(src), world.ShuffleCrane.CraneCapacity)
-    if amount == 0:
+    arrivals = np.flatnonzero(columns.arrivals())
+    if len(arrivals) == 0:
+        return
+    capacity = world.ShuffleCrane.CraneCapacity
+    free = columns.free()
+    amounts = np.minimum(columns.heights[arrivals], capacity)
+    if not amounts.any():
+        plan_presort(world, plan, columns, programs, forecast, dont_use)
         return
-    tgt = next((tgt for tgt in buffer_stacks(world) if tgt.Id not in dont_use and remaining_capacity(tgt) >= amount), None)
-    if tgt:
+    # The arrival stack with the lowest sequence number on it, unless
+    # clearing another one lets more of the forecast loads unload.
+    lowest = np.full(len(columns.location_ids), 1000000000, np.int64)
+    np.minimum.at(lowest, columns.location, columns.sequence)
+    unloaded = np.array([forecast.unloaded(free[arrivals] + amounts * (arrivals == a)) for a in arrivals])
+    k = np.lexsort((lowest[arrivals], -unloaded, amounts == 0))[0]
+    (src, amount) = (arrivals[k], int(amounts[k]))
+
+    targets = np.flatnonzero(columns.buffers() & (free >= amount) & ~np.isin(columns.location_ids, dont_use))
+    if len(targets) > 0:
+        # keep room in the buffers for the lots of the forecast loads
+        targets = reserve(columns, forecast, targets, src, amount)
+        # the buffer where the lot covers the fewest earlier blocks and best
+        # continues the run on top, the first one of equals
+        top = columns.offsets[src + 1]
+        tgt = targets[np.argmin(programs.target_costs(np.arange(top - amount, top), targets))]
         mov = CraneMove()
         move_id += 1
         mov.Id = move_id
         mov.Type = MoveType.PickupAndDropoff
         mov.ReleaseTime.MilliSeconds = world.Now.MilliSeconds
-        mov.PickupLocationId = src.Id
-        mov.DropoffLocationId = tgt.Id
+        mov.PickupLocationId = columns.location_ids[src]
+        mov.DropoffLocationId = columns.location_ids[tgt]
         mov.RequiredCraneId = world.ShuffleCrane.Id
         mov.Amount = amount
         plan.Moves.append(mov)
         return
+
+def reserve(columns, forecast, targets, src, amount):
+    # The targets after which the buffers can still take all lots still to
+    # come, all targets if none can.
+    buffers = np.flatnonzero(columns.buffers())
+    heights = columns.heights.copy()
+    heights[src] -= amount
+    arrival_heights = heights[columns.arrivals()]
+    keep = []
+    for tgt in targets.tolist():
+        free = columns.max_heights[buffers] - heights[buffers] - amount * (buffers == tgt)
+        keep.append(forecast.fits(free, arrival_heights))
+    keep = np.array(keep, bool)
+    return targets[keep] if keep.any() else targets
+
+def plan_presort(world, plan, columns, programs, forecast, dont_use):
+    # With nothing to unload the shuffle crane moves a top block that covers
+    # an earlier block of its mill to a buffer where it covers none, the one
+    # above the most urgent block first, as long as the buffers keep room for
+    # the forecast loads.
+    buffers = np.flatnonzero(columns.buffers() & ~np.isin(columns.location_ids, dont_use))
+    sources = buffers[columns.heights[buffers] > 0]
+    tops = programs.top[sources]
+    below = programs.lowest[columns.mill[tops], sources]
+    covering = below < columns.sequence[tops]
+    (sources, below) = (sources[covering], below[covering])
+    for src in sources[np.argsort(below, kind="stable")].tolist():
+        targets = buffers[(buffers != src) & (columns.free()[buffers] >= 1)]
+        if len(targets) == 0:
+            return
+        targets = reserve(columns, forecast, targets, src, 1)
+        costs = programs.target_costs([programs.top[src]], targets)
+        # a block that covers nothing costs at most 0
+        if costs.min() > 0:
+            continue
+        mov = CraneMove()
+        mov.Id = len(plan.Moves) + 1
+        mov.Type = MoveType.PickupAndDropoff
+        mov.ReleaseTime.MilliSeconds = world.Now.MilliSeconds
+        mov.PickupLocationId = columns.location_ids[src]
+        mov.DropoffLocationId = columns.location_ids[targets[np.argmin(costs)]]
+        mov.RequiredCraneId = world.ShuffleCrane.Id
+        mov.Amount = 1
+        plan.Moves.append(mov)
+        return
 """
 
 fn plan_handover_crane(world: &World, plan: &mut PlannedCraneMoves) {
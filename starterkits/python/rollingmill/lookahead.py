@@ -0,0 +1,343 @@
+import time
+from rollingmill.rollingmill_model_pb2 import PlannedCraneMoves, CraneMove, MoveType, StackTypes, MillTypes
+
+# Crane and mill timing of the default settings of the rolling mill
+# simulation (RM/SimulationHost.cs), the world does not carry them.
+CRANE_CROSSING = 10.0   # seconds to move the girder across the whole width
+HOIST_CROSSING = 3.0    # seconds to move the hoist across the whole height
+MANIPULATION = 5.0      # seconds per pickup and per dropoff
+BLOCK_INTERVAL = 35.0   # seconds between two blocks rolled by a mill
+WAIT = 10.0             # seconds a crane stays idle if it gets no move
+# rough time of one crane move, for the moves a plan still has to make
+MOVE_TIME = 2 * MANIPULATION + 2 * HOIST_CROSSING + CRANE_CROSSING / 2
+
+# Weights of the plan score, in seconds of mill tardiness. The simulation
+# counts a messup for a wrong block of the right mill and 10 for a block of
+# the other mill.
+MESSUP_WEIGHT = 120.0
+BLOCKED_WEIGHT = 15.0
+ARRIVAL_WEIGHT = 20.0
+
+MILLS = (MillTypes.A, MillTypes.B)
+(HANDOVER_CRANE, SHUFFLE_CRANE) = (0, 1)
+
+class Yard:
+    # What does not change while planning: the locations, the blocks and
+    # the cranes as plain lists indexed like the columns.
+    def __init__(self, world, columns):
+        self.now = columns.now / 1000
+        self.girder = columns.girder.tolist()
+        self.max_heights = columns.max_heights.tolist()
+        self.sequence = columns.sequence.tolist()
+        self.mill = columns.mill.tolist()
+        self.width = world.Width or max(self.girder) + 1
+        self.height = world.Height or max(self.max_heights)
+        types = columns.types.tolist()
+        mill_types = columns.mill_types.tolist()
+        self.arrivals = [i for (i, ty) in enumerate(types) if ty == StackTypes.ArrivalStack]
+        self.buffers = [i for (i, ty) in enumerate(types) if ty in (StackTypes.ShuffleBuffer, StackTypes.SortedBuffer)]
+        self.handover = {}
+        for (i, ty) in enumerate(types):
+            if ty == StackTypes.HandoverStack:
+                self.handover.setdefault(mill_types[i], i)
+        self.mill_of = {i: m for (m, i) in self.handover.items()}
+        cranes = (world.HandoverCrane, world.ShuffleCrane)
+        self.crane_ids = [crane.Id for crane in cranes]
+        self.capacity = [max(crane.CraneCapacity, 1) for crane in cranes]
+        self.crane_width = [crane.Width for crane in cranes]
+        # locations touched by moves that are still pending are left alone
+        busy = {location for mov in world.CraneMoves.Moves for location in (mov.PickupLocationId, mov.DropoffLocationId)}
+        ids = columns.location_ids.tolist()
+        # like the rule based solver, a crane with a pending move gets no
+        # new one and reaches nothing
+        working = {mov.RequiredCraneId for mov in world.CraneMoves.Moves}
+        self.reach = []
+        for crane in cranes:
+            (low, high) = (crane.MinPosition, crane.MaxPosition)
+            if high <= low:
+                (low, high) = (float("-inf"), float("inf"))
+            if crane.Id in working:
+                self.reach.append(set())
+                continue
+            self.reach.append({i for (i, g) in enumerate(self.girder) if low <= g <= high and ids[i] not in busy})
+        # new moves get ids above the pending ones
+        self.last_id = max((mov.Id for mov in world.CraneMoves.Moves), default=0)
+
+    def duration(self, crane_position, src, tgt, src_height, tgt_height):
+        # Girder travel to the pickup and to the dropoff, the hoist down to
+        # both stacks and back up, and both manipulations.
+        g = self.girder
+        girder = (abs(crane_position - g[src]) + abs(g[src] - g[tgt])) * CRANE_CROSSING / self.width
+        hoist = 2 * (2 * self.height - src_height - tgt_height) * HOIST_CROSSING / self.height
+        return girder + max(hoist, 0.0) + 2 * MANIPULATION
+
+    def span(self, crane_position, move):
+        if move is None:
+            return None
+        positions = (crane_position, self.girder[move[0]], self.girder[move[1]])
+        return (min(positions), max(positions))
+
+class Plan:
+    # A yard after some joint moves. `cranes` holds the girder position and
+    # the time each crane is free again, `mills` the next sequence number,
+    # the time the mill wants that block and the times the blocks on its
+    # handover stack get rolled.
+    __slots__ = ("stacks", "cranes", "mills", "tardiness", "messups", "first", "score")
+
+    def __init__(self, stacks, cranes, mills, tardiness=0.0, messups=0, first=None):
+        self.stacks = stacks
+        self.cranes = cranes
+        self.mills = mills
+        self.tardiness = tardiness
+        self.messups = messups
+        self.first = first
+        self.score = 0.0
+
+    def key(self):
+        return (self.stacks, tuple(mill[0] for mill in self.mills))
+
+class LookaheadPlanner:
+    # Beam search over joint moves of the handover crane and the shuffle
+    # crane. Every layer gives both cranes their next move, each pair of
+    # candidates (waiting included) that does not touch the same location is
+    # one child, and the `width` best distinct yards are kept. Moves whose
+    # girder ranges come closer than the crane widths run one after the
+    # other. Plans are scored by the predicted mill tardiness, messups,
+    # blocked blocks and blocks left on arrival stacks. Only the first pair
+    # of the best plan is sent, the next world update plans again.
+    def __init__(self, width=16, depth=3, targets=2):
+        self.width = width
+        self.depth = depth
+        self.targets = targets
+        self.layers = 0
+        self.children = 0
+        self.timed_out = False
+        self.blocked = {}
+
+    def next_moves(self, world, columns, deadline_ms=None):
+        start = time.perf_counter()
+        deadline = None if deadline_ms is None else start + deadline_ms / 1000
+        yard = Yard(world, columns)
+        self.blocked = {}
+        beam = [self.initial(world, columns, yard)]
+        (self.layers, self.children, self.timed_out) = (0, 0, False)
+        for depth in range(self.depth):
+            layer = {}
+            for plan in beam:
+                if depth > 0 and deadline is not None and time.perf_counter() >= deadline:
+                    self.timed_out = True
+                    break
+                for child in self.expand(yard, plan):
+                    self.children += 1
+                    key = child.key()
+                    if key not in layer or child.score < layer[key].score:
+                        layer[key] = child
+            if self.timed_out:
+                break
+            beam = sorted(layer.values(), key=lambda plan: plan.score)[:self.width]
+            self.layers += 1
+        plan = PlannedCraneMoves()
+        if beam and beam[0].first is not None:
+            for (crane, move) in enumerate(beam[0].first):
+                if move is not None:
+                    append_move(plan, world, yard, crane, move)
+        return plan
+
+    def initial(self, world, columns, yard):
+        offsets = columns.offsets.tolist()
+        stacks = [tuple(range(offsets[i], offsets[i + 1])) for i in range(len(yard.girder))]
+        due = {}
+        found = dict(zip(columns.block_ids.tolist(), range(len(yard.mill))))
+        for (block, due_ms) in zip(columns.request_blocks.tolist(), columns.request_due.tolist()):
+            if block in found:
+                due[yard.mill[found[block]]] = due_ms / 1000
+        mills = []
+        for m in MILLS:
+            on_handover = stacks[yard.handover[m]] if m in yard.handover else ()
+            queue = tuple(yard.now + k * BLOCK_INTERVAL for k in range(len(on_handover)))
+            next_seq = max((yard.sequence[b] for b in on_handover), default=0) + 1
+            ready = due.get(m, yard.now + (len(on_handover) + 1) * BLOCK_INTERVAL)
+            mills.append((next_seq, ready, queue))
+        for i in yard.handover.values():
+            stacks[i] = ()
+        cranes = []
+        for crane in (world.HandoverCrane, world.ShuffleCrane):
+            free = yard.now
+            for mov in world.CraneMoves.Moves:
+                if mov.RequiredCraneId == crane.Id:
+                    free += 2 * MANIPULATION + CRANE_CROSSING / 2
+            cranes.append((crane.GirderPosition, free))
+        plan = Plan(tuple(stacks), tuple(cranes), tuple(mills))
+        plan.score = self.score(yard, plan)
+        return plan
+
+    def expand(self, yard, plan):
+        first = plan.first is None
+        for hmove in self.handover_moves(yard, plan):
+            for smove in self.shuffle_moves(yard, plan):
+                if hmove is not None and smove is not None and set(hmove[:2]) & set(smove[:2]):
+                    continue
+                child = self.step(yard, plan, hmove, smove)
+                if first:
+                    child.first = (hmove, smove)
+                child.score = self.score(yard, child)
+                yield child
+
+    def locate(self, yard, plan, m):
+        # location and level of the next block of mill `m`, None if it is not
+        # in the yard
+        seq = plan.mills[m][0]
+        for i in yard.buffers + yard.arrivals:
+            for (level, b) in enumerate(plan.stacks[i]):
+                if yard.mill[b] == m and yard.sequence[b] == seq:
+                    return (i, level)
+        return None
+
+    def handover_moves(self, yard, plan):
+        moves = [None]
+        (stacks, reach, capacity) = (plan.stacks, yard.reach[HANDOVER_CRANE], yard.capacity[HANDOVER_CRANE])
+        free_at = plan.cranes[HANDOVER_CRANE][1]
+        for m in MILLS:
+            place = self.locate(yard, plan, m)
+            if place is None or place[0] not in reach or m not in yard.handover:
+                continue
+            (src, level) = place
+            stack = stacks[src]
+            if level == len(stack) - 1:
+                seq = plan.mills[m][0]
+                run = 0
+                for b in reversed(stack):
+                    if yard.mill[b] != m or yard.sequence[b] != seq + run:
+                        break
+                    run += 1
+                handover = yard.handover[m]
+                room = yard.max_heights[handover] - sum(1 for t in plan.mills[m][2] if t > free_at)
+                amount = min(run, capacity, room)
+                if amount > 0 and handover in reach:
+                    moves.append((src, handover, amount))
+            else:
+                amount = min(len(stack) - 1 - level, capacity)
+                moves.extend((src, tgt, amount) for tgt in self.choose_targets(yard, stacks, src, amount, reach))
+        return moves
+
+    def shuffle_moves(self, yard, plan):
+        moves = [None]
+        (stacks, reach, capacity) = (plan.stacks, yard.reach[SHUFFLE_CRANE], yard.capacity[SHUFFLE_CRANE])
+        for src in yard.arrivals:
+            if stacks[src] and src in reach:
+                amount = min(len(stacks[src]), capacity)
+                moves.extend((src, tgt, amount) for tgt in self.choose_targets(yard, stacks, src, amount, reach))
+        # the shuffle crane also digs out the next blocks it can reach
+        for m in MILLS:
+            place = self.locate(yard, plan, m)
+            if place is None or place[0] not in reach or place[0] in yard.arrivals:
+                continue
+            (src, level) = place
+            amount = min(len(stacks[src]) - 1 - level, capacity)
+            if amount > 0:
+                moves.extend((src, tgt, amount) for tgt in self.choose_targets(yard, stacks, src, amount, reach))
+        return moves
+
+    def choose_targets(self, yard, stacks, src, amount, reach):
+        # The buffers with room for the top `amount` blocks of `src`, those
+        # where the blocks do not cover a block that is rolled earlier
+        # first, then the lower ones.
+        moved = max(yard.sequence[b] for b in stacks[src][-amount:])
+        targets = []
+        for tgt in yard.buffers:
+            if tgt == src or tgt not in reach or len(stacks[tgt]) + amount > yard.max_heights[tgt]:
+                continue
+            covers = any(yard.sequence[b] < moved for b in stacks[tgt])
+            targets.append((covers, len(stacks[tgt]), tgt))
+        targets.sort()
+        return [tgt for (_, _, tgt) in targets[:self.targets]]
+
+    def step(self, yard, plan, hmove, smove):
+        stacks = list(plan.stacks)
+        mills = list(plan.mills)
+        (tardiness, messups) = (plan.tardiness, plan.messups)
+        ((hpos, hfree), (spos, sfree)) = plan.cranes
+        hend = hfree + (WAIT if hmove is None else yard.duration(hpos, hmove[0], hmove[1], len(stacks[hmove[0]]), len(stacks[hmove[1]])))
+        send = sfree + (WAIT if smove is None else yard.duration(spos, smove[0], smove[1], len(stacks[smove[0]]), len(stacks[smove[1]])))
+        (hspan, sspan) = (yard.span(hpos, hmove), yard.span(spos, smove))
+        # the shuffle crane works left of the handover crane, if the moves
+        # come too close the crane that starts later waits for the other one
+        if hspan is not None and sspan is not None:
+            gap = (yard.crane_width[HANDOVER_CRANE] + yard.crane_width[SHUFFLE_CRANE]) / 2
+            if sspan[1] + gap > hspan[0]:
+                if hfree <= sfree:
+                    send += max(hend - sfree, 0.0)
+                else:
+                    hend += max(send - hfree, 0.0)
+        cranes = [(hpos, hend), (spos, send)]
+        for (c, move, end) in ((HANDOVER_CRANE, hmove, hend), (SHUFFLE_CRANE, smove, send)):
+            if move is None:
+                continue
+            (src, tgt, amount) = move
+            stack = stacks[src]
+            (stacks[src], lifted) = (stack[:-amount], stack[-amount:])
+            cranes[c] = (yard.girder[tgt], end)
+            m = yard.mill_of.get(tgt)
+            if m is None:
+                stacks[tgt] = stacks[tgt] + lifted
+                continue
+            # the mill rolls the delivered blocks from the top down
+            (next_seq, ready, queue) = mills[m]
+            queue = tuple(t for t in queue if t > end)
+            for b in reversed(lifted):
+                if yard.mill[b] != m:
+                    messups += 10
+                    continue
+                if yard.sequence[b] != next_seq:
+                    messups += 1
+                    continue
+                rolled = max(end, ready)
+                tardiness += rolled - ready
+                (next_seq, ready, queue) = (next_seq + 1, rolled + BLOCK_INTERVAL, queue + (rolled,))
+            mills[m] = (next_seq, ready, queue)
+        return Plan(tuple(stacks), tuple(cranes), tuple(mills), tardiness, messups, plan.first)
+
+    def score(self, yard, plan):
+        # Tardiness so far plus a bound of the tardiness of the next block of
+        # each mill: the cranes need a move per `capacity` blocks above it
+        # and one to deliver it once both of them are done.
+        end = max(free for (_, free) in plan.cranes)
+        waiting = 0.0
+        for m in MILLS:
+            place = self.locate(yard, plan, m)
+            if place is None:
+                continue
+            (src, level) = place
+            above = len(plan.stacks[src]) - 1 - level
+            moves = 1 + -(-above // yard.capacity[HANDOVER_CRANE]) + (src in yard.arrivals)
+            waiting += max(end + moves * MOVE_TIME - plan.mills[m][1], 0.0)
+        blocked = sum(self.count_blocked(yard, plan.stacks[i]) for i in yard.buffers)
+        arriving = sum(len(plan.stacks[i]) for i in yard.arrivals)
+        return plan.tardiness + waiting + MESSUP_WEIGHT * plan.messups + BLOCKED_WEIGHT * blocked + ARRIVAL_WEIGHT * arriving
+
+    def count_blocked(self, yard, stack):
+        # blocks above a block of their mill with a lower sequence number,
+        # the stacks of all plans share their tuples so the counts are cached
+        count = self.blocked.get(stack)
+        if count is None:
+            (count, lowest) = (0, {})
+            for b in stack:
+                (m, seq) = (yard.mill[b], yard.sequence[b])
+                if m in lowest and lowest[m] < seq:
+                    count += 1
+                else:
+                    lowest[m] = seq
+            self.blocked[stack] = count
+        return count
+
+def append_move(plan, world, yard, crane, move):
+    (src, tgt, amount) = move
+    mov = CraneMove()
+    mov.Id = yard.last_id + len(plan.Moves) + 1
+    mov.Type = MoveType.PickupAndDropoff
+    mov.ReleaseTime.MilliSeconds = world.Now.MilliSeconds
+    mov.PickupLocationId = world.Locations[src].Id
+    mov.DropoffLocationId = world.Locations[tgt].Id
+    mov.RequiredCraneId = yard.crane_ids[crane]
+    mov.Amount = amount
+    plan.Moves.append(mov)
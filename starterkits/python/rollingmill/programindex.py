@@ -0,0 +1,67 @@
+import numpy as np
+from rollingmill.rollingmill_model_pb2 import MillTypes
+
+# Cost of a shuffle target per block put above an earlier block of its mill,
+# and the bonus for putting a block on the block that follows it in its
+# program or on any block of its program.
+COVER_COST = 10.0
+CONTINUE_BONUS = 3.0
+PROGRAM_BONUS = 1.0
+
+MILLS = (MillTypes.A, MillTypes.B)
+
+class ProgramIndex:
+    # The blocks of every rolling program in sequence order and per location
+    # the lowest sequence number of each mill and the top block, built from
+    # the MillColumns of one world. It answers for a lot of blocks and all
+    # candidate targets at once how many blocks the lot would cover and
+    # whether it continues the run on top of the target.
+    def __init__(self, columns):
+        self.columns = columns
+        m = len(columns.location_ids)
+        # blocks by mill, program and sequence, the blocks of (mill, program)
+        # are order[start:end]
+        self.order = np.lexsort((columns.sequence, columns.program, columns.mill))
+        keys = np.stack((columns.mill[self.order], columns.program[self.order]), axis=1)
+        bounds = np.flatnonzero(np.any(np.diff(keys, axis=0) != 0, axis=1)) + 1
+        starts = np.concatenate(([0], bounds)).tolist()
+        ends = np.concatenate((bounds, [len(self.order)])).tolist()
+        self.programs = {(int(keys[s, 0]), int(keys[s, 1])): (s, e) for (s, e) in zip(starts, ends)} if len(keys) else {}
+        # blocks above every block
+        self.depth = columns.heights[columns.location] - columns.level - 1
+        # lowest sequence number of each mill per location
+        self.lowest = np.full((len(MILLS), m), np.iinfo(np.int32).max, np.int64)
+        for mill in MILLS:
+            own = columns.mill == mill
+            np.minimum.at(self.lowest[mill], columns.location[own], columns.sequence[own])
+        # top block per location, -1 for empty ones
+        self.top = np.where(columns.heights > 0, columns.offsets[1:] - 1, -1)
+
+    def __len__(self):
+        return len(self.programs)
+
+    def blocks(self, mill, program):
+        # block indices of a program in sequence order
+        (start, end) = self.programs.get((mill, program), (0, 0))
+        return self.order[start:end]
+
+    def buried(self, mill, program):
+        # blocks above the blocks of a program, location and depth of each
+        blocks = self.blocks(mill, program)
+        return (self.columns.location[blocks], self.depth[blocks])
+
+    def target_costs(self, lot, targets):
+        # Cost of putting the blocks `lot` (bottom to top, as they come off
+        # the source) on each of the locations `targets`, lower is better:
+        # every block that lands above an earlier block of its mill costs,
+        # a lot whose bottom block is the one before the top of the target,
+        # or of the same program, is cheaper.
+        c = self.columns
+        lot = np.asarray(lot)
+        covers = (self.lowest[c.mill[lot][:, None], targets[None, :]] < c.sequence[lot][:, None]).sum(axis=0)
+        bottom = lot[0]
+        top = self.top[targets]
+        same_mill = (top >= 0) & (c.mill[top] == c.mill[bottom])
+        continues = same_mill & (c.sequence[top] == c.sequence[bottom] + 1)
+        same_program = same_mill & (c.program[top] == c.program[bottom])
+        return COVER_COST * covers - CONTINUE_BONUS * continues - PROGRAM_BONUS * same_program
@@ -2,10 +2,9 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: rollingmill_model.proto
 """Generated protocol buffer code."""
-from google.protobuf.internal import enum_type_wrapper
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
@@ -14,1134 +13,53 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='rollingmill_model.proto',
-  package='DynStacking.RollingMill.DataModel',
-  syntax='proto3',
-  serialized_options=None,
-  create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\x17rollingmill_model.proto\x12!DynStacking.RollingMill.DataModel\"\x99\x01\n\x07\x41rrival\x12\x0f\n\x07Vehicle\x18\x01 \x01(\x05\x12\x36\n\x04Load\x18\x02 \x01(\x0b\x32(.DynStacking.RollingMill.DataModel.Stack\x12\x45\n\x0f\x41rrivalEstimate\x18\x03 \x01(\x0b\x32,.DynStacking.RollingMill.DataModel.TimeStamp\"\xc3\x01\n\x05\x42lock\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x10\n\x08Sequence\x18\x02 \x01(\x05\x12:\n\x04Type\x18\x03 \x01(\x0e\x32,.DynStacking.RollingMill.DataModel.MillTypes\x12\x11\n\tProgramId\x18\x04 \x01(\x05\x12=\n\x07\x41rrived\x18\x05 \x01(\x0b\x32,.DynStacking.RollingMill.DataModel.TimeStamp\x12\x0e\n\x06Rolled\x18\x06 \x01(\x08\"\xc7\x01\n\x05\x43rane\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x36\n\x04Load\x18\x02 \x01(\x0b\x32(.DynStacking.RollingMill.DataModel.Stack\x12\x16\n\x0eGirderPosition\x18\x03 \x01(\x01\x12\x12\n\nHoistLevel\x18\x04 \x01(\x01\x12\x15\n\rCraneCapacity\x18\x05 \x01(\x05\x12\r\n\x05Width\x18\x06 \x01(\x01\x12\x13\n\x0bMinPosition\x18\x07 \x01(\x01\x12\x13\n\x0bMaxPosition\x18\x08 \x01(\x01\"\xd6\x02\n\tCraneMove\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x39\n\x04Type\x18\x02 \x01(\x0e\x32+.DynStacking.RollingMill.DataModel.MoveType\x12\x18\n\x10PickupLocationId\x18\x03 \x01(\x05\x12\x19\n\x11\x44ropoffLocationId\x18\x04 \x01(\x05\x12\x0e\n\x06\x41mount\x18\x07 \x01(\x05\x12\x41\n\x0bReleaseTime\x18\x08 \x01(\x0b\x32,.DynStacking.RollingMill.DataModel.TimeStamp\x12=\n\x07\x44ueDate\x18\t \x01(\x0b\x32,.DynStacking.RollingMill.DataModel.TimeStamp\x12\x17\n\x0fRequiredCraneId\x18\n \x01(\x05\x12\"\n\x16ProtobufPredecessorIds\x18\x0b \x03(\x05\x42\x02\x10\x00\"q\n\rCraneSchedule\x12\x12\n\nScheduleNr\x18\x01 \x01(\x05\x12L\n\nActivities\x18\x02 \x03(\x0b\x32\x38.DynStacking.RollingMill.DataModel.CraneScheduleActivity\"J\n\x15\x43raneScheduleActivity\x12\x0e\n\x06MoveId\x18\x01 \x01(\x05\x12\x0f\n\x07\x43raneId\x18\x02 \x01(\x05\x12\x10\n\x08Priority\x18\x03 \x01(\x05\"\xf7\x01\n\x08Location\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x16\n\x0eGirderPosition\x18\x02 \x01(\x01\x12\x11\n\tMaxHeight\x18\x03 \x01(\x05\x12\x37\n\x05Stack\x18\x04 \x01(\x0b\x32(.DynStacking.RollingMill.DataModel.Stack\x12;\n\x04Type\x18\x05 \x01(\x0e\x32-.DynStacking.RollingMill.DataModel.StackTypes\x12>\n\x08MillType\x18\x06 \x01(\x0e\x32,.DynStacking.RollingMill.DataModel.MillTypes\"\x83\x01\n\x0bMoveRequest\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x18\n\x10TargetLocationId\x18\x02 \x01(\x05\x12\x0f\n\x07\x42lockId\x18\x03 \x01(\x05\x12=\n\x07\x44ueDate\x18\x04 \x01(\x0b\x32,.DynStacking.RollingMill.DataModel.TimeStamp\"\xae\x03\n\x0bPerformance\x12\x1a\n\x12\x43raneManipulations\x18\x01 \x01(\x05\x12\x18\n\x10ServiceLevelMean\x18\x02 \x01(\x01\x12\x14\n\x0cLeadTimeMean\x18\x03 \x01(\x01\x12\x17\n\x0f\x44\x65liveredBlocks\x18\x04 \x01(\x05\x12\x19\n\x11TotalBlocksOnTime\x18\x05 \x01(\x05\x12\x15\n\rTardinessMean\x18\x06 \x01(\x01\x12$\n\x1cShuffleBufferUtilizationMean\x18\x07 \x01(\x01\x12#\n\x1bSortedBufferUtilizationMean\x18\x08 \x01(\x01\x12#\n\x1bShuffleCraneUtilizationMean\x18\t \x01(\x01\x12$\n\x1cHandoverCraneUtilizationMean\x18\n \x01(\x01\x12\x1c\n\x14MillAUtilizationMean\x18\x0b \x01(\x01\x12\x1c\n\x14MillBUtilizationMean\x18\x0c \x01(\x01\x12\x1d\n\x15RollingProgramMessups\x18\r \x01(\x05\x12\x17\n\x0f\x42lockedMillTime\x18\x0e \x01(\x01\"d\n\x11PlannedCraneMoves\x12\x12\n\nSequenceNr\x18\x01 \x01(\x05\x12;\n\x05Moves\x18\x02 \x03(\x0b\x32,.DynStacking.RollingMill.DataModel.CraneMove\"F\n\x05Stack\x12=\n\x0b\x42ottomToTop\x18\x01 \x03(\x0b\x32(.DynStacking.RollingMill.DataModel.Block\"!\n\tTimeStamp\x12\x14\n\x0cMilliSeconds\x18\x01 \x01(\x03\"i\n\rUncertainties\x12\x1c\n\x10\x41rrivalIntervals\x18\x01 \x03(\x01\x42\x02\x10\x00\x12\x1a\n\x0e\x43raneMoveTimes\x18\x02 \x03(\x01\x42\x02\x10\x00\x12\x1e\n\x12MillBlockIntervals\x18\x03 \x03(\x01\x42\x02\x10\x00\"\x92\x06\n\x05World\x12\x39\n\x03Now\x18\x01 \x01(\x0b\x32,.DynStacking.RollingMill.DataModel.TimeStamp\x12\x0e\n\x06Height\x18\x02 \x01(\x05\x12\r\n\x05Width\x18\x03 \x01(\x01\x12>\n\tLocations\x18\x04 \x03(\x0b\x32+.DynStacking.RollingMill.DataModel.Location\x12\x42\n\x10\x42locksAtSlabYard\x18\x05 \x03(\x0b\x32(.DynStacking.RollingMill.DataModel.Block\x12H\n\x14\x41rrivalsFromSlabYard\x18\x06 \x03(\x0b\x32*.DynStacking.RollingMill.DataModel.Arrival\x12H\n\nCraneMoves\x18\x07 \x01(\x0b\x32\x34.DynStacking.RollingMill.DataModel.PlannedCraneMoves\x12\x44\n\x0cMoveRequests\x18\x08 \x03(\x0b\x32..DynStacking.RollingMill.DataModel.MoveRequest\x12G\n\rCraneSchedule\x18\t \x01(\x0b\x32\x30.DynStacking.RollingMill.DataModel.CraneSchedule\x12>\n\x0cShuffleCrane\x18\n \x01(\x0b\x32(.DynStacking.RollingMill.DataModel.Crane\x12?\n\rHandoverCrane\x18\x0b \x01(\x0b\x32(.DynStacking.RollingMill.DataModel.Crane\x12<\n\x04KPIs\x18\x0c \x01(\x0b\x32..DynStacking.RollingMill.DataModel.Performance\x12I\n\x0fObservationData\x18\r \x01(\x0b\x32\x30.DynStacking.RollingMill.DataModel.Uncertainties*\x19\n\tMillTypes\x12\x05\n\x01\x41\x10\x00\x12\x05\n\x01\x42\x10\x01*2\n\x08MoveType\x12\x10\n\x0cMoveToPickup\x10\x00\x12\x14\n\x10PickupAndDropoff\x10\x01*V\n\nStackTypes\x12\x10\n\x0c\x41rrivalStack\x10\x00\x12\x11\n\rShuffleBuffer\x10\x01\x12\x10\n\x0cSortedBuffer\x10\x02\x12\x11\n\rHandoverStack\x10\x03\x62\x06proto3'
-)
-
-_MILLTYPES = _descriptor.EnumDescriptor(
-  name='MillTypes',
-  full_name='DynStacking.RollingMill.DataModel.MillTypes',
-  filename=None,
-  file=DESCRIPTOR,
-  create_key=_descriptor._internal_create_key,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='A', index=0, number=0,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='B', index=1, number=1,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=3076,
-  serialized_end=3101,
-)
-_sym_db.RegisterEnumDescriptor(_MILLTYPES)
-
-MillTypes = enum_type_wrapper.EnumTypeWrapper(_MILLTYPES)
-_MOVETYPE = _descriptor.EnumDescriptor(
-  name='MoveType',
-  full_name='DynStacking.RollingMill.DataModel.MoveType',
-  filename=None,
-  file=DESCRIPTOR,
-  create_key=_descriptor._internal_create_key,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='MoveToPickup', index=0, number=0,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='PickupAndDropoff', index=1, number=1,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=3103,
-  serialized_end=3153,
-)
-_sym_db.RegisterEnumDescriptor(_MOVETYPE)
-
-MoveType = enum_type_wrapper.EnumTypeWrapper(_MOVETYPE)
-_STACKTYPES = _descriptor.EnumDescriptor(
-  name='StackTypes',
-  full_name='DynStacking.RollingMill.DataModel.StackTypes',
-  filename=None,
-  file=DESCRIPTOR,
-  create_key=_descriptor._internal_create_key,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='ArrivalStack', index=0, number=0,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='ShuffleBuffer', index=1, number=1,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='SortedBuffer', index=2, number=2,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='HandoverStack', index=3, number=3,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=3155,
-  serialized_end=3241,
-)
-_sym_db.RegisterEnumDescriptor(_STACKTYPES)
-
-StackTypes = enum_type_wrapper.EnumTypeWrapper(_STACKTYPES)
-A = 0
-B = 1
-MoveToPickup = 0
-PickupAndDropoff = 1
-ArrivalStack = 0
-ShuffleBuffer = 1
-SortedBuffer = 2
-HandoverStack = 3
-
-
-
-_ARRIVAL = _descriptor.Descriptor(
-  name='Arrival',
-  full_name='DynStacking.RollingMill.DataModel.Arrival',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Vehicle', full_name='DynStacking.RollingMill.DataModel.Arrival.Vehicle', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Load', full_name='DynStacking.RollingMill.DataModel.Arrival.Load', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ArrivalEstimate', full_name='DynStacking.RollingMill.DataModel.Arrival.ArrivalEstimate', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=63,
-  serialized_end=216,
-)
-
-
-_BLOCK = _descriptor.Descriptor(
-  name='Block',
-  full_name='DynStacking.RollingMill.DataModel.Block',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Id', full_name='DynStacking.RollingMill.DataModel.Block.Id', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Sequence', full_name='DynStacking.RollingMill.DataModel.Block.Sequence', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Type', full_name='DynStacking.RollingMill.DataModel.Block.Type', index=2,
-      number=3, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ProgramId', full_name='DynStacking.RollingMill.DataModel.Block.ProgramId', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Arrived', full_name='DynStacking.RollingMill.DataModel.Block.Arrived', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Rolled', full_name='DynStacking.RollingMill.DataModel.Block.Rolled', index=5,
-      number=6, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=219,
-  serialized_end=414,
-)
-
-
-_CRANE = _descriptor.Descriptor(
-  name='Crane',
-  full_name='DynStacking.RollingMill.DataModel.Crane',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Id', full_name='DynStacking.RollingMill.DataModel.Crane.Id', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Load', full_name='DynStacking.RollingMill.DataModel.Crane.Load', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='GirderPosition', full_name='DynStacking.RollingMill.DataModel.Crane.GirderPosition', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='HoistLevel', full_name='DynStacking.RollingMill.DataModel.Crane.HoistLevel', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='CraneCapacity', full_name='DynStacking.RollingMill.DataModel.Crane.CraneCapacity', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Width', full_name='DynStacking.RollingMill.DataModel.Crane.Width', index=5,
-      number=6, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='MinPosition', full_name='DynStacking.RollingMill.DataModel.Crane.MinPosition', index=6,
-      number=7, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='MaxPosition', full_name='DynStacking.RollingMill.DataModel.Crane.MaxPosition', index=7,
-      number=8, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=417,
-  serialized_end=616,
-)
-
-
-_CRANEMOVE = _descriptor.Descriptor(
-  name='CraneMove',
-  full_name='DynStacking.RollingMill.DataModel.CraneMove',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Id', full_name='DynStacking.RollingMill.DataModel.CraneMove.Id', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Type', full_name='DynStacking.RollingMill.DataModel.CraneMove.Type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='PickupLocationId', full_name='DynStacking.RollingMill.DataModel.CraneMove.PickupLocationId', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='DropoffLocationId', full_name='DynStacking.RollingMill.DataModel.CraneMove.DropoffLocationId', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Amount', full_name='DynStacking.RollingMill.DataModel.CraneMove.Amount', index=4,
-      number=7, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ReleaseTime', full_name='DynStacking.RollingMill.DataModel.CraneMove.ReleaseTime', index=5,
-      number=8, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='DueDate', full_name='DynStacking.RollingMill.DataModel.CraneMove.DueDate', index=6,
-      number=9, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='RequiredCraneId', full_name='DynStacking.RollingMill.DataModel.CraneMove.RequiredCraneId', index=7,
-      number=10, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ProtobufPredecessorIds', full_name='DynStacking.RollingMill.DataModel.CraneMove.ProtobufPredecessorIds', index=8,
-      number=11, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=b'\020\000', file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=619,
-  serialized_end=961,
-)
-
-
-_CRANESCHEDULE = _descriptor.Descriptor(
-  name='CraneSchedule',
-  full_name='DynStacking.RollingMill.DataModel.CraneSchedule',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='ScheduleNr', full_name='DynStacking.RollingMill.DataModel.CraneSchedule.ScheduleNr', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Activities', full_name='DynStacking.RollingMill.DataModel.CraneSchedule.Activities', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=963,
-  serialized_end=1076,
-)
-
-
-_CRANESCHEDULEACTIVITY = _descriptor.Descriptor(
-  name='CraneScheduleActivity',
-  full_name='DynStacking.RollingMill.DataModel.CraneScheduleActivity',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='MoveId', full_name='DynStacking.RollingMill.DataModel.CraneScheduleActivity.MoveId', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='CraneId', full_name='DynStacking.RollingMill.DataModel.CraneScheduleActivity.CraneId', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Priority', full_name='DynStacking.RollingMill.DataModel.CraneScheduleActivity.Priority', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1078,
-  serialized_end=1152,
-)
-
-
-_LOCATION = _descriptor.Descriptor(
-  name='Location',
-  full_name='DynStacking.RollingMill.DataModel.Location',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Id', full_name='DynStacking.RollingMill.DataModel.Location.Id', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='GirderPosition', full_name='DynStacking.RollingMill.DataModel.Location.GirderPosition', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='MaxHeight', full_name='DynStacking.RollingMill.DataModel.Location.MaxHeight', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Stack', full_name='DynStacking.RollingMill.DataModel.Location.Stack', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Type', full_name='DynStacking.RollingMill.DataModel.Location.Type', index=4,
-      number=5, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='MillType', full_name='DynStacking.RollingMill.DataModel.Location.MillType', index=5,
-      number=6, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1155,
-  serialized_end=1402,
-)
-
-
-_MOVEREQUEST = _descriptor.Descriptor(
-  name='MoveRequest',
-  full_name='DynStacking.RollingMill.DataModel.MoveRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Id', full_name='DynStacking.RollingMill.DataModel.MoveRequest.Id', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='TargetLocationId', full_name='DynStacking.RollingMill.DataModel.MoveRequest.TargetLocationId', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='BlockId', full_name='DynStacking.RollingMill.DataModel.MoveRequest.BlockId', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='DueDate', full_name='DynStacking.RollingMill.DataModel.MoveRequest.DueDate', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1405,
-  serialized_end=1536,
-)
-
-
-_PERFORMANCE = _descriptor.Descriptor(
-  name='Performance',
-  full_name='DynStacking.RollingMill.DataModel.Performance',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='CraneManipulations', full_name='DynStacking.RollingMill.DataModel.Performance.CraneManipulations', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ServiceLevelMean', full_name='DynStacking.RollingMill.DataModel.Performance.ServiceLevelMean', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='LeadTimeMean', full_name='DynStacking.RollingMill.DataModel.Performance.LeadTimeMean', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='DeliveredBlocks', full_name='DynStacking.RollingMill.DataModel.Performance.DeliveredBlocks', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='TotalBlocksOnTime', full_name='DynStacking.RollingMill.DataModel.Performance.TotalBlocksOnTime', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='TardinessMean', full_name='DynStacking.RollingMill.DataModel.Performance.TardinessMean', index=5,
-      number=6, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ShuffleBufferUtilizationMean', full_name='DynStacking.RollingMill.DataModel.Performance.ShuffleBufferUtilizationMean', index=6,
-      number=7, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='SortedBufferUtilizationMean', full_name='DynStacking.RollingMill.DataModel.Performance.SortedBufferUtilizationMean', index=7,
-      number=8, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ShuffleCraneUtilizationMean', full_name='DynStacking.RollingMill.DataModel.Performance.ShuffleCraneUtilizationMean', index=8,
-      number=9, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='HandoverCraneUtilizationMean', full_name='DynStacking.RollingMill.DataModel.Performance.HandoverCraneUtilizationMean', index=9,
-      number=10, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='MillAUtilizationMean', full_name='DynStacking.RollingMill.DataModel.Performance.MillAUtilizationMean', index=10,
-      number=11, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='MillBUtilizationMean', full_name='DynStacking.RollingMill.DataModel.Performance.MillBUtilizationMean', index=11,
-      number=12, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='RollingProgramMessups', full_name='DynStacking.RollingMill.DataModel.Performance.RollingProgramMessups', index=12,
-      number=13, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='BlockedMillTime', full_name='DynStacking.RollingMill.DataModel.Performance.BlockedMillTime', index=13,
-      number=14, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1539,
-  serialized_end=1969,
-)
-
-
-_PLANNEDCRANEMOVES = _descriptor.Descriptor(
-  name='PlannedCraneMoves',
-  full_name='DynStacking.RollingMill.DataModel.PlannedCraneMoves',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='SequenceNr', full_name='DynStacking.RollingMill.DataModel.PlannedCraneMoves.SequenceNr', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Moves', full_name='DynStacking.RollingMill.DataModel.PlannedCraneMoves.Moves', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1971,
-  serialized_end=2071,
-)
-
-
-_STACK = _descriptor.Descriptor(
-  name='Stack',
-  full_name='DynStacking.RollingMill.DataModel.Stack',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='BottomToTop', full_name='DynStacking.RollingMill.DataModel.Stack.BottomToTop', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2073,
-  serialized_end=2143,
-)
-
-
-_TIMESTAMP = _descriptor.Descriptor(
-  name='TimeStamp',
-  full_name='DynStacking.RollingMill.DataModel.TimeStamp',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='MilliSeconds', full_name='DynStacking.RollingMill.DataModel.TimeStamp.MilliSeconds', index=0,
-      number=1, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2145,
-  serialized_end=2178,
-)
-
-
-_UNCERTAINTIES = _descriptor.Descriptor(
-  name='Uncertainties',
-  full_name='DynStacking.RollingMill.DataModel.Uncertainties',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='ArrivalIntervals', full_name='DynStacking.RollingMill.DataModel.Uncertainties.ArrivalIntervals', index=0,
-      number=1, type=1, cpp_type=5, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=b'\020\000', file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='CraneMoveTimes', full_name='DynStacking.RollingMill.DataModel.Uncertainties.CraneMoveTimes', index=1,
-      number=2, type=1, cpp_type=5, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=b'\020\000', file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='MillBlockIntervals', full_name='DynStacking.RollingMill.DataModel.Uncertainties.MillBlockIntervals', index=2,
-      number=3, type=1, cpp_type=5, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=b'\020\000', file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2180,
-  serialized_end=2285,
-)
-
-
-_WORLD = _descriptor.Descriptor(
-  name='World',
-  full_name='DynStacking.RollingMill.DataModel.World',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='Now', full_name='DynStacking.RollingMill.DataModel.World.Now', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Height', full_name='DynStacking.RollingMill.DataModel.World.Height', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Width', full_name='DynStacking.RollingMill.DataModel.World.Width', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='Locations', full_name='DynStacking.RollingMill.DataModel.World.Locations', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='BlocksAtSlabYard', full_name='DynStacking.RollingMill.DataModel.World.BlocksAtSlabYard', index=4,
-      number=5, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ArrivalsFromSlabYard', full_name='DynStacking.RollingMill.DataModel.World.ArrivalsFromSlabYard', index=5,
-      number=6, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='CraneMoves', full_name='DynStacking.RollingMill.DataModel.World.CraneMoves', index=6,
-      number=7, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='MoveRequests', full_name='DynStacking.RollingMill.DataModel.World.MoveRequests', index=7,
-      number=8, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='CraneSchedule', full_name='DynStacking.RollingMill.DataModel.World.CraneSchedule', index=8,
-      number=9, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ShuffleCrane', full_name='DynStacking.RollingMill.DataModel.World.ShuffleCrane', index=9,
-      number=10, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='HandoverCrane', full_name='DynStacking.RollingMill.DataModel.World.HandoverCrane', index=10,
-      number=11, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='KPIs', full_name='DynStacking.RollingMill.DataModel.World.KPIs', index=11,
-      number=12, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ObservationData', full_name='DynStacking.RollingMill.DataModel.World.ObservationData', index=12,
-      number=13, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2288,
-  serialized_end=3074,
-)
-
-_ARRIVAL.fields_by_name['Load'].message_type = _STACK
-_ARRIVAL.fields_by_name['ArrivalEstimate'].message_type = _TIMESTAMP
-_BLOCK.fields_by_name['Type'].enum_type = _MILLTYPES
-_BLOCK.fields_by_name['Arrived'].message_type = _TIMESTAMP
-_CRANE.fields_by_name['Load'].message_type = _STACK
-_CRANEMOVE.fields_by_name['Type'].enum_type = _MOVETYPE
-_CRANEMOVE.fields_by_name['ReleaseTime'].message_type = _TIMESTAMP
-_CRANEMOVE.fields_by_name['DueDate'].message_type = _TIMESTAMP
-_CRANESCHEDULE.fields_by_name['Activities'].message_type = _CRANESCHEDULEACTIVITY
-_LOCATION.fields_by_name['Stack'].message_type = _STACK
-_LOCATION.fields_by_name['Type'].enum_type = _STACKTYPES
-_LOCATION.fields_by_name['MillType'].enum_type = _MILLTYPES
-_MOVEREQUEST.fields_by_name['DueDate'].message_type = _TIMESTAMP
-_PLANNEDCRANEMOVES.fields_by_name['Moves'].message_type = _CRANEMOVE
-_STACK.fields_by_name['BottomToTop'].message_type = _BLOCK
-_WORLD.fields_by_name['Now'].message_type = _TIMESTAMP
-_WORLD.fields_by_name['Locations'].message_type = _LOCATION
-_WORLD.fields_by_name['BlocksAtSlabYard'].message_type = _BLOCK
-_WORLD.fields_by_name['ArrivalsFromSlabYard'].message_type = _ARRIVAL
-_WORLD.fields_by_name['CraneMoves'].message_type = _PLANNEDCRANEMOVES
-_WORLD.fields_by_name['MoveRequests'].message_type = _MOVEREQUEST
-_WORLD.fields_by_name['CraneSchedule'].message_type = _CRANESCHEDULE
-_WORLD.fields_by_name['ShuffleCrane'].message_type = _CRANE
-_WORLD.fields_by_name['HandoverCrane'].message_type = _CRANE
-_WORLD.fields_by_name['KPIs'].message_type = _PERFORMANCE
-_WORLD.fields_by_name['ObservationData'].message_type = _UNCERTAINTIES
-DESCRIPTOR.message_types_by_name['Arrival'] = _ARRIVAL
-DESCRIPTOR.message_types_by_name['Block'] = _BLOCK
-DESCRIPTOR.message_types_by_name['Crane'] = _CRANE
-DESCRIPTOR.message_types_by_name['CraneMove'] = _CRANEMOVE
-DESCRIPTOR.message_types_by_name['CraneSchedule'] = _CRANESCHEDULE
-DESCRIPTOR.message_types_by_name['CraneScheduleActivity'] = _CRANESCHEDULEACTIVITY
-DESCRIPTOR.message_types_by_name['Location'] = _LOCATION
-DESCRIPTOR.message_types_by_name['MoveRequest'] = _MOVEREQUEST
-DESCRIPTOR.message_types_by_name['Performance'] = _PERFORMANCE
-DESCRIPTOR.message_types_by_name['PlannedCraneMoves'] = _PLANNEDCRANEMOVES
-DESCRIPTOR.message_types_by_name['Stack'] = _STACK
-DESCRIPTOR.message_types_by_name['TimeStamp'] = _TIMESTAMP
-DESCRIPTOR.message_types_by_name['Uncertainties'] = _UNCERTAINTIES
-DESCRIPTOR.message_types_by_name['World'] = _WORLD
-DESCRIPTOR.enum_types_by_name['MillTypes'] = _MILLTYPES
-DESCRIPTOR.enum_types_by_name['MoveType'] = _MOVETYPE
-DESCRIPTOR.enum_types_by_name['StackTypes'] = _STACKTYPES
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-Arrival = _reflection.GeneratedProtocolMessageType('Arrival', (_message.Message,), {
-  'DESCRIPTOR' : _ARRIVAL,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.Arrival)
-  })
-_sym_db.RegisterMessage(Arrival)
-
-Block = _reflection.GeneratedProtocolMessageType('Block', (_message.Message,), {
-  'DESCRIPTOR' : _BLOCK,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.Block)
-  })
-_sym_db.RegisterMessage(Block)
-
-Crane = _reflection.GeneratedProtocolMessageType('Crane', (_message.Message,), {
-  'DESCRIPTOR' : _CRANE,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.Crane)
-  })
-_sym_db.RegisterMessage(Crane)
-
-CraneMove = _reflection.GeneratedProtocolMessageType('CraneMove', (_message.Message,), {
-  'DESCRIPTOR' : _CRANEMOVE,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.CraneMove)
-  })
-_sym_db.RegisterMessage(CraneMove)
-
-CraneSchedule = _reflection.GeneratedProtocolMessageType('CraneSchedule', (_message.Message,), {
-  'DESCRIPTOR' : _CRANESCHEDULE,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.CraneSchedule)
-  })
-_sym_db.RegisterMessage(CraneSchedule)
-
-CraneScheduleActivity = _reflection.GeneratedProtocolMessageType('CraneScheduleActivity', (_message.Message,), {
-  'DESCRIPTOR' : _CRANESCHEDULEACTIVITY,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.CraneScheduleActivity)
-  })
-_sym_db.RegisterMessage(CraneScheduleActivity)
-
-Location = _reflection.GeneratedProtocolMessageType('Location', (_message.Message,), {
-  'DESCRIPTOR' : _LOCATION,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.Location)
-  })
-_sym_db.RegisterMessage(Location)
-
-MoveRequest = _reflection.GeneratedProtocolMessageType('MoveRequest', (_message.Message,), {
-  'DESCRIPTOR' : _MOVEREQUEST,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.MoveRequest)
-  })
-_sym_db.RegisterMessage(MoveRequest)
-
-Performance = _reflection.GeneratedProtocolMessageType('Performance', (_message.Message,), {
-  'DESCRIPTOR' : _PERFORMANCE,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.Performance)
-  })
-_sym_db.RegisterMessage(Performance)
-
-PlannedCraneMoves = _reflection.GeneratedProtocolMessageType('PlannedCraneMoves', (_message.Message,), {
-  'DESCRIPTOR' : _PLANNEDCRANEMOVES,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.PlannedCraneMoves)
-  })
-_sym_db.RegisterMessage(PlannedCraneMoves)
-
-Stack = _reflection.GeneratedProtocolMessageType('Stack', (_message.Message,), {
-  'DESCRIPTOR' : _STACK,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.Stack)
-  })
-_sym_db.RegisterMessage(Stack)
-
-TimeStamp = _reflection.GeneratedProtocolMessageType('TimeStamp', (_message.Message,), {
-  'DESCRIPTOR' : _TIMESTAMP,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.TimeStamp)
-  })
-_sym_db.RegisterMessage(TimeStamp)
-
-Uncertainties = _reflection.GeneratedProtocolMessageType('Uncertainties', (_message.Message,), {
-  'DESCRIPTOR' : _UNCERTAINTIES,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.Uncertainties)
-  })
-_sym_db.RegisterMessage(Uncertainties)
-
-World = _reflection.GeneratedProtocolMessageType('World', (_message.Message,), {
-  'DESCRIPTOR' : _WORLD,
-  '__module__' : 'rollingmill_model_pb2'
-  # @@protoc_insertion_point(class_scope:DynStacking.RollingMill.DataModel.World)
-  })
-_sym_db.RegisterMessage(World)
-
-
-_CRANEMOVE.fields_by_name['ProtobufPredecessorIds']._options = None
-_UNCERTAINTIES.fields_by_name['ArrivalIntervals']._options = None
-_UNCERTAINTIES.fields_by_name['CraneMoveTimes']._options = None
-_UNCERTAINTIES.fields_by_name['MillBlockIntervals']._options = None
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17rollingmill_model.proto\x12!DynStacking.RollingMill.DataModel\"\x99\x01\n\x07\x41rrival\x12\x0f\n\x07Vehicle\x18\x01 \x01(\x05\x12\x36\n\x04Load\x18\x02 \x01(\x0b\x32(.DynStacking.RollingMill.DataModel.Stack\x12\x45\n\x0f\x41rrivalEstimate\x18\x03 \x01(\x0b\x32,.DynStacking.RollingMill.DataModel.TimeStamp\"\xc3\x01\n\x05\x42lock\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x10\n\x08Sequence\x18\x02 \x01(\x05\x12:\n\x04Type\x18\x03 \x01(\x0e\x32,.DynStacking.RollingMill.DataModel.MillTypes\x12\x11\n\tProgramId\x18\x04 \x01(\x05\x12=\n\x07\x41rrived\x18\x05 \x01(\x0b\x32,.DynStacking.RollingMill.DataModel.TimeStamp\x12\x0e\n\x06Rolled\x18\x06 \x01(\x08\"\xc7\x01\n\x05\x43rane\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x36\n\x04Load\x18\x02 \x01(\x0b\x32(.DynStacking.RollingMill.DataModel.Stack\x12\x16\n\x0eGirderPosition\x18\x03 \x01(\x01\x12\x12\n\nHoistLevel\x18\x04 \x01(\x01\x12\x15\n\rCraneCapacity\x18\x05 \x01(\x05\x12\r\n\x05Width\x18\x06 \x01(\x01\x12\x13\n\x0bMinPosition\x18\x07 \x01(\x01\x12\x13\n\x0bMaxPosition\x18\x08 \x01(\x01\"\xd6\x02\n\tCraneMove\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x39\n\x04Type\x18\x02 \x01(\x0e\x32+.DynStacking.RollingMill.DataModel.MoveType\x12\x18\n\x10PickupLocationId\x18\x03 \x01(\x05\x12\x19\n\x11\x44ropoffLocationId\x18\x04 \x01(\x05\x12\x0e\n\x06\x41mount\x18\x07 \x01(\x05\x12\x41\n\x0bReleaseTime\x18\x08 \x01(\x0b\x32,.DynStacking.RollingMill.DataModel.TimeStamp\x12=\n\x07\x44ueDate\x18\t \x01(\x0b\x32,.DynStacking.RollingMill.DataModel.TimeStamp\x12\x17\n\x0fRequiredCraneId\x18\n \x01(\x05\x12\"\n\x16ProtobufPredecessorIds\x18\x0b \x03(\x05\x42\x02\x10\x00\"q\n\rCraneSchedule\x12\x12\n\nScheduleNr\x18\x01 \x01(\x05\x12L\n\nActivities\x18\x02 \x03(\x0b\x32\x38.DynStacking.RollingMill.DataModel.CraneScheduleActivity\"J\n\x15\x43raneScheduleActivity\x12\x0e\n\x06MoveId\x18\x01 \x01(\x05\x12\x0f\n\x07\x43raneId\x18\x02 \x01(\x05\x12\x10\n\x08Priority\x18\x03 \x01(\x05\"\xf7\x01\n\x08Location\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x16\n\x0eGirderPosition\x18\x02 \x01(\x01\x12\x11\n\tMaxHeight\x18\x03 \x01(\x05\x12\x37\n\x05Stack\x18\x04 \x01(\x0b\x32(.DynStacking.RollingMill.DataModel.Stack\x12;\n\x04Type\x18\x05 \x01(\x0e\x32-.DynStacking.RollingMill.DataModel.StackTypes\x12>\n\x08MillType\x18\x06 \x01(\x0e\x32,.DynStacking.RollingMill.DataModel.MillTypes\"\x83\x01\n\x0bMoveRequest\x12\n\n\x02Id\x18\x01 \x01(\x05\x12\x18\n\x10TargetLocationId\x18\x02 \x01(\x05\x12\x0f\n\x07\x42lockId\x18\x03 \x01(\x05\x12=\n\x07\x44ueDate\x18\x04 \x01(\x0b\x32,.DynStacking.RollingMill.DataModel.TimeStamp\"\xae\x03\n\x0bPerformance\x12\x1a\n\x12\x43raneManipulations\x18\x01 \x01(\x05\x12\x18\n\x10ServiceLevelMean\x18\x02 \x01(\x01\x12\x14\n\x0cLeadTimeMean\x18\x03 \x01(\x01\x12\x17\n\x0f\x44\x65liveredBlocks\x18\x04 \x01(\x05\x12\x19\n\x11TotalBlocksOnTime\x18\x05 \x01(\x05\x12\x15\n\rTardinessMean\x18\x06 \x01(\x01\x12$\n\x1cShuffleBufferUtilizationMean\x18\x07 \x01(\x01\x12#\n\x1bSortedBufferUtilizationMean\x18\x08 \x01(\x01\x12#\n\x1bShuffleCraneUtilizationMean\x18\t \x01(\x01\x12$\n\x1cHandoverCraneUtilizationMean\x18\n \x01(\x01\x12\x1c\n\x14MillAUtilizationMean\x18\x0b \x01(\x01\x12\x1c\n\x14MillBUtilizationMean\x18\x0c \x01(\x01\x12\x1d\n\x15RollingProgramMessups\x18\r \x01(\x05\x12\x17\n\x0f\x42lockedMillTime\x18\x0e \x01(\x01\"d\n\x11PlannedCraneMoves\x12\x12\n\nSequenceNr\x18\x01 \x01(\x05\x12;\n\x05Moves\x18\x02 \x03(\x0b\x32,.DynStacking.RollingMill.DataModel.CraneMove\"F\n\x05Stack\x12=\n\x0b\x42ottomToTop\x18\x01 \x03(\x0b\x32(.DynStacking.RollingMill.DataModel.Block\"!\n\tTimeStamp\x12\x14\n\x0cMilliSeconds\x18\x01 \x01(\x03\"i\n\rUncertainties\x12\x1c\n\x10\x41rrivalIntervals\x18\x01 \x03(\x01\x42\x02\x10\x00\x12\x1a\n\x0e\x43raneMoveTimes\x18\x02 \x03(\x01\x42\x02\x10\x00\x12\x1e\n\x12MillBlockIntervals\x18\x03 \x03(\x01\x42\x02\x10\x00\"\x92\x06\n\x05World\x12\x39\n\x03Now\x18\x01 \x01(\x0b\x32,.DynStacking.RollingMill.DataModel.TimeStamp\x12\x0e\n\x06Height\x18\x02 \x01(\x05\x12\r\n\x05Width\x18\x03 \x01(\x01\x12>\n\tLocations\x18\x04 \x03(\x0b\x32+.DynStacking.RollingMill.DataModel.Location\x12\x42\n\x10\x42locksAtSlabYard\x18\x05 \x03(\x0b\x32(.DynStacking.RollingMill.DataModel.Block\x12H\n\x14\x41rrivalsFromSlabYard\x18\x06 \x03(\x0b\x32*.DynStacking.RollingMill.DataModel.Arrival\x12H\n\nCraneMoves\x18\x07 \x01(\x0b\x32\x34.DynStacking.RollingMill.DataModel.PlannedCraneMoves\x12\x44\n\x0cMoveRequests\x18\x08 \x03(\x0b\x32..DynStacking.RollingMill.DataModel.MoveRequest\x12G\n\rCraneSchedule\x18\t \x01(\x0b\x32\x30.DynStacking.RollingMill.DataModel.CraneSchedule\x12>\n\x0cShuffleCrane\x18\n \x01(\x0b\x32(.DynStacking.RollingMill.DataModel.Crane\x12?\n\rHandoverCrane\x18\x0b \x01(\x0b\x32(.DynStacking.RollingMill.DataModel.Crane\x12<\n\x04KPIs\x18\x0c \x01(\x0b\x32..DynStacking.RollingMill.DataModel.Performance\x12I\n\x0fObservationData\x18\r \x01(\x0b\x32\x30.DynStacking.RollingMill.DataModel.Uncertainties*\x19\n\tMillTypes\x12\x05\n\x01\x41\x10\x00\x12\x05\n\x01\x42\x10\x01*2\n\x08MoveType\x12\x10\n\x0cMoveToPickup\x10\x00\x12\x14\n\x10PickupAndDropoff\x10\x01*V\n\nStackTypes\x12\x10\n\x0c\x41rrivalStack\x10\x00\x12\x11\n\rShuffleBuffer\x10\x01\x12\x10\n\x0cSortedBuffer\x10\x02\x12\x11\n\rHandoverStack\x10\x03\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'rollingmill_model_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _CRANEMOVE.fields_by_name['ProtobufPredecessorIds']._options = None
+  _CRANEMOVE.fields_by_name['ProtobufPredecessorIds']._serialized_options = b'\020\000'
+  _UNCERTAINTIES.fields_by_name['ArrivalIntervals']._options = None
+  _UNCERTAINTIES.fields_by_name['ArrivalIntervals']._serialized_options = b'\020\000'
+  _UNCERTAINTIES.fields_by_name['CraneMoveTimes']._options = None
+  _UNCERTAINTIES.fields_by_name['CraneMoveTimes']._serialized_options = b'\020\000'
+  _UNCERTAINTIES.fields_by_name['MillBlockIntervals']._options = None
+  _UNCERTAINTIES.fields_by_name['MillBlockIntervals']._serialized_options = b'\020\000'
+  _MILLTYPES._serialized_start=3076
+  _MILLTYPES._serialized_end=3101
+  _MOVETYPE._serialized_start=3103
+  _MOVETYPE._serialized_end=3153
+  _STACKTYPES._serialized_start=3155
+  _STACKTYPES._serialized_end=3241
+  _ARRIVAL._serialized_start=63
+  _ARRIVAL._serialized_end=216
+  _BLOCK._serialized_start=219
+  _BLOCK._serialized_end=414
+  _CRANE._serialized_start=417
+  _CRANE._serialized_end=616
+  _CRANEMOVE._serialized_start=619
+  _CRANEMOVE._serialized_end=961
+  _CRANESCHEDULE._serialized_start=963
+  _CRANESCHEDULE._serialized_end=1076
+  _CRANESCHEDULEACTIVITY._serialized_start=1078
+  _CRANESCHEDULEACTIVITY._serialized_end=1152
+  _LOCATION._serialized_start=1155
+  _LOCATION._serialized_end=1402
+  _MOVEREQUEST._serialized_start=1405
+  _MOVEREQUEST._serialized_end=1536
+  _PERFORMANCE._serialized_start=1539
+  _PERFORMANCE._serialized_end=1969
+  _PLANNEDCRANEMOVES._serialized_start=1971
+  _PLANNEDCRANEMOVES._serialized_end=2071
+  _STACK._serialized_start=2073
+  _STACK._serialized_end=2143
+  _TIMESTAMP._serialized_start=2145
+  _TIMESTAMP._serialized_end=2178
+  _UNCERTAINTIES._serialized_start=2180
+  _UNCERTAINTIES._serialized_end=2285
+  _WORLD._serialized_start=2288
+  _WORLD._serialized_end=3074
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,120 @@
+from rollingmill.lookahead import Yard
+
+def schedule_moves(world, plan, columns):
+    # Orders the released moves of both cranes, those still pending in the
+    # world and the new ones of `plan`, and returns the order as (move id,
+    # crane id) pairs. The rolling mill simulation only takes
+    # PlannedCraneMoves from the policy, so the order is written into the
+    # moves of `plan`: each gets its crane and, as predecessors, the move
+    # before it on the same crane and the move of the other crane it has to
+    # wait for.
+    yard = Yard(world, columns)
+    heights = columns.heights.tolist()
+    index = {location_id: i for (i, location_id) in enumerate(columns.location_ids.tolist())}
+    cranes = (world.HandoverCrane, world.ShuffleCrane)
+    crane_index = {crane.Id: c for (c, crane) in enumerate(cranes)}
+    renumber(plan, max((mov.Id for mov in world.CraneMoves.Moves), default=0))
+
+    # The moves the simulation already assigned to a crane come first. The
+    # other pending moves are dropped by the simulation when it gets `plan`.
+    assigned = {}
+    for activity in sorted(world.CraneSchedule.Activities, key=lambda activity: activity.Priority):
+        assigned.setdefault(activity.MoveId, activity.CraneId)
+    pending = {mov.Id: mov for mov in world.CraneMoves.Moves}
+    moves = [pending[id] for id in assigned if id in pending] + list(plan.Moves)
+    queues = ([], [])
+    for mov in moves:
+        if mov.PickupLocationId not in index or mov.DropoffLocationId not in index:
+            continue
+        (src, tgt) = (index[mov.PickupLocationId], index[mov.DropoffLocationId])
+        crane_id = assigned.get(mov.Id) or mov.RequiredCraneId or nearest_crane(cranes, yard, src, tgt)
+        if crane_id in crane_index:
+            queues[crane_index[crane_id]].append((mov, src, tgt))
+
+    # Both cranes take their moves in order. When the next moves of the two
+    # cranes come too close, the one that lets both finish earlier goes first.
+    timeline = Timeline(yard, cranes, heights)
+    while queues[0] or queues[1]:
+        if not queues[0] or not queues[1]:
+            c = 0 if queues[0] else 1
+        else:
+            c = min((0, 1), key=lambda c: timeline.makespan(queues[c][0], c, queues[1 - c][0], 1 - c))
+        timeline.place(*queues[c].pop(0), c)
+
+    ours = {mov.Id for mov in plan.Moves}
+    for (mov, c) in timeline.order:
+        if mov.Id in ours:
+            mov.RequiredCraneId = cranes[c].Id
+            del mov.ProtobufPredecessorIds[:]
+            mov.ProtobufPredecessorIds.extend(sorted(timeline.after[mov.Id]))
+    return [(mov.Id, cranes[c].Id) for (mov, c) in timeline.order]
+
+def renumber(plan, last_id):
+    # The simulation ignores new moves with the id of a pending one, the
+    # moves of `plan` get ids above all of them.
+    ids = {}
+    for mov in plan.Moves:
+        ids[mov.Id] = last_id + len(ids) + 1
+        mov.Id = ids[mov.Id]
+    for mov in plan.Moves:
+        predecessors = [ids.get(id, id) for id in mov.ProtobufPredecessorIds]
+        del mov.ProtobufPredecessorIds[:]
+        mov.ProtobufPredecessorIds.extend(predecessors)
+
+def nearest_crane(cranes, yard, src, tgt):
+    # like the crane assignment of the simulation: the nearest crane that
+    # reaches both locations
+    (pickup, dropoff) = (yard.girder[src], yard.girder[tgt])
+    reaching = [crane for crane in cranes
+        if crane.MaxPosition <= crane.MinPosition or crane.MinPosition <= min(pickup, dropoff) <= max(pickup, dropoff) <= crane.MaxPosition]
+    if not reaching:
+        return None
+    return min(reaching, key=lambda crane: abs(crane.GirderPosition - pickup) + abs(crane.GirderPosition - dropoff)).Id
+
+class Timeline:
+    # Start and end of the scheduled moves of both cranes, in seconds.
+    def __init__(self, yard, cranes, heights):
+        self.yard = yard
+        self.heights = heights
+        self.position = [crane.GirderPosition for crane in cranes]
+        self.free = [yard.now, yard.now]
+        self.gap = sum(yard.crane_width) / 2
+        # id, girder range and end of the last move of each crane
+        self.last = [None, None]
+        self.order = []
+        self.after = {}
+
+    def times(self, mov, src, tgt, c):
+        # start and end of a move if it were placed next on crane `c`, and
+        # the move of the other crane it would have to wait for
+        start = max(self.free[c], mov.ReleaseTime.MilliSeconds / 1000)
+        span = self.yard.span(self.position[c], (src, tgt))
+        other = self.last[1 - c]
+        waits = None
+        if other is not None and other[2] > start and span[0] - self.gap < other[1][1] and other[1][0] - self.gap < span[1]:
+            (start, waits) = (other[2], other[0])
+        end = start + self.yard.duration(self.position[c], src, tgt, self.heights[src], self.heights[tgt])
+        return (start, end, span, waits)
+
+    def makespan(self, first, c, second, d):
+        # end of both moves if `first` goes on crane `c` before `second` on `d`
+        (_, first_end, first_span, _) = self.times(*first, c)
+        (start, second_end, second_span, _) = self.times(*second, d)
+        if first_end > start and second_span[0] - self.gap < first_span[1] and first_span[0] - self.gap < second_span[1]:
+            second_end += first_end - start
+        return max(first_end, second_end)
+
+    def place(self, mov, src, tgt, c):
+        (start, end, span, waits) = self.times(mov, src, tgt, c)
+        after = set()
+        if self.last[c] is not None:
+            after.add(self.last[c][0])
+        if waits is not None:
+            after.add(waits)
+        self.after[mov.Id] = after
+        self.order.append((mov, c))
+        self.last[c] = (mov.Id, span, end)
+        self.free[c] = end
+        self.position[c] = self.yard.girder[tgt]
+        self.heights[src] -= mov.Amount
+        self.heights[tgt] += mov.Amount
@@ -0,0 +1,65 @@
+import argparse
+import json
+import os
+import time
+
+import logs
+import pbview
+import stacking
+import hotstorage
+from hotstorage.model import YardModel
+from hotstorage.simulation import HotstorageSimulation, load_settings
+from hotstorage.batch import BatchSimulation, KPIS
+from telemetry import TickTimer
+
+# Runs the hotstorage planners against the local simulation in virtual time
+# and writes the final KPIs of every run as one JSON line.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python simulate.py")
+    parser.add_argument("settings", nargs="+", help="hotstorage settings files, e.g. ../../simulation/settings/HS/GECCO2021/*.buf")
+    parser.add_argument("--seeds", type=int, default=1, metavar="N", help="runs per settings file, seeded with Seed, Seed + 1, ...")
+    parser.add_argument("--duration", type=float, metavar="S", help="simulated seconds per run instead of the SimulationDuration of the settings")
+    parser.add_argument("--batch", type=int, metavar="N", help="run N episodes per settings file at once in the batch simulation with the batched rule based planner")
+    stacking.add_planner_arguments(parser)
+    parser.add_argument("--log-level", default="WARNING", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+    parser.set_defaults(problem="HS", late_share=0.8, stats_file=None)
+    args = parser.parse_args()
+    stacking.check_planner_arguments(parser, args)
+    logs.configure(args.log_level)
+    pbview.check_backend(False)
+
+    # one client for all runs, a ParallelSearch engine starts its worker
+    # pool only once
+    client = stacking.Client(args)
+    (simulated, used) = (0.0, 0.0)
+    for path in args.settings:
+        settings = load_settings(path)
+        if args.batch:
+            batch = BatchSimulation(settings, args.batch)
+            start = time.process_time()
+            kpis = batch.run(duration=args.duration)
+            elapsed = time.process_time() - start
+            simulated += batch.now * args.batch
+            used += elapsed
+            for i in range(args.batch):
+                record = {"settings": os.path.basename(path), "episode": i, "cpu_s": round(elapsed / args.batch, 3)}
+                record.update((name, kpis[name][i].item()) for name in KPIS)
+                print(json.dumps(record), flush=True)
+            continue
+        for seed in range(settings.Seed, settings.Seed + args.seeds):
+            # every run starts without the yard of the previous one
+            hotstorage.model = YardModel()
+            (client.interval, client.timer) = (stacking.UpdateInterval(), TickTimer())
+            sim = HotstorageSimulation(settings, client.plan, seed)
+            start = time.process_time()
+            kpis = sim.run(args.duration)
+            elapsed = time.process_time() - start
+            simulated += sim.now
+            used += elapsed
+            record = {"settings": os.path.basename(path), "seed": seed, "cpu_s": round(elapsed, 3)}
+            record.update((field.name, getattr(kpis, field.name)) for field in kpis.DESCRIPTOR.fields)
+            print(json.dumps(record), flush=True)
+    if hasattr(client.engine, "close"):
+        client.engine.close()
+    if used > 0:
+        stacking.log.warning("%.0f simulated hours per CPU hour", simulated / used)
@@ -1,45 +1,190 @@
-import zmq
+import argparse
+import asyncio
+import logging
+import signal
 import sys
+import time
+import zmq
 
 import hotstorage;
 import rollingmill;
+import async_client
+import logs
+import pbview
+from telemetry import TickTimer
+from hotstorage.parallel import ParallelSearch
+from hotstorage.beam import BeamSearch, SCORES
+from hotstorage.rollout import RolloutPlanner, OBJECTIVES
+from rollingmill.lookahead import LookaheadPlanner
 
-if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("""USAGE:
-        python dynstack ADDR ID PROBLEM""")
-        exit(1)
-    if len(sys.argv) == 4:
-        print("rule based stacking")
-        [_, addr, id, problem] = sys.argv
-        use_heuristic = True
-        is_rollingmill = problem=="RM"
-    else:
-        [_, addr, id, problem, _] = sys.argv
-        print("model based stacking")
-        use_heuristic = False
-        is_rollingmill = problem=="RM"
-    
+log = logging.getLogger("stacking")
+
+class UpdateInterval:
+    # Smoothed wall clock time between two consecutive world updates.
+    def __init__(self, alpha=0.2):
+        self.alpha = alpha
+        self.last = None
+        self.mean = None
+
+    def tick(self):
+        now = time.perf_counter()
+        if self.last is not None:
+            dt = now - self.last
+            self.mean = dt if self.mean is None else self.mean + self.alpha * (dt - self.mean)
+        self.last = now
+
+    def deadline_ms(self, share):
+        if self.mean is None:
+            return None
+        return self.mean * share * 1000
+
+class Client:
+    # Everything that is kept between two world updates: the planner setup,
+    # the measured update interval and the tick statistics.
+    def __init__(self, args):
+        self.args = args
+        self.is_rollingmill = args.problem=="RM"
+        self.use_heuristic = not (args.modelbased or args.search != "dfs" or args.workers or args.deadline is not None or args.anytime)
+        if self.use_heuristic:
+            log.info("rule based stacking")
+        else:
+            log.info("model based stacking")
+        self.engine = args.search
+        if self.is_rollingmill:
+            self.engine = None if self.use_heuristic else LookaheadPlanner(args.lookahead_width, args.lookahead_depth, args.lookahead_targets)
+        elif args.search == "beam":
+            self.engine = BeamSearch(args.beam_width, args.beam_depth, args.beam_score)
+        elif args.search == "rollout":
+            self.engine = RolloutPlanner(args.rollout_candidates, args.rollout_futures, args.rollout_horizon, args.rollout_objective)
+        elif args.workers and not self.is_rollingmill:
+            self.engine = ParallelSearch(args.workers)
+        self.interval = UpdateInterval()
+        self.timer = TickTimer()
+        self.last_dump = time.perf_counter()
+        self.late = 0
+
+    def plan(self, world_data):
+        deadline_ms = self.args.deadline
+        if deadline_ms is None and self.args.anytime:
+            deadline_ms = self.interval.deadline_ms(self.args.deadline_share)
+        if self.is_rollingmill:
+            return rollingmill.plan_moves(world_data, self.timer, self.engine, deadline_ms, self.args.crane_schedule)
+        return hotstorage.plan_moves(world_data, self.use_heuristic, deadline_ms, self.engine, self.timer)
+
+    def serialize(self, plan):
+        if plan:
+            msg = plan.SerializeToString()
+            self.timer.lap("serialize")
+            return msg
+        return b""
+
+    def end_tick(self, plan):
+        allowed = None if self.interval.mean is None else self.interval.mean * self.args.late_share
+        latency = self.timer.end(plan is not None and len(plan.Moves) > 0, allowed)
+        if self.timer.late > self.late:
+            self.late = self.timer.late
+            log.warning("planning took %.1fms of %.1fms between updates", latency * 1000, self.interval.mean * 1000)
+        logs.tick(tick=self.timer.ticks, problem=self.args.problem, seq=plan.SequenceNr if plan else None,
+            moves=len(plan.Moves) if plan else 0, latency_ms=round(latency * 1000, 3), skipped=self.timer.skipped)
+        if self.args.stats_file and self.timer.mark - self.last_dump >= self.args.stats_interval:
+            self.dump()
+
+    def dump(self):
+        if self.args.stats_file:
+            self.timer.dump(self.args.stats_file)
+            self.last_dump = self.timer.mark
+
+def drain(socket, msg, timer):
+    # Reads all messages that are already queued without blocking and keeps
+    # only the newest one, the others are counted as skipped. ZMQ_CONFLATE
+    # would do the same in the socket but does not support multipart
+    # messages.
+    while True:
+        try:
+            newer = socket.recv_multipart(zmq.NOBLOCK)
+        except zmq.Again:
+            return msg
+        timer.skipped += 1
+        msg = newer
+
+def run(client, args):
     context = zmq.Context()
     socket = context.socket(zmq.DEALER)
-    socket.setsockopt_string(zmq.IDENTITY, id)
-    socket.connect(addr)
-    print("Connected socket")
+    socket.setsockopt_string(zmq.IDENTITY, args.id)
+    socket.connect(args.addr)
+    log.info("Connected socket")
 
+    timer = client.timer
     while True:
         msg = socket.recv_multipart()
-        print("recv")
-        plan = None
-        if is_rollingmill:
-            plan = rollingmill.plan_moves(msg[2])
-        else:
-            plan = hotstorage.plan_moves(msg[2], use_heuristic)
-
+        client.interval.tick()
+        if args.drain:
+            msg = drain(socket, msg, timer)
+        timer.lap("recv")
+        log.debug("recv")
+        plan = client.plan(msg[2])
         if plan:
-            print("send")
-            msg = plan.SerializeToString()
-            socket.send_multipart([b"", b"crane", msg])
-        else:
-            socket.send_multipart([b"", b"crane", b""])
-            
+            log.debug("send")
+        socket.send_multipart([b"", b"crane", client.serialize(plan)])
+        timer.lap("send")
+        client.end_tick(plan)
+
+def add_planner_arguments(parser):
+    # The options of the planners, shared with simulate.py.
+    parser.add_argument("--modelbased", action="store_true", help="use the search based solver, for RM the lookahead planner")
+    parser.add_argument("--search", choices=["dfs", "bnb", "beam", "rollout"], default="dfs", help="search engine of the model based solver")
+    parser.add_argument("--beam-width", type=int, default=16, help="states kept per layer by --search beam")
+    parser.add_argument("--beam-depth", type=int, default=100, help="maximum number of moves planned by --search beam")
+    parser.add_argument("--beam-score", choices=sorted(SCORES), default="bound", help="state score of --search beam")
+    parser.add_argument("--rollout-candidates", type=int, default=6, help="best scored moves compared by --search rollout")
+    parser.add_argument("--rollout-futures", type=int, default=64, help="simulated futures per candidate move")
+    parser.add_argument("--rollout-horizon", type=int, default=12, help="crane moves per simulated future")
+    parser.add_argument("--rollout-objective", choices=OBJECTIVES, default="tardiness", help="expected outcome minimized by --search rollout")
+    parser.add_argument("--workers", type=int, metavar="N", help="split --search bnb over N processes")
+    parser.add_argument("--lookahead-width", type=int, default=16, help="plans kept per layer by the RM lookahead planner")
+    parser.add_argument("--lookahead-depth", type=int, default=3, help="joint moves of both cranes planned ahead by the RM lookahead planner")
+    parser.add_argument("--lookahead-targets", type=int, default=2, help="buffers tried per relocated stack top by the RM lookahead planner")
+    parser.add_argument("--crane-schedule", action="store_true", help="order the planned RM moves over both cranes with move predecessors")
+    parser.add_argument("--deadline", type=float, metavar="MS", help="time limit for the search per update")
+    parser.add_argument("--anytime", action="store_true", help="derive the search time limit from the observed update interval")
+    parser.add_argument("--deadline-share", type=float, default=0.5, help="share of the update interval used by --anytime")
+
+def check_planner_arguments(parser, args):
+    # --workers only splits the branch and bound search, other engines would
+    # silently ignore it
+    if args.workers and (args.problem != "HS" or args.search != "bnb"):
+        parser.error("--workers needs HS and --search bnb")
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python stacking.py")
+    parser.add_argument("addr")
+    parser.add_argument("id")
+    parser.add_argument("problem", choices=["HS", "RM"])
+    add_planner_arguments(parser)
+    parser.add_argument("--drain", action="store_true", help="skip queued worlds and only plan the newest one")
+    parser.add_argument("--asyncio", action="store_true", help="receive, plan and send in separate tasks and only plan the newest world")
+    parser.add_argument("--require-fast-protobuf", action="store_true", help="refuse to run with the pure Python protobuf backend")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="DEBUG also dumps every world")
+    parser.add_argument("--log-format", default="text", choices=["text", "json"])
+    parser.add_argument("--tick-log", action="store_true", help="write one record per world update")
+    parser.add_argument("--stats-file", metavar="PATH", help="write per stage latency histograms as JSON to this file")
+    parser.add_argument("--stats-interval", type=float, default=60, metavar="S", help="seconds between two writes of --stats-file")
+    parser.add_argument("--late-share", type=float, default=0.8, help="count ticks that take more than this share of the update interval")
+    args = parser.parse_args()
+    check_planner_arguments(parser, args)
+    logs.configure(args.log_level, args.log_format, args.tick_log)
+    pbview.check_backend(args.require_fast_protobuf)
+
+    client = Client(args)
+    # The simulation runner stops the solver with SIGTERM, exit through the
+    # finally clause so that the stats are written.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        if args.asyncio:
+            asyncio.run(async_client.run(client, args))
+        else:
+            run(client, args)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        client.dump()
@@ -0,0 +1,127 @@
+import json
+import os
+import time
+
+class Histogram:
+    # HDR style histogram of integer values (microseconds here). Values below
+    # 2 * SUB_BUCKETS get their own bucket, above that the bucket width
+    # doubles every SUB_BUCKETS buckets, so the relative error stays below
+    # 1 / SUB_BUCKETS for any value with a small, fixed number of buckets.
+    SUB_BITS = 5
+    SUB_BUCKETS = 1 << SUB_BITS
+
+    def __init__(self):
+        self.counts = []
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    @staticmethod
+    def bucket(value):
+        shift = value.bit_length() - Histogram.SUB_BITS - 1
+        if shift <= 0:
+            return value
+        return shift * Histogram.SUB_BUCKETS + (value >> shift)
+
+    @staticmethod
+    def lowest(bucket):
+        shift = bucket // Histogram.SUB_BUCKETS - 1
+        if shift <= 0:
+            return bucket
+        return (bucket - shift * Histogram.SUB_BUCKETS) << shift
+
+    def record(self, value):
+        value = max(0, int(value))
+        bucket = Histogram.bucket(value)
+        if bucket >= len(self.counts):
+            self.counts.extend([0] * (bucket + 1 - len(self.counts)))
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, p):
+        # lowest value of the bucket that holds the p-th percentile
+        if self.count == 0:
+            return None
+        rank = max(1, int(p / 100 * self.count + 0.5))
+        seen = 0
+        for (bucket, count) in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(max(Histogram.lowest(bucket), self.min), self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+            "max": self.max,
+            "buckets": {Histogram.lowest(bucket): count for (bucket, count) in enumerate(self.counts) if count},
+        }
+
+class TickTimer:
+    # Splits every world update into stages and keeps a latency histogram
+    # (in microseconds) per stage. lap(stage) records the time since the
+    # previous lap, so the stages of one tick add up to its total time:
+    #   recv       waiting for the next world
+    #   parse      protobuf parsing of the world
+    #   build      building the search state
+    #   plan       search or heuristic
+    #   serialize  serializing the plan
+    #   send       sending the plan
+    # "total" is everything but the receive wait.
+    STAGES = ("recv", "parse", "build", "plan", "serialize", "send", "total")
+
+    def __init__(self):
+        self.histograms = {stage: Histogram() for stage in TickTimer.STAGES}
+        self.ticks = 0
+        self.no_plan = 0
+        # ticks whose total time was above the share of the update interval
+        self.late = 0
+        # worlds that were dropped because a newer one arrived before planning
+        self.skipped = 0
+        self.mark = time.perf_counter()
+        self.started = self.mark
+
+    def lap(self, stage):
+        now = time.perf_counter()
+        self.histograms[stage].record((now - self.mark) * 1e6)
+        self.mark = now
+        if stage == "recv":
+            self.started = now
+
+    def end(self, planned, interval=None):
+        # Returns the total time of the tick in seconds. `interval` is the
+        # allowed time, if the tick took longer it is counted as late.
+        total = self.mark - self.started
+        self.histograms["total"].record(total * 1e6)
+        self.ticks += 1
+        if not planned:
+            self.no_plan += 1
+        if interval is not None and total > interval:
+            self.late += 1
+        return total
+
+    def to_dict(self):
+        return {
+            "ticks": self.ticks,
+            "no_plan": self.no_plan,
+            "late": self.late,
+            "skipped": self.skipped,
+            "stages": {stage: histogram.to_dict() for (stage, histogram) in self.histograms.items() if histogram.count},
+        }
+
+    def dump(self, path):
+        # written to a temporary file first so readers never see half a dump
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp, path)